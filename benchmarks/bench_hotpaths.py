@@ -0,0 +1,243 @@
+"""데이터 로딩 / 분석 hot path 벤치마크
+
+무신사 pkl과 같은 구조(items -> rank -> rank_meta/avg/per_row)의 합성 스냅샷을
+사이즈 행 100 / 1만 / 100만 개 규모로 만들어 단계별 시간을 잰다.
+- pickle load, build_frames(df_avg/df_long), rank_intensity
+- ease + classify_fit
+- 크롭/소매 구간 비중 (df_long 마스크 방식 vs 요약 큐브 구축/질의)
+  큐브는 0.5cm 단위 값과 연속값(0.5cm 격자에 ±0.25cm 잡음) 두 경우의 구축 시간·메모리를 잰다.
+- 브랜드 group-by (groupby.size vs brand_aggregates)
+
+    python benchmarks/bench_hotpaths.py --sizes 100 10000 1000000 --repeat 3 --out hotpaths.json
+
+결과 JSON은 실행 간 비교(회귀 확인)용으로 같은 키 구조를 유지한다.
+"""
+from pathlib import Path
+import argparse
+import json
+import pickle
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from brand_stats import brand_aggregates  # noqa: E402
+from musinsa_data import MEASURES, add_rank_intensity, build_frames  # noqa: E402
+from pipeline import CROP_THR, MID_BAND, SLEEVE_STD_BAND, TOP_K, ease_frame, length_shares, sleeve_shares  # noqa: E402
+from summary_cube import build_cube  # noqa: E402
+
+BODY_CHEST_CIRC_CM = 87.3
+
+# 측정 항목별 (평균, 표준편차) — 총장은 크롭/롱 두 봉우리
+MEASURE_DIST = {
+    "총장": [(51, 3), (72, 3)],
+    "어깨너비": [(44, 2.5)],
+    "가슴단면": [(54, 3)],
+    "소매길이": [(60.5, 1.8)],
+}
+
+
+# =========================
+# 합성 스냅샷
+# =========================
+def make_snapshot(n_rows: int, seed: int = 0) -> dict:
+    """사이즈 행이 약 n_rows개인 pkl 구조 dict (상품당 1–4개 사이즈, 값 0.5cm 단위, 결측 약 2%)"""
+    rng = np.random.default_rng(seed)
+    row_counts = rng.integers(1, 5, size=max(n_rows // 2, 1))
+    row_counts = row_counts[np.cumsum(row_counts) <= n_rows] if row_counts.sum() > n_rows else row_counts
+    n_items = len(row_counts)
+    n_brands = max(int(np.sqrt(n_items) * 3), 1)
+
+    values = {}
+    for m, modes in MEASURE_DIST.items():
+        which = rng.integers(0, len(modes), size=n_items)
+        mean = np.array([mu for mu, _ in modes])[which]
+        sd = np.array([s for _, s in modes])[which]
+        # 같은 상품의 사이즈 행은 상품 기준값 + 사이즈 단계(1–2cm)
+        step = np.concatenate([np.arange(c) for c in row_counts]) * rng.uniform(1, 2)
+        base = np.repeat(rng.normal(mean, sd), row_counts)
+        v = np.round((base + step) * 2) / 2
+        v[rng.random(len(v)) < 0.02] = np.nan
+        values[m] = v
+
+    brands = rng.integers(0, n_brands, size=n_items)
+    prices = rng.integers(3, 40, size=n_items) * 5000
+    items = {}
+    pos = 0
+    for i, count in enumerate(row_counts):
+        per_row = {}
+        for j in range(count):
+            per_row[f"row_{j + 1}"] = {
+                m: (None if np.isnan(values[m][pos + j]) else float(values[m][pos + j])) for m in MEASURES
+            }
+        pos += count
+        avg = {}
+        for m in MEASURES:
+            vals = [r[m] for r in per_row.values() if r[m] is not None]
+            avg[m] = float(np.mean(vals)) if vals else None
+        items[i + 1] = {
+            "rank_meta": {
+                "url": f"https://www.musinsa.com/products/{1_000_000 + i}",
+                "item_id": str(1_000_000 + i),
+                "brand": f"brand{brands[i]:04d}",
+                "title": "",
+                "original_price": int(prices[i]),
+            },
+            "per_row": per_row,
+            "avg": avg,
+        }
+    return {
+        "ranking_collected": n_items,
+        "ranking_missing_ranks": [],
+        "size_success_count": n_items,
+        "size_skipped_count": 0,
+        "size_fail_count": 0,
+        "items": items,
+    }
+
+
+# =========================
+# 측정
+# =========================
+def timed(fn, repeat: int):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - t)
+    return samples, result
+
+
+def summarize(samples):
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "samples": samples,
+    }
+
+
+def mask_shares(df_long, top_k: int):
+    """기존 페이지 방식: df_long 전체에 boolean mask"""
+    s = df_long["총장"].dropna()
+    s_top = df_long.loc[df_long["rank"] <= top_k, "총장"].dropna()
+    sleeve = df_long["소매길이"].dropna()
+    sleeve_top = df_long.loc[df_long["rank"] <= top_k, "소매길이"].dropna()
+    mid_low, mid_high = MID_BAND
+    std_low, std_high = SLEEVE_STD_BAND
+    return (
+        (s < CROP_THR).sum(), ((s >= mid_low) & (s <= mid_high)).sum(), (s > mid_high).sum(),
+        (s_top < CROP_THR).mean(), ((s_top >= mid_low) & (s_top <= mid_high)).mean(), (s_top > mid_high).mean(),
+        ((sleeve >= std_low) & (sleeve <= std_high)).sum(),
+        ((sleeve_top >= std_low) & (sleeve_top <= std_high)).mean(),
+    )
+
+
+def cube_shares(cube, top_k: int):
+    return (
+        length_shares(cube), length_shares(cube, top_k=top_k),
+        sleeve_shares(cube), sleeve_shares(cube, top_k=top_k),
+    )
+
+
+def bench_size(n_rows: int, repeat: int) -> dict:
+    data = make_snapshot(n_rows)
+    ops = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pkl_path = Path(tmp) / "snapshot.pkl"
+        with open(pkl_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        file_bytes = pkl_path.stat().st_size
+
+        def load():
+            with open(pkl_path, "rb") as f:
+                return pickle.load(f)
+
+        samples, _ = timed(load, repeat)
+        ops["pickle_load"] = summarize(samples)
+
+    samples, (df_avg, df_long) = timed(lambda: build_frames(data), repeat)
+    ops["build_frames"] = summarize(samples)
+
+    samples, _ = timed(lambda: (add_rank_intensity(df_avg), add_rank_intensity(df_long)), repeat)
+    ops["rank_intensity"] = summarize(samples)
+
+    samples, _ = timed(lambda: ease_frame(df_avg, BODY_CHEST_CIRC_CM), repeat)
+    ops["ease_classify_fit"] = summarize(samples)
+
+    samples, _ = timed(lambda: mask_shares(df_long, TOP_K), repeat)
+    ops["band_shares_mask"] = summarize(samples)
+
+    samples, cube = timed(lambda: build_cube(df_long), repeat)
+    ops["summary_cube_build"] = summarize(samples)
+
+    samples, _ = timed(lambda: cube_shares(cube, TOP_K), repeat)
+    ops["band_shares_cube"] = summarize(samples)
+
+    # 실측이 0.5cm 단위가 아닌 경우 (고유값 수가 행 수만큼 늘어나는 입력)
+    rng = np.random.default_rng(1)
+    continuous = df_long.assign(**{m: df_long[m] + rng.uniform(-0.25, 0.25, len(df_long)) for m in MEASURES})
+    samples, cube_continuous = timed(lambda: build_cube(continuous), repeat)
+    ops["summary_cube_build_continuous"] = summarize(samples)
+    samples, _ = timed(lambda: cube_shares(cube_continuous, TOP_K), repeat)
+    ops["band_shares_cube_continuous"] = summarize(samples)
+
+    samples, _ = timed(lambda: df_avg.groupby("brand", dropna=False).size(), repeat)
+    ops["brand_groupby_size"] = summarize(samples)
+
+    samples, _ = timed(lambda: brand_aggregates(df_avg, BODY_CHEST_CIRC_CM), repeat)
+    ops["brand_aggregates"] = summarize(samples)
+
+    return {
+        "size_rows": len(df_long),
+        "items": len(df_avg),
+        "brands": int(df_avg["brand"].nunique()),
+        "pickle_bytes": file_bytes,
+        "cube_bytes": cube.nbytes,
+        "cube_bytes_continuous": cube_continuous.nbytes,
+        "ops": ops,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 스냅샷으로 로딩/분석 hot path 시간 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 1_000_000], help="사이즈 행 개수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", type=Path, default=None, help="결과 JSON 저장 경로 (기본: stdout)")
+    args = parser.parse_args()
+
+    results = {
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "pandas": __import__("pandas").__version__,
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+        "sizes": {},
+    }
+    for n in args.sizes:
+        t = time.perf_counter()
+        res = bench_size(n, args.repeat)
+        results["sizes"][str(n)] = res
+        print(
+            f"{n:>9,} rows ({time.perf_counter() - t:.1f}s): "
+            + ", ".join(f"{op} {r['median_s'] * 1000:.1f}ms" for op, r in res["ops"].items()),
+            file=sys.stderr,
+        )
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""대시보드 시작 시간 벤치마크
+
+페이지별로 새 파이썬 프로세스를 띄워 다음 두 값을 잰다.
+- cold import : streamlit import 이후 페이지 모듈(views.*) import에 걸린 시간
+- first render: 해당 페이지를 첫 화면으로 finalproject.py를 한 번 실행하는 시간 (AppTest)
+
+    python benchmarks/bench_startup.py --repeat 5 --out startup.json
+"""
+from pathlib import Path
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from views import PAGES  # noqa: E402
+
+IMPORT_SNIPPET = """
+import time, streamlit
+t = time.perf_counter()
+import {module}
+print(time.perf_counter() - t)
+"""
+
+RENDER_SNIPPET = """
+import time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({script!r}, default_timeout=300)
+at.session_state["nav"] = {page!r}
+t = time.perf_counter()
+at.run()
+elapsed = time.perf_counter() - t
+assert not at.exception, [e.message for e in at.exception]
+print(elapsed)
+"""
+
+
+def run_snippet(code: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def summarize(samples):
+    return {
+        "median_s": statistics.median(samples),
+        "min_s": min(samples),
+        "max_s": max(samples),
+        "samples": samples,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="페이지별 cold import / first render 시간 측정")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", type=Path, default=None, help="결과 JSON 저장 경로 (기본: stdout)")
+    args = parser.parse_args()
+
+    script = str(ROOT / "finalproject.py")
+    results = {"python": sys.version.split()[0], "repeat": args.repeat, "pages": {}}
+
+    for page, module in PAGES.items():
+        imports = [run_snippet(IMPORT_SNIPPET.format(module=module)) for _ in range(args.repeat)]
+        renders = [run_snippet(RENDER_SNIPPET.format(script=script, page=page)) for _ in range(args.repeat)]
+        results["pages"][page] = {
+            "module": module,
+            "cold_import": summarize(imports),
+            "first_render": summarize(renders),
+        }
+        print(
+            f"{page}: import {statistics.median(imports) * 1000:.0f}ms, "
+            f"first render {statistics.median(renders) * 1000:.0f}ms",
+            file=sys.stderr,
+        )
+
+    text = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.out:
+        args.out.write_text(text, encoding="utf-8")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+from fit_engine import FIT_EDGES, FIT_LABELS, chest_ease, fit_codes
+from musinsa_data import MEASURES, frame_nbytes, load_columns, load_derived
+
+# =========================
+# 브랜드 단위 집계 (합칠 수 있는 충분통계)
+# =========================
+# 브랜드 한 행에 평균/표준편차 대신 개수·합·제곱합을 저장한다.
+# 두 집계를 합칠 때는 더하기(min/max는 min/max)만 하면 되므로,
+# 새 상품이 들어오면 바뀐 브랜드만 다시 계산해 이어붙일 수 있다.
+FIT_COUNT_COLUMNS = [f"fit_{i}" for i in range(len(FIT_LABELS))]
+SUM_COLUMNS = ["item_count", "rank_sum"] + \
+    [f"{m}_{s}" for m in MEASURES for s in ("n", "sum", "sumsq")] + FIT_COUNT_COLUMNS
+AGG_COLUMNS = ["brand"] + SUM_COLUMNS + ["best_rank", "price_min", "price_max"]
+
+
+def brand_aggregates(items: pd.DataFrame, body_chest_circ_cm: float = None) -> pd.DataFrame:
+    """상품 단위 프레임(df_avg 형태: brand, rank, original_price, <m>_avg)을 브랜드별로 집계
+
+    rank 컬럼이 없으면 순위 관련 값은 비워 둔다. 핏 분류는 가슴둘레 ease 기준.
+    """
+    if items.empty:
+        return pd.DataFrame(columns=AGG_COLUMNS)
+
+    work = pd.DataFrame({"brand": items["brand"].to_numpy(dtype=object), "item_count": 1})
+    rank = items["rank"].to_numpy(dtype=float) if "rank" in items else np.full(len(items), np.nan)
+    work["rank_sum"] = np.nan_to_num(rank)
+    work["best_rank"] = rank
+    price = pd.to_numeric(items["original_price"], errors="coerce").to_numpy(dtype=float)
+    work["price_min"] = price
+    work["price_max"] = price
+
+    for m in MEASURES:
+        v = items[f"{m}_avg"].to_numpy(dtype=float)
+        ok = ~np.isnan(v)
+        work[f"{m}_n"] = ok.astype(np.int64)
+        work[f"{m}_sum"] = np.where(ok, v, 0.0)
+        work[f"{m}_sumsq"] = np.where(ok, v * v, 0.0)
+
+    codes = fit_codes(chest_ease(items["가슴단면_avg"].to_numpy(dtype=float), body_chest_circ_cm), FIT_EDGES)
+    for i, col in enumerate(FIT_COUNT_COLUMNS):
+        work[col] = (codes == i).astype(np.int64)
+
+    return _reduce(work)
+
+
+def _reduce(work: pd.DataFrame) -> pd.DataFrame:
+    how = {c: "sum" for c in SUM_COLUMNS}
+    how.update(best_rank="min", price_min="min", price_max="max")
+    out = work.groupby("brand", dropna=False, sort=False).agg(how).reset_index()
+    return out[AGG_COLUMNS]
+
+
+def merge_aggregates(*aggs: pd.DataFrame) -> pd.DataFrame:
+    """서로 다른 상품 집합의 브랜드 집계를 합친다 (같은 상품이 두 번 들어가지 않아야 함)"""
+    parts = [a for a in aggs if not a.empty]
+    if not parts:
+        return pd.DataFrame(columns=AGG_COLUMNS)
+    return _reduce(pd.concat(parts, ignore_index=True))
+
+
+def update_aggregates(prev: pd.DataFrame, items: pd.DataFrame, brands,
+                      body_chest_circ_cm: float = None) -> pd.DataFrame:
+    """brands에 해당하는 브랜드만 items(현재 전체 상품)에서 다시 집계해 prev에 반영
+
+    min/max는 빼기가 안 되므로 상품이 바뀐 브랜드는 그 브랜드 상품만 다시 집계한다.
+    """
+    brands = set(brands)
+    keep = prev[~prev["brand"].isin(brands)]
+    fresh = brand_aggregates(items[items["brand"].isin(brands)], body_chest_circ_cm)
+    return merge_aggregates(keep, fresh)
+
+
+def refresh_ranks(agg: pd.DataFrame, items: pd.DataFrame) -> pd.DataFrame:
+    """순위는 매일 전 상품이 바뀌므로 순위 관련 값(rank_sum, best_rank)만 items에서 다시 채운다."""
+    ranks = items.groupby("brand", dropna=False, sort=False)["rank"].agg(["sum", "min"])
+    out = agg.copy()
+    out["rank_sum"] = out["brand"].map(ranks["sum"]).fillna(0)
+    out["best_rank"] = out["brand"].map(ranks["min"])
+    return out
+
+
+# =========================
+# 표시용 프로필
+# =========================
+def brand_profiles(agg: pd.DataFrame) -> pd.DataFrame:
+    """충분통계 -> 브랜드별 등장 횟수, 최고 순위, 가격 범위, 측정 항목별 평균/표준편차"""
+    out = pd.DataFrame({
+        "brand": agg["brand"],
+        "count": agg["item_count"].astype(int),
+        "best_rank": agg["best_rank"],
+        "mean_rank": agg["rank_sum"] / agg["item_count"],
+        "price_min": agg["price_min"],
+        "price_max": agg["price_max"],
+    })
+    for m in MEASURES:
+        n = agg[f"{m}_n"].to_numpy(dtype=float)
+        s = agg[f"{m}_sum"].to_numpy(dtype=float)
+        ss = agg[f"{m}_sumsq"].to_numpy(dtype=float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = s / n
+            var = (ss - s * mean) / (n - 1)
+        out[f"{m}_mean"] = mean
+        out[f"{m}_std"] = np.sqrt(np.clip(var, 0, None))
+    return out.sort_values(["count", "best_rank"], ascending=[False, True]).reset_index(drop=True)
+
+
+def fit_distribution(agg_row: pd.Series) -> pd.DataFrame:
+    """브랜드 한 행의 핏 분류별 상품 수"""
+    counts = agg_row[FIT_COUNT_COLUMNS].to_numpy(dtype=int)
+    return pd.DataFrame({"핏_분류(가슴둘레)": list(FIT_LABELS), "count": counts})
+
+
+# =========================
+# 스냅샷 단위 캐시
+# =========================
+ITEM_COLUMNS = ["rank", "brand", "original_price"] + [f"{m}_avg" for m in MEASURES]
+
+
+def snapshot_brand_stats(path, body_chest_circ_cm: float = None):
+    """스냅샷의 (브랜드 집계, 브랜드 프로필). 스냅샷 버전 + 인체 기준값별로 한 번만 계산"""
+    def build():
+        agg = brand_aggregates(load_columns(path, ITEM_COLUMNS), body_chest_circ_cm)
+        return agg.set_index("brand", drop=False), brand_profiles(agg)
+
+    return load_derived(
+        path,
+        f"brand_stats:{body_chest_circ_cm}",
+        build,
+        nbytes=lambda value: frame_nbytes(*value),
+    )
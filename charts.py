@@ -0,0 +1,189 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+
+# =========================
+# 렌더링 모드
+# =========================
+# all        : 모든 사이즈 행을 점으로 전송 (기존 방식)
+# downsample : 밀도 기반 다운샘플 (밀집 구간만 솎아내고 희소 구간 점은 유지)
+# kde        : 서버에서 KDE/박스 통계를 계산해 곡선만 전송 (원자료 점 없음)
+RENDER_MODES = ["auto", "all", "downsample", "kde"]
+RENDER_MODE_LABELS = {
+    "auto": "자동",
+    "all": "전체 점",
+    "downsample": "밀도 기반 다운샘플",
+    "kde": "서버 KDE (점 없음)",
+}
+
+AUTO_ALL_MAX_ROWS = 5_000  # auto 모드에서 이 이하면 전체 점
+MAX_POINTS = 3_000  # downsample 모드에서 브라우저로 보내는 최대 점 수
+
+
+def resolve_mode(mode: str, n_rows: int) -> str:
+    if mode != "auto":
+        return mode
+    return "all" if n_rows <= AUTO_ALL_MAX_ROWS else "downsample"
+
+
+# =========================
+# 밀도 기반 다운샘플
+# =========================
+def density_downsample(df: pd.DataFrame, x: str, y: str, max_points: int = MAX_POINTS,
+                       bins: int = 48, seed: int = 0) -> pd.DataFrame:
+    """(x, y) 평면을 bins×bins 격자로 나누고 칸마다 같은 상한(q)까지만 남긴다.
+
+    q는 Σ min(칸 개수, q) ≤ max_points 를 만족하는 최댓값(water-filling)이라,
+    점이 적은 칸(꼬리/이상치)은 전부 남고 밀집 칸만 줄어든다.
+    """
+    if len(df) <= max_points:
+        return df
+
+    xv = df[x].to_numpy(dtype=float)
+    yv = df[y].to_numpy(dtype=float)
+
+    def bin_of(v):
+        lo, hi = np.nanmin(v), np.nanmax(v)
+        return np.clip(((v - lo) / (hi - lo + 1e-12) * bins).astype(np.intp), 0, bins - 1)
+
+    cell = bin_of(xv) * bins + bin_of(yv)
+    counts = np.bincount(cell, minlength=bins * bins)
+
+    # water-filling: 오름차순 개수 c(1..K)에서 상한 q 찾기
+    c = np.sort(counts[counts > 0])
+    k = len(c)
+    kept_if_cap = np.cumsum(c) + c * (k - 1 - np.arange(k))  # q = c_i 일 때 남는 점 수
+    i = np.searchsorted(kept_if_cap, max_points, side="right")
+    if i == 0:
+        cap = max(max_points // k, 1)
+    else:
+        cap = c[i - 1] + (max_points - kept_if_cap[i - 1]) // max(k - i, 1)
+
+    # 칸 안에서는 무작위 순서로 cap개까지
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(df))
+    shuffled_cell = cell[order]
+    sort_idx = np.argsort(shuffled_cell, kind="stable")
+    sorted_cell = shuffled_cell[sort_idx]
+    starts = np.searchsorted(sorted_cell, sorted_cell, side="left")
+    within = np.empty(len(df), dtype=np.intp)
+    within[order[sort_idx]] = np.arange(len(df)) - starts
+
+    return df[within < cap]
+
+
+# =========================
+# 서버 측 KDE (binned Gaussian KDE)
+# =========================
+def kde_curve(values, grid_size: int = 256):
+    """격자점마다 한 칸인 히스토그램에 가우시안 커널을 합성곱한 KDE. O(n + grid²)
+
+    칸 경계는 격자점 사이 중간(격자 간격과 같은 폭)이라 칸 i의 개수가 grid[i]에 놓인다.
+    대역폭은 Scott 규칙 (σ · n^(-1/5)). (grid, density) 반환
+    """
+    v = np.asarray(values, dtype=float)
+    v = v[~np.isnan(v)]
+    if len(v) < 2 or np.ptp(v) == 0:
+        return np.array([]), np.array([])
+
+    bw = max(v.std(ddof=1) * len(v) ** (-1 / 5), 1e-6)
+    lo, hi = v.min() - 3 * bw, v.max() + 3 * bw
+    grid = np.linspace(lo, hi, grid_size)
+    step = grid[1] - grid[0]
+    edges = np.linspace(lo - step / 2, hi + step / 2, grid_size + 1)
+    hist, _ = np.histogram(v, bins=edges)
+
+    # 커널 중심을 가운데에 둔 홀수 길이(2·grid_size − 1) -> full 합성곱에서 격자와 맞는 구간만 자름
+    half = grid_size - 1
+    offsets = np.arange(-half, half + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2)
+    density = np.convolve(hist, kernel)[half:half + grid_size]
+    density /= density.sum() * step
+    return grid, density
+
+
+def box_stats(values) -> dict:
+    v = np.asarray(values, dtype=float)
+    v = v[~np.isnan(v)]
+    q1, med, q3 = np.percentile(v, [25, 50, 75])
+    iqr = q3 - q1
+    return {
+        "q1": q1,
+        "median": med,
+        "q3": q3,
+        "lowerfence": v[v >= q1 - 1.5 * iqr].min(),
+        "upperfence": v[v <= q3 + 1.5 * iqr].max(),
+    }
+
+
+# =========================
+# Figure builders
+# =========================
+def kde_violin(values, title: str):
+    """서버에서 계산한 KDE 윤곽 + 박스 통계만으로 그린 바이올린 (원자료 미전송)"""
+    grid, density = kde_curve(values)
+    half = density / density.max() * 0.4
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=np.concatenate([half, -half[::-1]]),
+        y=np.concatenate([grid, grid[::-1]]),
+        fill="toself",
+        mode="lines",
+        name="KDE",
+        hoverinfo="skip",
+    ))
+    fig.add_trace(go.Box(
+        x=[0], width=0.08, name="box",
+        **{k: [v] for k, v in box_stats(values).items()},
+    ))
+    fig.update_layout(title=title, showlegend=False, xaxis=dict(visible=False))
+    return fig
+
+
+def distribution_figure(df: pd.DataFrame, y_col: str, title: str, mode: str = "auto"):
+    """분포(바이올린) 그림. mode에 따라 전체 점 / 다운샘플 점 / 서버 KDE
+
+    px.violin은 브라우저에서 KDE를 계산하느라 모든 값을 전송하므로,
+    downsample/kde 모드에서는 서버 KDE 윤곽을 쓰고 점만 선택적으로 얹는다.
+    """
+    values = df[y_col].dropna()
+    mode = resolve_mode(mode, len(values))
+    if mode == "all" or len(values) < 2 or values.nunique() < 2:
+        return px.violin(df, y=y_col, points="all", box=True, title=title)
+
+    fig = kde_violin(values, title)
+    if mode == "downsample":
+        points_df = density_downsample(df.dropna(subset=[y_col]), "rank", y_col)
+        jitter = np.random.default_rng(0).uniform(-0.3, 0.3, len(points_df))
+        fig.add_trace(go.Scattergl(
+            x=jitter,
+            y=points_df[y_col],
+            mode="markers",
+            marker=dict(size=3, opacity=0.4, color="rgba(60,60,60,0.6)"),
+            hoverinfo="y",
+        ))
+        fig.update_layout(title=f"{title} · 점 {len(points_df):,}/{len(values):,}")
+    return fig
+
+
+def rank_scatter(df: pd.DataFrame, y_col: str, title: str, mode: str = "auto"):
+    """rank에 따른 분포 산점도 (WebGL). 행이 많으면 밀도 기반 다운샘플"""
+    n = int(df[y_col].notna().sum())
+    mode = resolve_mode(mode, n)
+    if mode in ("downsample", "kde"):
+        df = density_downsample(df.dropna(subset=[y_col]), "rank", y_col)
+        title = f"{title} · 점 {len(df):,}/{n:,}"
+
+    fig = px.scatter(
+        df,
+        x="rank",
+        y=y_col,
+        color="rank_intensity",
+        color_continuous_scale="Greys",
+        hover_data=["rank", "brand"],
+        title=title,
+        render_mode="webgl",
+    )
+    fig.update_layout(coloraxis_showscale=False, xaxis_title="rank (1=최상위)")
+    return fig
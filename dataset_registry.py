@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+import re
+
+from musinsa_data import DATA_DIR, MusinsaSnapshot, load_snapshot
+
+# =========================
+# 파일명 규칙
+# =========================
+# musinsa[_{category}]_top{N}_age{lo}_{hi}[_{YYYYMMDD}].pkl (또는 .products.arrow)
+#   예) musinsa_top100_age20_24.pkl            -> 슈트·블레이저 / 20–24세 / 기준 스냅샷
+#       musinsa_blazer_top100_age25_29_20260101.products.arrow
+SNAPSHOT_PATTERN = re.compile(
+    r"^musinsa(?:_(?P<category>[a-z][a-z0-9]*))?"
+    r"_top(?P<top_n>\d+)_age(?P<age_lo>\d+)_(?P<age_hi>\d+)"
+    r"(?:_(?P<crawl_date>\d{8}))?$"
+)
+
+AGE_GROUPS = ["20–24세", "25–29세", "30–34세", "35–39세"]
+
+DEFAULT_CATEGORY = "suit_blazer"
+CATEGORY_LABELS = {
+    "suit_blazer": "슈트·블레이저",
+    "blazer": "블레이저",
+    "jacket": "자켓",
+}
+
+
+@dataclass(frozen=True)
+class SnapshotInfo:
+    path: Path
+    category: str
+    age_group: str
+    top_n: int
+    crawl_date: date = None
+
+    @property
+    def category_label(self) -> str:
+        return CATEGORY_LABELS.get(self.category, self.category)
+
+    @property
+    def date_label(self) -> str:
+        return self.crawl_date.isoformat() if self.crawl_date else "기준 스냅샷"
+
+
+def parse_snapshot_name(path: Path):
+    """파일명에서 SnapshotInfo를 만든다. 규칙에 맞지 않으면 None"""
+    path = Path(path)
+    stem = path.name.split(".")[0]
+    match = SNAPSHOT_PATTERN.match(stem)
+    if match is None:
+        return None
+
+    crawl_date = match["crawl_date"]
+    return SnapshotInfo(
+        path=path.with_name(f"{stem}.pkl"),
+        category=match["category"] or DEFAULT_CATEGORY,
+        age_group=f"{int(match['age_lo'])}–{int(match['age_hi'])}세",
+        top_n=int(match["top_n"]),
+        crawl_date=datetime.strptime(crawl_date, "%Y%m%d").date() if crawl_date else None,
+    )
+
+
+def discover_snapshots(data_dir: Path = DATA_DIR):
+    """data_dir 아래의 pkl / columnar 스냅샷을 찾는다 (같은 stem은 하나로 취급)"""
+    found = {}
+    for pattern in ("*.pkl", "*.products.arrow"):
+        for path in Path(data_dir).glob(pattern):
+            info = parse_snapshot_name(path)
+            if info is not None:
+                found[info.path] = info
+    return list(found.values())
+
+
+def _age_order(age_group: str):
+    if age_group in AGE_GROUPS:
+        return (AGE_GROUPS.index(age_group), age_group)
+    return (len(AGE_GROUPS), age_group)
+
+
+# =========================
+# Registry
+# =========================
+class DatasetRegistry:
+    """연령대 / 카테고리 / 수집일 기준으로 스냅샷 목록을 관리한다.
+
+    목록은 파일명만 보고 만들며, 실제 데이터는 get()으로 처음 선택될 때
+    musinsa_data의 LRU 캐시(메모리 상한 MUSINSA_CACHE_MB)를 통해 읽는다.
+    """
+
+    def __init__(self, data_dir: Path = DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self.refresh()
+
+    def refresh(self):
+        self.snapshots = discover_snapshots(self.data_dir)
+
+    def age_groups(self):
+        return sorted({s.age_group for s in self.snapshots}, key=_age_order)
+
+    def categories(self, age_group: str):
+        return sorted({s.category for s in self.snapshots if s.age_group == age_group})
+
+    def versions(self, age_group: str, category: str):
+        """최신 수집일이 먼저 오도록 정렬 (날짜 없는 기준 스냅샷은 마지막)"""
+        matches = [s for s in self.snapshots if s.age_group == age_group and s.category == category]
+        return sorted(matches, key=lambda s: s.crawl_date or date.min, reverse=True)
+
+    def find(self, age_group: str, category: str = DEFAULT_CATEGORY, crawl_date: date = None):
+        for s in self.versions(age_group, category):
+            if crawl_date is None or s.crawl_date == crawl_date:
+                return s
+        return None
+
+    def get(self, info: SnapshotInfo) -> MusinsaSnapshot:
+        return load_snapshot(info.path)
@@ -0,0 +1,200 @@
+from dataclasses import dataclass, replace
+
+import numpy as np
+import pandas as pd
+
+from size_korea import DEFAULT_AGE_GROUP, body_reference, load_size_korea
+
+# =========================
+# 핏 분류 기준 (가슴둘레 ease, 단위: cm)
+# =========================
+# 구간은 [edge_i, edge_i+1) : 0 미만 / 0–6 / 6–10 / 10–16 / 16 이상
+FIT_EDGES = (0, 6, 10, 16)
+FIT_LABELS = (
+    "0 미만(평균 인체 치수보다 작음)",
+    "슬림핏",
+    "레귤러/베이직핏",
+    "컴포트핏",
+    "오버사이즈핏",
+)
+
+
+# =========================
+# Ease 계산 / 핏 분류
+# =========================
+def compute_ease(garment, body, factor: float = 1.0):
+    """Ease = factor × 의류 치수 − 인체 치수
+
+    단면(half) 치수를 둘레와 비교할 때는 factor=2.
+    배열/Series끼리 broadcasting 되므로 측정 항목 쌍에 상관없이 사용 가능.
+    """
+    return factor * garment - body
+
+
+def chest_ease(chest_half_cm, body_chest_circ_cm: float = None):
+    """가슴둘레 Ease(cm) = 2 × (의류 가슴단면 − 인체 가슴둘레/2)
+
+    인체 가슴둘레를 주지 않으면 사이즈코리아 기본값(20–24세 여성, 3차원 자동측정 mean)을 사용.
+    """
+    if body_chest_circ_cm is None:
+        body_chest_circ_cm = body_reference("가슴둘레")
+    return 2 * compute_ease(chest_half_cm, body_chest_circ_cm / 2)
+
+
+def fit_codes(ease, edges=FIT_EDGES, closed_right=()) -> np.ndarray:
+    """ease 배열을 구간 번호(0..len(edges))로 변환. 결측은 -1
+
+    구간은 기본적으로 [e_i, e_i+1). closed_right에 있는 경계는 그 값이 아래 구간에 들어간다 (e_i-1, e_i].
+    """
+    values = np.asarray(ease, dtype=float)
+    codes = np.searchsorted(np.asarray(edges, dtype=float), values, side="right")
+    if len(closed_right):
+        codes = codes - np.isin(values, closed_right)
+    return np.where(np.isnan(values), -1, codes)
+
+
+def classify_fit(ease, edges=FIT_EDGES, labels=FIT_LABELS):
+    """ease 값을 핏 분류(ordered Categorical)로 변환 (벡터 연산)
+
+    labels는 len(edges) + 1개. Series를 넣으면 같은 index의 Series를 돌려준다.
+    """
+    if len(labels) != len(edges) + 1:
+        raise ValueError("labels는 edges보다 1개 많아야 합니다.")
+
+    cat = pd.Categorical.from_codes(fit_codes(ease, edges), categories=list(labels), ordered=True)
+    if isinstance(ease, pd.Series):
+        return pd.Series(cat, index=ease.index, name=ease.name)
+    return cat
+
+
+# =========================
+# 인체 분포 기반 핏 비중 (사이즈 행 × 핏 구간 × 백분위 배치 계산)
+# =========================
+def population_fit_shares(garment, body_cdf, factor: float = 1.0, edges=FIT_EDGES) -> np.ndarray:
+    """의류 치수 각각에 대해, 인체 분포 중 각 핏 구간에 들어가는 인구 비중을 계산
+
+    ease = factor × garment − body 이므로 구간 [e_k-1, e_k) 는
+    body ∈ (factor×garment − e_k, factor×garment − e_k-1] 와 같다.
+    인체 분포의 CDF(size_korea.PercentileCDF)를 경계값들에 한 번에 적용해
+    (n_garment, len(edges) + 1) 비중 행렬을 반환한다. 결측 치수의 행은 NaN.
+    """
+    garment = np.asarray(garment, dtype=float)
+    edges = np.asarray(edges, dtype=float)
+
+    # (n, E) 경계 -> CDF
+    thresholds = factor * garment[:, None] - edges[None, :]
+    cdf = body_cdf.cdf(thresholds)
+
+    n = len(garment)
+    upper = np.hstack([np.ones((n, 1)), cdf])
+    lower = np.hstack([cdf, np.zeros((n, 1))])
+    shares = upper - lower
+    shares[np.isnan(garment)] = np.nan
+    return shares
+
+
+# =========================
+# 다항목 핏 (의류 실측 -> 인체 치수 대응 규칙)
+# =========================
+# ease = factor × 의류 치수 + offset − 인체 치수
+#   가슴단면 -> 가슴둘레      (단면이므로 factor=2)
+#   어깨너비 -> 어깨사이길이  (의류는 어깨솔기 사이, 인체는 어깨점 사이 직선거리)
+#   소매길이 -> 팔길이        (의류는 어깨솔기부터, 인체는 어깨점부터 손목까지)
+#   총장     -> 인체 대응 없음 (길이 자체를 기장 구간으로 분류)
+# 측정 정의 차이는 offset(cm)으로 보정한다. 기본값 0 = 실측을 그대로 비교
+SHOULDER_EDGES = (0, 4, 8)
+SHOULDER_LABELS = ("0 미만(어깨 좁음)", "정어깨", "세미 드롭숄더", "드롭숄더")
+SLEEVE_EDGES = (0, 4, 8)
+SLEEVE_LABELS = ("0 미만(손목 위)", "손목 길이", "손등 덮음", "긴 소매")
+# 총장 기장 구간: 크롭 < 60 ≤ 중간 ≤ 70 < 롱. pipeline.CROP_THR / MID_BAND(요약 큐브 구간 비중)도 이 값을 쓴다.
+LENGTH_BAND = (60, 70)
+LENGTH_EDGES = LENGTH_BAND
+LENGTH_CLOSED_RIGHT = (LENGTH_BAND[1],)  # 70은 중간 기장 (양끝 포함)
+LENGTH_LABELS = (
+    f"크롭({LENGTH_BAND[0]} 미만)", f"중간 기장({LENGTH_BAND[0]}–{LENGTH_BAND[1]})", f"롱({LENGTH_BAND[1]} 초과)",
+)
+
+
+@dataclass(frozen=True)
+class FitRule:
+    garment: str  # df_long 실측 컬럼
+    body: str = None  # 사이즈코리아 측정 항목 (None이면 실측값 자체를 구간 분류)
+    factor: float = 1.0
+    offset: float = 0.0
+    edges: tuple = FIT_EDGES
+    labels: tuple = FIT_LABELS
+    closed_right: tuple = ()  # 값이 아래 구간에 포함되는 경계 (fit_codes 참고)
+
+
+FIT_RULES = (
+    FitRule("총장", edges=LENGTH_EDGES, labels=LENGTH_LABELS, closed_right=LENGTH_CLOSED_RIGHT),
+    FitRule("어깨너비", "어깨사이길이", edges=SHOULDER_EDGES, labels=SHOULDER_LABELS),
+    FitRule("가슴단면", "가슴둘레", factor=2.0),
+    FitRule("소매길이", "팔길이", edges=SLEEVE_EDGES, labels=SLEEVE_LABELS),
+)
+
+
+def with_offsets(rules=FIT_RULES, **offsets):
+    """garment 이름별 offset만 바꾼 규칙. 예) with_offsets(어깨너비=-2.0)"""
+    return tuple(replace(r, offset=offsets[r.garment]) if r.garment in offsets else r for r in rules)
+
+
+def garment_target(body: dict, ease: dict = None, rules=FIT_RULES) -> dict:
+    """인체 치수 -> 목표 의류 실측 {의류 항목: cm}
+
+    ease = factor × 의류 치수 + offset − 인체 치수 를 의류 치수에 대해 푼다.
+    ease {의류 항목: 목표 ease(cm)}에 없는 항목은 ease 0 (인체 치수와 딱 맞는 실측).
+    인체 대응이 없는 규칙(총장)과 body에 없는 항목은 빠진다.
+    """
+    ease = ease or {}
+    return {
+        r.garment: (body[r.body] + ease.get(r.garment, 0.0) - r.offset) / r.factor
+        for r in rules
+        if r.body is not None and body.get(r.body) is not None
+    }
+
+
+def body_references(age_group: str = DEFAULT_AGE_GROUP, rules=FIT_RULES) -> dict:
+    """규칙에 쓰이는 인체 치수 mean(cm). 연령대 데이터가 없는 항목은 기본 연령대 값"""
+    size_korea = load_size_korea()
+    refs = {}
+    for r in rules:
+        if r.body is not None:
+            group = age_group if size_korea.has(r.body, age_group=age_group) else DEFAULT_AGE_GROUP
+            refs[r.body] = size_korea.stat(r.body, "mean", age_group=group)
+    return refs
+
+
+def fit_matrix(garment, body: dict, rules=FIT_RULES):
+    """(사이즈 행, 규칙) 실측 행렬 -> (ease 행렬, 핏 구간 번호 행렬) 을 한 번의 broadcasting으로 계산
+
+    항목마다 구간 개수가 달라 경계 행렬의 빈 칸은 +inf로 채운다. 결측은 ease NaN, 구간 -1.
+    closed_right 경계는 같은 값을 아래 구간으로 센다 (fit_codes와 같은 규칙).
+    """
+    garment = np.asarray(garment, dtype=float)
+    factor = np.array([r.factor for r in rules])
+    shift = np.array([r.offset - (body[r.body] if r.body is not None else 0.0) for r in rules])
+    ease = garment * factor + shift
+
+    edges = np.full((len(rules), max(len(r.edges) for r in rules)), np.inf)
+    right = np.zeros(edges.shape, dtype=bool)
+    for i, r in enumerate(rules):
+        edges[i, :len(r.edges)] = r.edges
+        right[i, :len(r.edges)] = np.isin(r.edges, r.closed_right)
+    passed = np.where(right, ease[:, :, None] > edges, ease[:, :, None] >= edges)
+    codes = passed.sum(axis=2, dtype=np.int8)
+    return ease, np.where(np.isnan(ease), np.int8(-1), codes)
+
+
+def fit_vector_frame(df_long: pd.DataFrame, body: dict, rules=FIT_RULES) -> pd.DataFrame:
+    """사이즈 행마다 항목별 ease(cm)와 핏 분류 컬럼을 붙인 DataFrame
+
+    인체 대응이 있는 항목은 '<항목>_ease(cm)', 모든 항목은 '<항목>_핏' (ordered Categorical)
+    """
+    ease, codes = fit_matrix(df_long[[r.garment for r in rules]].to_numpy(dtype=float), body, rules)
+    out = df_long.copy()
+    for i, r in enumerate(rules):
+        if r.body is not None:
+            out[f"{r.garment}_ease(cm)"] = ease[:, i]
+        out[f"{r.garment}_핏"] = pd.Categorical.from_codes(codes[:, i], categories=list(r.labels), ordered=True)
+    return out
@@ -0,0 +1,220 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+from fit_engine import FIT_RULES, with_offsets
+from musinsa_data import load_columns, load_derived
+from size_korea import DEFAULT_AGE_GROUP, load_size_korea
+
+# =========================
+# 인구 핏 커버리지 Monte Carlo 시뮬레이션
+# =========================
+# 평균 인체 한 명(가슴둘레 87.3cm) 대신, 사이즈코리아 분포를 따르는 가상 인체를 많이 뽑아
+# 모든 사이즈 행과 비교한다.
+#   1) 가우시안 코퓰라: 상관행렬 R의 다변량 정규 z -> u = Φ(z) -> 항목별 백분위 표 역보간
+#      (주변분포는 사이즈코리아 Min/백분위/Max, 항목 간 상관은 R)
+#   2) 사이즈 행 × 인체 쌍마다 fit_engine 규칙으로 ease 계산
+#      - 착용 가능: 인체 대응 항목 ease가 모두 0 이상 (가슴단면 외 결측 항목은 판정에서 제외)
+#      - 핏 분류: 착용 가능할 때 가슴둘레 ease 구간 (0번 구간 = ease 0 미만 = 착용 불가)
+#   3) 상품 커버리지: 상품의 사이즈 중 하나라도 그 핏으로 맞는 인체 비율
+#      (상품별로 연속 배치한 사이즈 행의 핏 비트 플래그를 상품 단위로 OR)
+# 인체는 청크 단위로 만들고 버리며, 한 번에 다루는 (사이즈 × 인체) 쌍은 MAX_PAIRS개 이하.
+# 청크마다 독립 시드(SeedSequence.spawn)를 쓰므로 프로세스 수와 상관없이 결과가 같다.
+BODY_CORR = {
+    ("가슴둘레", "어깨사이길이"): 0.5,
+    ("가슴둘레", "팔길이"): 0.3,
+    ("어깨사이길이", "팔길이"): 0.4,
+}
+PRIMARY = "가슴단면"
+CHUNK_BODIES = 50_000
+MAX_PAIRS = 4_000_000
+UNFIT_LABEL = "착용 불가"
+SIZE_COLUMNS = ["rank", "brand", "item_id", "row_key"]
+
+
+def correlation_matrix(measurements, corr: dict = None) -> np.ndarray:
+    """{(항목 a, 항목 b): ρ} -> 상관행렬. 주지 않은 쌍은 0"""
+    corr = BODY_CORR if corr is None else corr
+    index = {m: i for i, m in enumerate(measurements)}
+    matrix = np.eye(len(measurements))
+    for (a, b), rho in corr.items():
+        if a in index and b in index:
+            matrix[index[a], index[b]] = matrix[index[b], index[a]] = rho
+    return matrix
+
+
+def sample_bodies(n: int, marginals, chol: np.ndarray, rng) -> np.ndarray:
+    """(n, 항목 수) 가상 인체 치수(cm). marginals = 항목별 (값, 누적확률) 백분위 표"""
+    u = ndtr(rng.standard_normal((n, len(marginals))) @ chol.T)
+    return np.column_stack([np.interp(u[:, j], probs, values) for j, (values, probs) in enumerate(marginals)])
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """청크 작업에 넘기는 시뮬레이션 입력 (프로세스 간 pickle 가능)"""
+    marginals: tuple = field(repr=False)  # 인체 항목별 (값, 누적확률)
+    chol: np.ndarray = field(repr=False)  # 상관행렬의 Cholesky 인수
+    garment: np.ndarray = field(repr=False)  # (사이즈 행, 인체 항목) factor × 실측 + offset
+    primary: int  # 핏 분류에 쓰는 열
+    edges: tuple  # 핏 분류 경계
+    starts: np.ndarray = field(repr=False)  # 상품별 첫 사이즈 행 위치
+
+
+def _score_chunk(scenario: Scenario, seed, n_bodies: int):
+    """인체 n_bodies명을 뽑아 (사이즈별 분류 인원, 상품별 분류 인원, 상품별 착용 가능 인원) 반환"""
+    bodies = sample_bodies(n_bodies, scenario.marginals, scenario.chol, np.random.default_rng(seed))
+    bodies = bodies.astype(np.float32)
+    garment = scenario.garment.astype(np.float32)
+    n_sizes, n_measures = garment.shape
+    n_classes = len(scenario.edges) + 1
+
+    size_counts = np.zeros((n_sizes, n_classes), dtype=np.int64)
+    product_counts = np.zeros((len(scenario.starts), n_classes), dtype=np.int64)
+    product_any = np.zeros(len(scenario.starts), dtype=np.int64)
+    n_rows = np.diff(np.r_[scenario.starts, n_sizes])  # 상품별 사이즈 행 수
+    p = scenario.primary
+    step = max(MAX_PAIRS // max(n_sizes, 1), 1)
+    for lo in range(0, n_bodies, step):
+        b = bodies[lo:lo + step]
+        ease = garment[:, p, None] - b[None, :, p]
+        code = np.zeros(ease.shape, dtype=np.uint8)
+        for edge in scenario.edges:
+            code += ease >= edge  # NaN은 모든 비교가 False -> 0(착용 불가)
+        for j in range(n_measures):
+            if j != p:
+                code *= ~(garment[:, j, None] - b[None, :, j] < 0)
+
+        for c in range(n_classes):
+            size_counts[:, c] += np.count_nonzero(code == c, axis=1)
+        if len(scenario.starts):
+            # 상품별 OR: k번째 사이즈가 있는 상품만 모아 누적 (reduceat(axis=0)보다 훨씬 빠름)
+            flags = np.left_shift(np.uint8(1), code)
+            covered = flags[scenario.starts]
+            for k in range(1, int(n_rows.max())):
+                has_k = np.flatnonzero(n_rows > k)
+                covered[has_k] |= flags[scenario.starts[has_k] + k]
+            for c in range(n_classes):
+                product_counts[:, c] += np.count_nonzero(covered & np.uint8(1 << c), axis=1)
+            product_any += np.count_nonzero(covered > 1, axis=1)  # 1번 이상 구간 비트가 하나라도
+    return size_counts, product_counts, product_any
+
+
+def build_scenario(df_long: pd.DataFrame, age_group: str = DEFAULT_AGE_GROUP, rules=FIT_RULES,
+                   corr: dict = None, primary: str = PRIMARY):
+    """상품별로 사이즈 행을 모은 프레임과 Scenario. 인체 대응이 있는 규칙만 사용"""
+    rules = [r for r in rules if r.body is not None]
+    size_korea = load_size_korea()
+    marginals = []
+    for r in rules:
+        group = age_group if size_korea.has(r.body, age_group=age_group) else DEFAULT_AGE_GROUP
+        marginals.append(size_korea.cdf_points(r.body, age_group=group))
+    try:
+        chol = np.linalg.cholesky(correlation_matrix([r.body for r in rules], corr))
+    except np.linalg.LinAlgError:
+        raise ValueError("상관계수 조합이 유효한 상관행렬(양의 정부호)이 아닙니다.") from None
+
+    # 첫 등장(rank) 순서로 상품 번호를 매겨 stable 정렬 -> 같은 상품의 사이즈 행이 연속
+    codes, _ = pd.factorize(df_long["item_id"], use_na_sentinel=False)
+    order = np.argsort(codes, kind="stable")
+    rows = df_long.iloc[order].reset_index(drop=True)
+    starts = np.flatnonzero(np.diff(codes[order], prepend=-1)) if len(rows) else np.array([], dtype=np.intp)
+
+    garment = np.column_stack([r.factor * rows[r.garment].to_numpy(dtype=float) + r.offset for r in rules])
+    p = [r.garment for r in rules].index(primary)
+    scenario = Scenario(
+        marginals=tuple(marginals), chol=chol, garment=garment, primary=p,
+        edges=tuple(rules[p].edges), starts=starts,
+    )
+    return rows, scenario, [UNFIT_LABEL, *rules[p].labels[1:]]
+
+
+@dataclass(frozen=True)
+class Coverage:
+    n_bodies: int
+    sizes: pd.DataFrame = field(repr=False)  # 사이즈 행별 핏 분류 인구 비중(%)
+    products: pd.DataFrame = field(repr=False)  # 상품(사이즈 범위)별 커버리지(%)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.sizes.memory_usage(deep=True).sum() + self.products.memory_usage(deep=True).sum())
+
+
+def simulate_coverage(df_long: pd.DataFrame, n_bodies: int = 100_000, age_group: str = DEFAULT_AGE_GROUP,
+                      offsets: dict = None, corr: dict = None, seed: int = 0, workers: int = 1,
+                      chunk: int = CHUNK_BODIES) -> Coverage:
+    """가상 인체 n_bodies명으로 사이즈 행/상품 커버리지 계산. workers > 1이면 청크를 프로세스 풀로 분산"""
+    if n_bodies < 1:
+        raise ValueError("n_bodies는 1 이상이어야 합니다.")
+    rules = with_offsets(FIT_RULES, **(offsets or {}))
+    rows, scenario, labels = build_scenario(df_long, age_group, rules, corr)
+
+    chunks = [chunk] * (n_bodies // chunk) + ([n_bodies % chunk] if n_bodies % chunk else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    if workers == 1 or len(chunks) <= 1:
+        results = list(map(_score_chunk, repeat(scenario), seeds, chunks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_score_chunk, repeat(scenario), seeds, chunks))
+    size_counts, product_counts, product_any = (sum(parts) for parts in zip(*results))
+
+    pct = 100.0 / max(n_bodies, 1)
+    sizes = rows[[c for c in SIZE_COLUMNS if c in rows.columns]].copy()
+    for c, label in enumerate(labels):
+        sizes[f"{label}(%)"] = size_counts[:, c] * pct
+    sizes["착용 가능(%)"] = 100 - sizes[f"{UNFIT_LABEL}(%)"]
+
+    products = rows.iloc[scenario.starts][[c for c in ["rank", "brand", "item_id"] if c in rows.columns]]
+    products = products.reset_index(drop=True)
+    products["사이즈 수"] = np.diff(np.r_[scenario.starts, len(rows)])
+    for c, label in enumerate(labels[1:], start=1):
+        products[f"{label}(%)"] = product_counts[:, c] * pct
+    products["착용 가능(%)"] = product_any * pct
+    return Coverage(n_bodies=n_bodies, sizes=sizes, products=products)
+
+
+def snapshot_coverage(path, age_group: str = DEFAULT_AGE_GROUP, n_bodies: int = 100_000,
+                      offsets: dict = None, seed: int = 0, workers: int = 1) -> Coverage:
+    """스냅샷 사이즈 행 전체의 커버리지 (인자 조합별로 스냅샷 캐시에 보관)"""
+    offsets = dict(offsets or {})
+
+    def build():
+        columns = SIZE_COLUMNS + list(dict.fromkeys(r.garment for r in FIT_RULES if r.body is not None))
+        df_long = load_columns(path, columns, table="sizes")
+        return simulate_coverage(df_long, n_bodies, age_group, offsets, seed=seed, workers=workers)
+
+    key = ":".join(map(str, [age_group, n_bodies, seed, *sorted(offsets.items())]))
+    return load_derived(path, f"coverage:{key}", build)
+
+
+# =========================
+# CLI
+# =========================
+# python fit_simulation.py data/musinsa_top100_age20_24.pkl --bodies 1000000 --workers 8
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사이즈코리아 분포로 사이즈 범위 커버리지 시뮬레이션")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--bodies", type=int, default=1_000_000)
+    parser.add_argument("--age-group", default=DEFAULT_AGE_GROUP)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--shoulder-offset", type=float, default=0.0, help="어깨너비 -> 어깨사이길이 보정(cm)")
+    parser.add_argument("--sleeve-offset", type=float, default=0.0, help="소매길이 -> 팔길이 보정(cm)")
+    parser.add_argument("--out", type=Path, default=None, help="상품 커버리지 csv 저장 경로 (기본: stdout)")
+    args = parser.parse_args()
+
+    coverage = snapshot_coverage(
+        args.path, args.age_group, args.bodies,
+        {"어깨너비": args.shoulder_offset, "소매길이": args.sleeve_offset}, args.seed, args.workers,
+    )
+    if args.out:
+        coverage.products.to_csv(args.out, index=False, encoding="utf-8-sig")
+    else:
+        coverage.products.to_csv(sys.stdout, index=False)
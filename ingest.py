@@ -0,0 +1,297 @@
+from datetime import date, datetime
+from pathlib import Path
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from brand_stats import AGG_COLUMNS, refresh_ranks, update_aggregates
+from dataset_registry import parse_snapshot_name
+from fit_engine import chest_ease, classify_fit
+from musinsa_data import DATA_DIR, MEASURES, read_pickle
+from pipeline import body_chest_reference
+from rank_trends import TREND_COLUMNS, append_trend, day_trend, update_churn
+from size_korea import DEFAULT_AGE_GROUP
+
+# =========================
+# 저장 구조
+# =========================
+# data/ingest/<series>/
+#   derived.arrow         : item_id 단위 현재 상태 (signature, avg, ease, 핏 분류)
+#   deltas/<YYYYMMDD>.arrow : 그날 추가/삭제/변경된 상품 목록
+#   ranks/<YYYYMMDD>.arrow  : 그날의 (item_id, rank) -> 순위 시계열 (append-only, 수집일은 dictionary 1개, rank int32)
+#   brands.arrow          : 브랜드별 집계 (brand_stats, 바뀐 브랜드만 재집계)
+#   trend.arrow           : 수집일 × Top-k 추이 집계 (rank_trends, 하루치씩 이어붙임)
+INGEST_DIR = DATA_DIR / "ingest"
+
+DERIVED_COLUMNS = ["item_id", "signature", "brand", "title", "original_price", "row_count"] + \
+    [f"{m}_avg" for m in MEASURES] + ["가슴둘레_ease(cm)", "핏_분류(가슴둘레)"]
+
+
+def series_age_group(path: Path) -> str:
+    """스냅샷 파일명의 연령대 (규칙에 맞지 않으면 기본 연령대)"""
+    info = parse_snapshot_name(path)
+    return DEFAULT_AGE_GROUP if info is None else info.age_group
+
+
+def series_name(path: Path) -> str:
+    """스냅샷 파일명에서 시계열 이름(카테고리 + 연령대)을 만든다."""
+    info = parse_snapshot_name(path)
+    if info is None:
+        return Path(path).name.split(".")[0]
+    lo, hi = info.age_group.rstrip("세").split("–")
+    return f"{info.category}_age{lo}_{hi}"
+
+
+# =========================
+# 상품 단위 비교 / 재계산
+# =========================
+def item_signature(obj: dict) -> str:
+    """순위를 제외한 상품 내용(메타 + 사이즈표)의 해시. 값이 같으면 재계산하지 않는다."""
+    meta = obj.get("rank_meta", {})
+    payload = {
+        "brand": meta.get("brand"),
+        "title": meta.get("title", ""),
+        "original_price": meta.get("original_price"),
+        "per_row": obj.get("per_row", {}),
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def index_items(data: dict):
+    """items(rank -> obj)를 item_id -> (rank, obj)로 바꾼다 (같은 상품이 두 번 나오면 상위 순위 유지)"""
+    by_id = {}
+    for rank, obj in data.get("items", {}).items():
+        item_id = obj.get("rank_meta", {}).get("item_id")
+        if item_id is None:
+            continue
+        item_id = str(item_id)
+        if item_id not in by_id or int(rank) < by_id[item_id][0]:
+            by_id[item_id] = (int(rank), obj)
+    return by_id
+
+
+def derive_items(objs: dict, body_chest_circ_cm: float = None) -> pd.DataFrame:
+    """item_id -> obj 에 대해 avg(사이즈 행 평균), 가슴둘레 ease, 핏 분류를 계산
+
+    body_chest_circ_cm: 시계열 연령대의 인체 가슴둘레 (None이면 chest_ease 기본값)
+    """
+    rows = []
+    for item_id, obj in objs.items():
+        meta = obj.get("rank_meta", {})
+        per_row = obj.get("per_row", {})
+        row = {
+            "item_id": item_id,
+            "signature": item_signature(obj),
+            "brand": meta.get("brand"),
+            "title": meta.get("title", ""),
+            "original_price": meta.get("original_price"),
+            "row_count": len(per_row),
+        }
+        for m in MEASURES:
+            vals = [v.get(m) for v in per_row.values() if v.get(m) is not None]
+            row[f"{m}_avg"] = float(np.mean(vals)) if vals else np.nan
+        rows.append(row)
+
+    df = pd.DataFrame(rows, columns=DERIVED_COLUMNS)
+    df["original_price"] = pd.to_numeric(df["original_price"], errors="coerce")
+    return add_fit(df, body_chest_circ_cm)
+
+
+def add_fit(df: pd.DataFrame, body_chest_circ_cm: float = None) -> pd.DataFrame:
+    """가슴단면_avg로 가슴둘레 ease와 핏 분류 컬럼을 (다시) 채운다"""
+    df["가슴둘레_ease(cm)"] = chest_ease(df["가슴단면_avg"].astype(float), body_chest_circ_cm)
+    df["핏_분류(가슴둘레)"] = classify_fit(df["가슴둘레_ease(cm)"]).astype(object)
+    return df
+
+
+def diff_items(prev_signatures: dict, new_by_id: dict):
+    """이전 signature(item_id -> hash)와 새 크롤을 비교해 added / removed / changed id 목록 반환"""
+    new_ids = set(new_by_id)
+    prev_ids = set(prev_signatures)
+    added = sorted(new_ids - prev_ids)
+    removed = sorted(prev_ids - new_ids)
+    changed = sorted(
+        i for i in new_ids & prev_ids
+        if item_signature(new_by_id[i][1]) != prev_signatures[i]
+    )
+    return added, removed, changed
+
+
+# =========================
+# Arrow 입출력
+# =========================
+def _write(df: pd.DataFrame, path: Path):
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    # 임시 파일에 쓴 뒤 교체: 읽는 쪽이 memory map으로 열고 있어도 안전
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+
+
+def _read(path: Path) -> pd.DataFrame:
+    import pyarrow.feather as feather
+
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def load_derived(store_dir: Path) -> pd.DataFrame:
+    path = Path(store_dir) / "derived.arrow"
+    if not path.exists():
+        return pd.DataFrame(columns=DERIVED_COLUMNS)
+    return _read(path)
+
+
+def load_brand_aggregates(store_dir: Path) -> pd.DataFrame:
+    path = Path(store_dir) / "brands.arrow"
+    if not path.exists():
+        return pd.DataFrame(columns=AGG_COLUMNS)
+    return _read(path)
+
+
+def load_trend(store_dir: Path) -> pd.DataFrame:
+    path = Path(store_dir) / "trend.arrow"
+    if not path.exists():
+        return pd.DataFrame(columns=TREND_COLUMNS)
+    return _read(path)
+
+
+def rank_dates(store_dir: Path) -> list:
+    """순위 파일이 있는 수집일(YYYYMMDD) 목록 (오름차순)"""
+    return sorted(p.name.split(".")[0] for p in (Path(store_dir) / "ranks").glob("*.arrow"))
+
+
+def load_rank_history(store_dir: Path, since: str = None, until: str = None) -> pd.DataFrame:
+    """ranks/*.arrow를 이어붙인 (crawl_date, item_id, rank) 시계열
+
+    since/until(YYYYMMDD, 양끝 포함)을 주면 그 기간 파일만 읽는다.
+    """
+    stamps = [s for s in rank_dates(store_dir) if (since is None or s >= since) and (until is None or s <= until)]
+    if not stamps:
+        return pd.DataFrame(columns=["crawl_date", "item_id", "rank"])
+    parts = [_read(Path(store_dir) / "ranks" / f"{s}.arrow") for s in stamps]
+    history = pd.concat(parts, ignore_index=True)
+    history["crawl_date"] = history["crawl_date"].astype(str)
+    return history
+
+
+def previous_ranks(store_dir: Path, stamp: str):
+    """stamp 직전 수집일의 순위 (없으면 None)"""
+    before = [s for s in rank_dates(store_dir) if s < stamp]
+    return _read(Path(store_dir) / "ranks" / f"{before[-1]}.arrow") if before else None
+
+
+# =========================
+# Ingest
+# =========================
+def ingest_snapshot(data: dict, crawl_date: date, store_dir: Path, age_group: str = DEFAULT_AGE_GROUP) -> dict:
+    """새 크롤 결과를 이전 상태와 item_id 기준으로 비교해 바뀐 상품만 재계산한다.
+
+    ease / 핏 분류는 시계열 연령대(age_group)의 사이즈코리아 가슴둘레 기준.
+    저장된 ease가 다른 기준으로 계산돼 있으면(이전 버전 저장분) 그 상품의 ease와 브랜드 집계도 다시 계산한다.
+
+    - derived.arrow : 변경 없는 상품은 그대로 두고 추가/변경 상품만 새로 계산해 교체
+    - deltas/<날짜>.arrow : 추가/삭제/변경 목록
+    - ranks/<날짜>.arrow  : 그날 순위 (순위 변동은 재계산 대상이 아니라 시계열로만 기록)
+    - brands.arrow : 추가/삭제/변경 상품이 속한 브랜드만 다시 집계 (순위 값은 매번 갱신)
+    - trend.arrow : 그날 Top-k 집계 한 줄씩 추가 (직전 수집일 순위 파일 하나만 읽음)
+      지난 날짜를 늦게 넣으면 바로 다음 수집일의 진입/이탈/순위 변동도 이 날 기준으로 다시 계산
+    """
+    store_dir = Path(store_dir)
+    stamp = crawl_date.strftime("%Y%m%d")
+    body_age_group, body_circ = body_chest_reference(age_group)
+
+    prev = load_derived(store_dir)
+    new_by_id = index_items(data)
+    added, removed, changed = diff_items(dict(zip(prev["item_id"], prev["signature"])), new_by_id)
+
+    recompute_ids = added + changed
+    fresh = derive_items({i: new_by_id[i][1] for i in recompute_ids}, body_circ)
+    drop_ids = set(removed) | set(changed)
+    keep = prev[~prev["item_id"].isin(drop_ids)]
+
+    # 그대로 두는 상품도 ease가 현재 인체 기준과 다르면 다시 계산 (상품 수만큼의 벡터 연산)
+    ease = chest_ease(keep["가슴단면_avg"].to_numpy(dtype=float), body_circ)
+    stale = ~np.isclose(ease, keep["가슴둘레_ease(cm)"].to_numpy(dtype=float), equal_nan=True)
+    if stale.any():
+        keep = add_fit(keep.copy(), body_circ)
+    parts = [df for df in (keep, fresh) if not df.empty]
+    derived = pd.concat(parts, ignore_index=True) if parts else fresh
+    _write(derived.sort_values("item_id"), store_dir / "derived.arrow")
+
+    deltas = pd.DataFrame({
+        "crawl_date": stamp,
+        "item_id": added + removed + changed,
+        "change": ["added"] * len(added) + ["removed"] * len(removed) + ["changed"] * len(changed),
+    })
+    _write(deltas, store_dir / "deltas" / f"{stamp}.arrow")
+
+    ranks = pd.DataFrame({
+        "crawl_date": pd.Categorical([stamp] * len(new_by_id)),
+        "item_id": list(new_by_id),
+        "rank": np.array([r for r, _ in new_by_id.values()], dtype=np.int32),
+    }).sort_values("rank")
+    prev_ranks = previous_ranks(store_dir, stamp)
+    _write(ranks, store_dir / "ranks" / f"{stamp}.arrow")
+
+    day = day_trend(stamp, ranks, derived, prev_ranks)
+    trend = append_trend(load_trend(store_dir), day)
+    later = [s for s in rank_dates(store_dir) if s > stamp]
+    if later:
+        # 다음 수집일의 직전이 이 날로 바뀌었다 (그 다음 날짜들의 직전은 그대로)
+        next_ranks = _read(store_dir / "ranks" / f"{later[0]}.arrow")
+        trend = update_churn(trend, later[0], next_ranks, ranks)
+    _write(trend, store_dir / "trend.arrow")
+
+    touched = set(prev.loc[prev["item_id"].isin(drop_ids), "brand"]) | set(fresh["brand"])
+    touched |= set(keep.loc[stale, "brand"])
+    items = derived.merge(ranks[["item_id", "rank"]], on="item_id", how="left")
+    brands = update_aggregates(load_brand_aggregates(store_dir), items, touched, body_circ)
+    _write(refresh_ranks(brands, items), store_dir / "brands.arrow")
+
+    return {
+        "crawl_date": stamp,
+        "total": len(new_by_id),
+        "added": len(added),
+        "removed": len(removed),
+        "changed": len(changed),
+        "unchanged": len(new_by_id) - len(added) - len(changed),
+        "ease_recomputed": int(stale.sum()),
+        "brands_recomputed": len(touched),
+        "body_age_group": body_age_group,
+    }
+
+
+# python ingest.py data/musinsa_top100_age20_24.pkl --date 2026-10-18
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="새 크롤 pkl을 이전 스냅샷과 비교해 증분 반영")
+    parser.add_argument("pkl", type=Path)
+    parser.add_argument("--date", default=None, help="수집일 YYYY-MM-DD (기본: 파일명 날짜 또는 오늘)")
+    parser.add_argument("--series", default=None, help="저장 이름 (기본: 파일명에서 카테고리+연령대)")
+    parser.add_argument("--store", type=Path, default=INGEST_DIR)
+    parser.add_argument("--age-group", default=None, help="인체 기준 연령대 (기본: 파일명의 연령대)")
+    args = parser.parse_args()
+
+    info = parse_snapshot_name(args.pkl)
+    if args.date:
+        crawl_date = datetime.strptime(args.date, "%Y-%m-%d").date()
+    elif info is not None and info.crawl_date is not None:
+        crawl_date = info.crawl_date
+    else:
+        crawl_date = date.today()
+
+    result = ingest_snapshot(
+        read_pickle(args.pkl),
+        crawl_date,
+        args.store / (args.series or series_name(args.pkl)),
+        args.age_group or series_age_group(args.pkl),
+    )
+    print(json.dumps(result, ensure_ascii=False))
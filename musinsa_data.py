@@ -0,0 +1,419 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+import argparse
+import json
+import os
+import pickle
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from profiling import record_cache, section
+
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+MUSINSA_FILE = DATA_DIR / "musinsa_top100_age20_24.pkl"
+
+MEASURES = ["총장", "어깨너비", "가슴단면", "소매길이"]
+
+AVG_COLUMNS = ["rank", "brand", "item_id", "title", "url", "original_price", "row_count"] + [f"{m}_avg" for m in MEASURES]
+LONG_COLUMNS = ["rank", "brand", "item_id", "row_key", "original_price"] + MEASURES
+
+
+# =========================
+# Snapshot (한 번 만든 DataFrame 묶음)
+# =========================
+@dataclass(frozen=True)
+class MusinsaSnapshot:
+    """pkl 한 개에서 만든 상품 단위(df_avg) / 사이즈 행 단위(df_long) 프레임.
+
+    캐시에서 여러 세션이 같은 객체를 공유하므로 프레임을 직접 수정하지 말고
+    필요하면 ``.copy()`` 해서 사용한다.
+    """
+    path: Path
+    mtime_ns: int
+    meta: dict = field(repr=False)
+    df_avg: pd.DataFrame = field(repr=False)
+    df_long: pd.DataFrame = field(repr=False)
+
+    @property
+    def version(self) -> str:
+        # 그림/집계 캐시 키로 사용 (파일이 바뀌면 값도 바뀜)
+        return f"{self.path.name}:{self.mtime_ns}"
+
+
+# =========================
+# Transform
+# =========================
+def add_rank_intensity(df: pd.DataFrame) -> pd.DataFrame:
+    # rank 진하기(1이 가장 진함)
+    df["rank_intensity"] = 1 - (df["rank"] - df["rank"].min()) / (df["rank"].max() - df["rank"].min() + 1e-9)
+    return df
+
+
+def build_frames(data: dict):
+    """pkl 구조(items -> rank -> rank_meta/avg/per_row)를 df_avg, df_long으로 변환
+
+    사이즈 행마다 dict를 만들지 않고, 컬럼 배열을 한 번에 모아
+    DataFrame 생성자를 한 번만 호출한다. 상품 단위 값(rank/brand/...)은
+    상품별 사이즈 행 개수만큼 np.repeat으로 펼친다.
+
+    사이즈 행 실측(df_long의 MEASURES)도 ``*_avg``처럼 숫자로 변환하고 둘 다 항상 float64다.
+    문자열 "55"는 55.0, 숫자가 아닌 값은 NaN이 된다. (이전 루프는 사이즈 행 문자열을 그대로 두어
+    컬럼이 object dtype이 됐다.)
+    """
+    items = data.get("items", {})
+    objs = list(items.values())
+    metas = [obj.get("rank_meta", {}) for obj in objs]
+    per_rows = [obj.get("per_row", {}) for obj in objs]
+
+    # 상품 단위 메타는 상품 수만큼만 읽는다. 없는 키는 이전과 같이 None
+    def meta_column(key):
+        return np.array([m.get(key) for m in metas], dtype=object)
+
+    # 사이즈 행 실측 dict 리스트 -> 컬럼 배열 변환은 pandas(Cython)에 한 번에 맡김
+    avg_df = pd.DataFrame([obj.get("avg", {}) for obj in objs], columns=MEASURES)
+    vals_df = pd.DataFrame([vals for p in per_rows for vals in p.values()], columns=MEASURES)
+
+    ranks = np.fromiter((int(r) for r in items), dtype=np.int64, count=len(objs))
+    row_counts = np.fromiter((len(p) for p in per_rows), dtype=np.int64, count=len(objs))
+    brands = meta_column("brand")
+    item_ids = meta_column("item_id")
+    prices = meta_column("original_price")
+
+    df_avg = pd.DataFrame({
+        "rank": ranks,
+        "brand": brands,
+        "item_id": item_ids,
+        "title": [m.get("title", "") for m in metas],
+        "url": meta_column("url"),
+        "original_price": prices,
+        "row_count": row_counts,
+        **{f"{m}_avg": pd.to_numeric(avg_df[m], errors="coerce").to_numpy(dtype=float) for m in MEASURES},
+    }, columns=AVG_COLUMNS).sort_values("rank")
+
+    # 상품 단위 값은 상품별 사이즈 행 개수만큼 반복
+    df_long = pd.DataFrame({
+        "rank": np.repeat(ranks, row_counts),
+        "brand": np.repeat(brands, row_counts),
+        "item_id": np.repeat(item_ids, row_counts),
+        "row_key": [k for p in per_rows for k in p],
+        "original_price": np.repeat(prices, row_counts),
+        **{m: pd.to_numeric(vals_df[m], errors="coerce").to_numpy(dtype=float) for m in MEASURES},
+    }, columns=LONG_COLUMNS).sort_values("rank")
+
+    df_avg["original_price"] = pd.to_numeric(df_avg["original_price"], errors="coerce")
+    df_long["original_price"] = pd.to_numeric(df_long["original_price"], errors="coerce")
+
+    add_rank_intensity(df_avg)
+    add_rank_intensity(df_long)
+    return df_avg, df_long
+
+
+# =========================
+# Columnar 저장 포맷 (Arrow IPC / Feather, 무압축)
+# =========================
+# <stem>.products.arrow : 상품 단위 (AVG_COLUMNS)
+# <stem>.sizes.arrow    : 사이즈 행 단위 (LONG_COLUMNS)
+# 무압축 Arrow 파일은 memory map으로 필요한 컬럼만 복사 없이 읽을 수 있다.
+META_KEY = b"musinsa_meta"
+
+
+def columnar_paths(path: Path):
+    path = Path(path)
+    stem = path.name.split(".")[0]
+    return (
+        path.with_name(f"{stem}.products.arrow"),
+        path.with_name(f"{stem}.sizes.arrow"),
+    )
+
+
+def has_columnar(path: Path) -> bool:
+    return all(p.exists() for p in columnar_paths(path))
+
+
+def source_paths(path: Path):
+    """스냅샷을 이루는 파일 중 존재하는 것 (pkl + columnar). 파생 파일의 최신 여부 비교용"""
+    path = Path(path)
+    return tuple(p for p in (path, *columnar_paths(path)) if p.exists())
+
+
+def columnar_is_stale(path: Path) -> bool:
+    """pkl이 columnar 파일보다 새로우면 True (새 크롤이 pkl만 덮어쓴 경우)"""
+    path = Path(path)
+    if not (path.exists() and has_columnar(path)):
+        return False
+    pkl_mtime = path.stat().st_mtime_ns
+    return any(p.stat().st_mtime_ns < pkl_mtime for p in columnar_paths(path))
+
+
+def write_columnar(data: dict, path: Path):
+    """pkl 구조 dict를 products/sizes 두 개의 Arrow 파일로 저장"""
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    df_avg, df_long = build_frames(data)
+    meta = json.dumps({k: v for k, v in data.items() if k != "items"}, ensure_ascii=False)
+
+    out_paths = columnar_paths(path)
+    for df, cols, out in zip((df_avg, df_long), (AVG_COLUMNS, LONG_COLUMNS), out_paths):
+        table = pa.Table.from_pandas(df[cols].reset_index(drop=True), preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), META_KEY: meta.encode("utf-8")})
+        # 임시 파일에 쓴 뒤 교체: 다른 세션이 memory map으로 읽고 있어도 안전
+        tmp_path = out.with_name(out.name + ".tmp")
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, out)
+
+    # 집계 큐브와 유사도 인덱스도 변환 시점에 한 번 만들어 같은 위치에 둔다.
+    from similarity import build_similarity, similar_path
+    from summary_cube import build_cube, cube_path
+
+    build_cube(df_long).save(cube_path(path))
+    build_similarity(df_long).save(similar_path(path))
+    return out_paths
+
+
+def convert_pickle(pkl_path: Path):
+    """기존 pkl 스냅샷 옆에 columnar 파일을 만든다."""
+    return write_columnar(read_pickle(pkl_path), pkl_path)
+
+
+def read_columnar(path: Path, columns=None):
+    """Arrow 파일을 memory map으로 열어 요청한 컬럼만 읽는다. (DataFrame, meta) 반환"""
+    import pyarrow.feather as feather
+
+    table = feather.read_table(path, columns=columns, memory_map=True)
+    meta = json.loads((table.schema.metadata or {}).get(META_KEY, b"{}"))
+    return table.to_pandas(), meta
+
+
+# =========================
+# Load (path + mtime 기준 프로세스 단위 LRU 캐시)
+# =========================
+class SnapshotCache:
+    """파싱한 프레임을 보관하는 LRU. 총 메모리가 max_bytes를 넘으면 오래 안 쓴 것부터 버린다.
+
+    값은 (mtime_ns, value, nbytes)로 보관하며, mtime이 다르면 miss로 취급한다.
+    가장 최근에 넣은 항목 하나는 용량을 넘어도 유지한다.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, mtime_ns: int):
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != mtime_ns:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key, mtime_ns: int, value, nbytes: int):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.total_bytes -= old[2]
+        self._entries[key] = (mtime_ns, value, nbytes)
+        self.total_bytes += nbytes
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, freed) = self._entries.popitem(last=False)
+            self.total_bytes -= freed
+
+    def resize(self, key, value, nbytes: int):
+        """value가 아직 key 항목이면 용량을 nbytes로 고치고 상한을 넘으면 오래 안 쓴 것부터 버린다."""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] is not value:
+            return
+        self._entries[key] = (entry[0], value, nbytes)
+        self.total_bytes += nbytes - entry[2]
+        self._entries.move_to_end(key)
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, freed) = self._entries.popitem(last=False)
+            self.total_bytes -= freed
+
+    def keys(self):
+        return list(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.total_bytes = 0
+
+
+def frame_nbytes(*dfs) -> int:
+    return int(sum(df.memory_usage(index=True, deep=True).sum() for df in dfs))
+
+
+# 환경변수 MUSINSA_CACHE_MB로 메모리 상한 조절 (기본 512MB)
+_CACHE = SnapshotCache(int(os.environ.get("MUSINSA_CACHE_MB", "512")) * 1024 * 1024)
+_CACHE_LOCK = threading.RLock()
+_CONVERT_FAILED = set()  # (pkl 경로, 수정시각): columnar 재변환에 실패한 pkl
+
+
+def read_pickle(path: Path) -> dict:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def _source_mtime_ns(path: Path) -> int:
+    """캐시 키로 쓰는 수정시각: pkl과 columnar 파일 중 가장 최근 값"""
+    return max(p.stat().st_mtime_ns for p in source_paths(path))
+
+
+def use_columnar(path: Path) -> bool:
+    """columnar 파일을 읽어도 되는지. pkl이 더 새로우면 먼저 다시 변환한다.
+
+    변환할 수 없으면(읽기 전용 디렉터리 등) 경고를 남기고 False -> pkl을 읽는다.
+    """
+    if not has_columnar(path):
+        return False
+    if not columnar_is_stale(path):
+        return True
+    with _CACHE_LOCK:
+        if columnar_is_stale(path):
+            failed_key = (Path(path), path.stat().st_mtime_ns)
+            if failed_key in _CONVERT_FAILED:
+                return False
+            try:
+                with section("convert pickle"):
+                    convert_pickle(path)
+            except OSError as e:
+                # 같은 pkl(수정시각)로는 다시 시도하지 않는다
+                _CONVERT_FAILED.add(failed_key)
+                warnings.warn(f"{path.name}이 columnar 파일보다 새롭지만 다시 변환하지 못해 pkl을 읽습니다: {e}")
+                return False
+    return True
+
+
+def snapshot_exists(path: Path = MUSINSA_FILE) -> bool:
+    return Path(path).exists() or has_columnar(path)
+
+
+def load_snapshot(path: Path = MUSINSA_FILE) -> MusinsaSnapshot:
+    """스냅샷을 읽어 MusinsaSnapshot을 반환한다.
+
+    columnar 파일(<stem>.products/sizes.arrow)이 있으면 그것을 읽고(unpickle 없음),
+    없을 때만 pkl을 읽어 변환한다. pkl이 columnar 파일보다 새로우면 columnar를 다시 만든다.
+    같은 파일(경로 + 수정시각)이면 모든 세션·rerun이 같은 결과를 재사용하고,
+    파일이 갱신되면 다음 호출에서 다시 만든다.
+    """
+    path = Path(path).resolve()
+    columnar = use_columnar(path)
+    mtime_ns = _source_mtime_ns(path)
+
+    with _CACHE_LOCK:
+        cached = _CACHE.get(path, mtime_ns)
+        record_cache("snapshot", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        if columnar:
+            with section("read columnar"):
+                products_path, sizes_path = columnar_paths(path)
+                df_avg, meta = read_columnar(products_path)
+                df_long, _ = read_columnar(sizes_path)
+                add_rank_intensity(df_avg)
+                add_rank_intensity(df_long)
+        else:
+            with section("unpickle"):
+                data = read_pickle(path)
+            with section("build_frames"):
+                df_avg, df_long = build_frames(data)
+            meta = {k: v for k, v in data.items() if k != "items"}
+
+        snap = MusinsaSnapshot(
+            path=path,
+            mtime_ns=mtime_ns,
+            meta=meta,
+            df_avg=df_avg,
+            df_long=df_long,
+        )
+        _CACHE.put(path, mtime_ns, snap, frame_nbytes(df_avg, df_long))
+        return snap
+
+
+def load_columns(path: Path = MUSINSA_FILE, columns=None, table: str = "products") -> pd.DataFrame:
+    """columnar 스냅샷에서 필요한 컬럼만 읽는다 (예: ease 페이지의 가슴단면_avg).
+
+    columnar 파일이 없으면 전체 스냅샷을 읽고 컬럼을 골라 반환한다.
+    """
+    path = Path(path).resolve()
+    columns = list(columns) if columns is not None else None
+    want_intensity = columns is not None and "rank_intensity" in columns
+    read_cols = None if columns is None else [c for c in columns if c != "rank_intensity"]
+    if want_intensity and "rank" not in read_cols:
+        read_cols.append("rank")
+
+    if not use_columnar(path):
+        snap = load_snapshot(path)
+        df = snap.df_avg if table == "products" else snap.df_long
+        return df if columns is None else df[columns]
+
+    mtime_ns = _source_mtime_ns(path)
+    key = (path, table, tuple(read_cols or ()))
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key, mtime_ns)
+        record_cache(f"columns:{table}", hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        products_path, sizes_path = columnar_paths(path)
+        with section(f"read columnar ({table})"):
+            df, _ = read_columnar(products_path if table == "products" else sizes_path, columns=read_cols)
+        if want_intensity or columns is None:
+            add_rank_intensity(df)
+        if columns is not None:
+            df = df[columns]
+        _CACHE.put(key, mtime_ns, df, frame_nbytes(df))
+        return df
+
+
+def load_derived(path: Path, name: str, build, nbytes=None):
+    """스냅샷에서 파생된 객체(집계 큐브, 인덱스 등)를 스냅샷과 같은 LRU에 보관한다.
+
+    build()는 캐시 miss일 때만 호출되고, 스냅샷 파일이 갱신되면 다시 만든다.
+    nbytes(value)를 주지 않으면 value.nbytes(없으면 0)로 용량을 잡는다.
+    """
+    path = Path(path).resolve()
+    use_columnar(path)  # pkl이 더 새로우면 먼저 다시 변환해 두어야 캐시 키(수정시각)가 바뀌지 않는다
+    mtime_ns = _source_mtime_ns(path)
+    key = (path, "derived", name)
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key, mtime_ns)
+        record_cache(name.split(":")[0], hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        with section(f"build {name.split(':')[0]}"):
+            value = build()
+        size = nbytes(value) if nbytes is not None else int(getattr(value, "nbytes", 0))
+        _CACHE.put(key, mtime_ns, value, size)
+        return value
+
+
+def update_derived(path: Path, name: str, value, update):
+    """캐시에 공유된 파생 객체를 잠금 안에서 update(value)로 채우고 용량(value.nbytes)을 다시 잡는다.
+
+    세션들이 같은 객체에 지연 생성 부분(예: 유사도 KD-tree)을 동시에 만들지 않게 하고,
+    늘어난 메모리를 MUSINSA_CACHE_MB 상한 계산에 반영한다.
+    """
+    key = (Path(path).resolve(), "derived", name)
+    with _CACHE_LOCK:
+        update(value)
+        _CACHE.resize(key, value, int(getattr(value, "nbytes", 0)))
+
+
+# =========================
+# CLI: pkl -> columnar 변환
+# =========================
+# python musinsa_data.py data/musinsa_top100_age20_24.pkl
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="무신사 pkl 스냅샷을 Arrow columnar 파일로 변환")
+    parser.add_argument("pkl", nargs="+", type=Path)
+    args = parser.parse_args()
+
+    for pkl_path in args.pkl:
+        for out in convert_pickle(pkl_path):
+            print(out)
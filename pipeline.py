@@ -0,0 +1,275 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from brand_stats import snapshot_brand_stats
+from dataset_registry import discover_snapshots, parse_snapshot_name
+from fit_engine import (
+    FIT_LABELS, FIT_RULES, LENGTH_BAND, body_references, chest_ease, classify_fit, fit_vector_frame, population_fit_shares,
+    with_offsets,
+)
+from musinsa_data import BASE_DIR, MEASURES, load_columns, load_snapshot, snapshot_exists
+from size_korea import DEFAULT_AGE_GROUP, load_size_korea
+from summary_cube import load_cube
+
+# =========================
+# 분석 기본값 (대시보드 슬라이더 초기값과 같음)
+# =========================
+TOP_K = 20
+# 총장 구간은 fit_engine의 기장 분류(LENGTH_BAND)와 같은 정의: 크롭 < CROP_THR ≤ 중간 ≤ MID_BAND[1] < 롱
+CROP_THR = LENGTH_BAND[0]
+MID_BAND = LENGTH_BAND
+SLEEVE_STD_BAND = (60, 62)
+
+REPORT_DIR = BASE_DIR / "reports"
+
+
+# =========================
+# 계산 단계 (Streamlit 없이 import 해서 사용)
+# =========================
+def body_chest_reference(age_group: str):
+    """스냅샷 연령대의 사이즈코리아 가슴둘레 mean(cm). 없으면 기본 연령대. (사용한 연령대, 값) 반환"""
+    size_korea = load_size_korea()
+    body_age_group = age_group if size_korea.has("가슴둘레", age_group=age_group) else DEFAULT_AGE_GROUP
+    return body_age_group, size_korea.stat("가슴둘레", "mean", age_group=body_age_group)
+
+
+def ease_frame(df_avg: pd.DataFrame, body_chest_circ_cm: float) -> pd.DataFrame:
+    """상품 단위 가슴둘레 ease와 핏 분류 (가슴단면_avg 결측 상품 제외)"""
+    df_ease = df_avg.dropna(subset=["가슴단면_avg"]).copy()
+    df_ease["가슴단면_ease(cm)"] = df_ease["가슴단면_avg"] - body_chest_circ_cm / 2
+    df_ease["가슴둘레_ease(cm)"] = 2 * df_ease["가슴단면_ease(cm)"]
+    df_ease["핏_분류(가슴둘레)"] = classify_fit(df_ease["가슴둘레_ease(cm)"])
+    return df_ease
+
+
+def fit_share_table(fit: pd.Series) -> pd.DataFrame:
+    """핏 분류별 상품 수와 비중(%). 등장하지 않은 분류는 제외"""
+    fit_share = (
+        fit.dropna()
+        .value_counts()
+        .rename_axis("핏")
+        .reset_index(name="count")
+    )
+    # Categorical은 등장하지 않은 분류도 0으로 세므로 제외
+    fit_share = fit_share[fit_share["count"] > 0].reset_index(drop=True)
+    fit_share["count"] = fit_share["count"].astype(int)
+    total_cnt = int(fit_share["count"].sum())
+    fit_share["pct(%)"] = (fit_share["count"] / total_cnt * 100) if total_cnt > 0 else 0.0
+    return fit_share
+
+
+def size_row_fit(df_size: pd.DataFrame, body_age_group: str, body_chest_circ_cm: float):
+    """사이즈 행 단위 ease + 인체 분포 기준 핏 비중. (행별 프레임, 핏별 평균 인구 비중) 반환"""
+    size_korea = load_size_korea()
+    body_cdf = size_korea.percentile_index("가슴둘레", age_group=body_age_group)
+    shares = population_fit_shares(df_size["가슴단면"].to_numpy(), body_cdf, factor=2)
+
+    df_size = df_size.assign(**{
+        "가슴둘레_ease(cm)": chest_ease(df_size["가슴단면"], body_chest_circ_cm),
+        "착용 가능 인구(%)": size_korea.fit_percentile("가슴둘레", df_size["가슴단면"], factor=2, age_group=body_age_group),
+        **{f"{label}(%)": shares[:, k] * 100 for k, label in enumerate(FIT_LABELS)},
+    })
+    df_size["핏_분류(가슴둘레)"] = classify_fit(df_size["가슴둘레_ease(cm)"])
+
+    pop_share = pd.DataFrame({
+        "핏": list(FIT_LABELS),
+        "평균 인구 비중(%)": np.nanmean(shares, axis=0) * 100 if len(shares) else np.nan,
+    })
+    return df_size, pop_share
+
+
+def size_fit_vectors(df_long: pd.DataFrame, age_group: str, offsets: dict = None):
+    """사이즈 행 다항목 핏 (총장 구간 + 어깨/가슴/소매 ease). (행별 프레임, 항목별 핏 비중 표, 인체 기준값) 반환
+
+    offsets: {의류 항목: cm} 측정 정의 차이 보정 (fit_engine.FitRule.offset)
+    """
+    rules = with_offsets(FIT_RULES, **(offsets or {}))
+    body = body_references(age_group, rules)
+    df_fit = fit_vector_frame(df_long, body, rules)
+
+    tables = []
+    for r in rules:
+        counts = df_fit[f"{r.garment}_핏"].value_counts(sort=False)  # 분류 순서 유지, 결측 제외
+        total = int(counts.sum())
+        tables.append(pd.DataFrame({
+            "측정 항목": r.garment,
+            "핏": counts.index.astype(str),
+            "count": counts.to_numpy(dtype=int),
+            "pct(%)": counts.to_numpy() / total * 100 if total else 0.0,
+        }))
+    return df_fit, pd.concat(tables, ignore_index=True), body
+
+
+def _pct(n: int, total: int) -> float:
+    return n / total * 100 if total else 0
+
+
+def length_shares(cube, crop_thr: float = CROP_THR, mid_band=MID_BAND, top_k: int = None) -> dict:
+    """총장 크롭(<crop_thr) / 중간(mid_band, 양끝 포함) / 롱(>mid_band 상한) 개수와 비중"""
+    mid_low, mid_high = mid_band
+    crop_n = cube.count_below("총장", crop_thr, top_k)
+    _, mid_n, long_n, total_n = cube.band_counts("총장", mid_low, mid_high, top_k)
+    return {
+        "crop_n": crop_n, "mid_n": mid_n, "long_n": long_n, "total_n": total_n,
+        "crop_pct": _pct(crop_n, total_n), "mid_pct": _pct(mid_n, total_n), "long_pct": _pct(long_n, total_n),
+    }
+
+
+def sleeve_shares(cube, std_band=SLEEVE_STD_BAND, top_k: int = None) -> dict:
+    """소매길이 표준 구간(양끝 포함) / 비표준 개수와 비중"""
+    _, std_n, _, total_n = cube.band_counts("소매길이", *std_band, top_k)
+    std_pct = _pct(std_n, total_n)
+    return {
+        "std_n": std_n, "out_n": total_n - std_n, "total_n": total_n,
+        "std_pct": std_pct, "out_pct": 100 - std_pct if total_n else 0,
+    }
+
+
+# =========================
+# 스냅샷 하나 전체 분석
+# =========================
+def analyze_snapshot(info, top_k: int = TOP_K, crop_thr: float = CROP_THR, mid_band=MID_BAND,
+                     sleeve_band=SLEEVE_STD_BAND, fit_offsets: dict = None) -> dict:
+    """대시보드 각 페이지의 계산을 한 번에 수행. 표는 DataFrame, 요약은 JSON 직렬화 가능한 dict"""
+    snap = load_snapshot(info.path)
+    cube = load_cube(info.path)
+    body_age_group, body_circ = body_chest_reference(info.age_group)
+
+    df_ease = ease_frame(snap.df_avg, body_circ)
+    fit_share = fit_share_table(df_ease["핏_분류(가슴둘레)"])
+    df_size = load_columns(info.path, ["rank", "brand", "item_id", "row_key", "가슴단면"], table="sizes")
+    _, pop_share = size_row_fit(df_size.dropna(subset=["가슴단면"]), body_age_group, body_circ)
+    _, profiles = snapshot_brand_stats(info.path, body_circ)
+    _, size_fit_share, body_refs = size_fit_vectors(snap.df_long, info.age_group, fit_offsets)
+
+    summary = {
+        "snapshot": info.path.name.split(".")[0],
+        "category": info.category,
+        "age_group": info.age_group,
+        "crawl_date": info.crawl_date.isoformat() if info.crawl_date else None,
+        "top_n": info.top_n,
+        "valid_items": len(snap.df_avg),
+        "size_rows": len(snap.df_long),
+        "brands": int(snap.df_avg["brand"].nunique(dropna=True)),
+        "skipped": int(snap.meta.get("size_skipped_count", 0)) + int(snap.meta.get("size_fail_count", 0)),
+        "body_age_group": body_age_group,
+        "body_chest_circ_cm": body_circ,
+        "thresholds": {"top_k": top_k, "crop_thr": crop_thr, "mid_band": list(mid_band),
+                       "sleeve_band": list(sleeve_band)},
+        "length": {"all": length_shares(cube, crop_thr, mid_band),
+                   f"top{top_k}": length_shares(cube, crop_thr, mid_band, top_k)},
+        "sleeve": {"all": sleeve_shares(cube, sleeve_band),
+                   f"top{top_k}": sleeve_shares(cube, sleeve_band, top_k)},
+        "fit_share": dict(zip(fit_share["핏"].astype(str), fit_share["pct(%)"].round(2))),
+        "body_references_cm": body_refs,
+        "fit_offsets_cm": dict(fit_offsets or {}),
+        "size_fit_share": {
+            m: dict(zip(g["핏"], g["pct(%)"].round(2))) for m, g in size_fit_share.groupby("측정 항목", sort=False)
+        },
+        "measures": snap.df_long[MEASURES].describe().round(2).to_dict(),
+    }
+    return {
+        "summary": summary,
+        "products": df_ease.drop(columns=["rank_intensity"], errors="ignore"),
+        "brands": profiles,
+        "fit_share": fit_share,
+        "population_fit_share": pop_share,
+        "size_fit_share": size_fit_share,
+    }
+
+
+def write_report(report: dict, out_dir: Path) -> Path:
+    """out_dir/<snapshot>/ 아래에 summary.json + 표(csv) 저장"""
+    target = Path(out_dir) / report["summary"]["snapshot"]
+    target.mkdir(parents=True, exist_ok=True)
+    (target / "summary.json").write_text(
+        json.dumps(report["summary"], ensure_ascii=False, indent=2, default=float), encoding="utf-8"
+    )
+    for name, df in report.items():
+        if isinstance(df, pd.DataFrame):
+            df.to_csv(target / f"{name}.csv", index=False, encoding="utf-8-sig")
+    return target
+
+
+def process_snapshot(path: Path, out_dir: Path, options: dict) -> dict:
+    """프로세스 풀 작업 단위: 스냅샷 하나 분석 -> 저장 -> 요약 반환"""
+    info = parse_snapshot_name(path)
+    if info is None:
+        raise ValueError(f"스냅샷 파일명 규칙에 맞지 않습니다: {path}")
+    if not snapshot_exists(info.path):
+        raise FileNotFoundError(info.path)
+    report = analyze_snapshot(info, **options)
+    write_report(report, out_dir)
+    return report["summary"]
+
+
+def run_batch(paths, out_dir: Path = REPORT_DIR, workers: int = None, **options) -> list:
+    """여러 스냅샷을 프로세스 풀로 병렬 처리. 실패한 스냅샷은 error 항목으로 기록"""
+    paths = list(dict.fromkeys(Path(p) for p in paths))
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(process_snapshot, p, out_dir, options): p for p in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({"snapshot": path.name.split(".")[0], "error": f"{type(e).__name__}: {e}"})
+            print(f"[{len(results)}/{len(paths)}] {path.name}", file=sys.stderr)
+
+    results.sort(key=lambda r: r["snapshot"])
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    (Path(out_dir) / "index.json").write_text(
+        json.dumps(results, ensure_ascii=False, indent=2, default=float), encoding="utf-8"
+    )
+    return results
+
+
+# python pipeline.py                      (data/ 의 모든 스냅샷)
+# python pipeline.py data/musinsa_top100_age20_24.pkl --out reports --workers 4
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Streamlit 없이 스냅샷 분석 결과를 파일로 저장")
+    parser.add_argument("paths", nargs="*", type=Path, help="스냅샷 파일 (기본: data/의 모든 스냅샷)")
+    parser.add_argument("--age-group", default=None, help="예: 20–24세 (paths를 주지 않았을 때 필터)")
+    parser.add_argument("--category", default=None, help="예: suit_blazer (paths를 주지 않았을 때 필터)")
+    parser.add_argument("--out", type=Path, default=REPORT_DIR)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--top-k", type=int, default=TOP_K)
+    parser.add_argument("--crop-thr", type=float, default=CROP_THR)
+    parser.add_argument("--mid-band", type=float, nargs=2, default=MID_BAND, metavar=("LOW", "HIGH"))
+    parser.add_argument("--sleeve-band", type=float, nargs=2, default=SLEEVE_STD_BAND, metavar=("LOW", "HIGH"))
+    parser.add_argument("--shoulder-offset", type=float, default=0.0, help="어깨너비 -> 어깨사이길이 보정(cm)")
+    parser.add_argument("--sleeve-offset", type=float, default=0.0, help="소매길이 -> 팔길이 보정(cm)")
+    args = parser.parse_args()
+
+    if args.paths:
+        paths = args.paths
+    else:
+        paths = [
+            info.path for info in discover_snapshots()
+            if (args.age_group is None or info.age_group == args.age_group)
+            and (args.category is None or info.category == args.category)
+        ]
+    if not paths:
+        parser.error("처리할 스냅샷이 없습니다.")
+
+    results = run_batch(
+        paths,
+        args.out,
+        args.workers,
+        top_k=args.top_k,
+        crop_thr=args.crop_thr,
+        mid_band=tuple(args.mid_band),
+        sleeve_band=tuple(args.sleeve_band),
+        fit_offsets={"어깨너비": args.shoulder_offset, "소매길이": args.sleeve_offset},
+    )
+    failed = [r for r in results if "error" in r]
+    print(json.dumps({"done": len(results) - len(failed), "failed": failed}, ensure_ascii=False))
+    sys.exit(1 if failed else 0)
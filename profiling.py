@@ -0,0 +1,146 @@
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+# =========================
+# Opt-in 프로파일링 (rerun 단위 구간 시간 / 캐시 hit·miss / 메모리)
+# =========================
+# Streamlit은 세션마다 별도 스레드에서 스크립트를 실행하므로 현재 Profiler를 스레드별로 둔다.
+# 프로파일링이 꺼져 있으면 section()/record_cache()는 아무것도 하지 않는다.
+#   DASHBOARD_PROFILE=1          : 사이드바 토글 기본값을 켜고, 프로세스 시작 시 tracemalloc을 켬
+#   DASHBOARD_PROFILE_LOG=<경로> : rerun 결과를 JSON Lines로 계속 추가 기록
+# tracemalloc은 프로세스 전역이라 세션 토글로 켜고 끄지 않는다 (env opt-in일 때 프로세스 시작 시 한 번).
+# 메모리는 rerun 최대값(rerun 시작 때 reset_peak, 끝에서 get_traced_memory()[1])과
+# 구간마다 traced 메모리 증감(끝 - 시작)을 기록한다.
+# 다른 세션이 같은 시간에 실행 중이면 그 할당도 섞이고, 그 세션의 rerun 시작이 최대값을 다시 초기화할 수 있다.
+PROFILE_DEFAULT = os.environ.get("DASHBOARD_PROFILE", "") not in ("", "0")
+PROFILE_LOG = os.environ.get("DASHBOARD_PROFILE_LOG")
+
+if PROFILE_DEFAULT and not tracemalloc.is_tracing():
+    tracemalloc.start()
+
+_local = threading.local()
+
+
+def _traced_bytes():
+    """현재 traced 메모리 (tracemalloc이 꺼져 있으면 None)"""
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+
+
+class Profiler:
+    def __init__(self, label: str = ""):
+        self.label = label
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.sections = []  # (이름, 깊이, ms, traced 메모리 증감 bytes)
+        self.cache = {}  # 이름 -> {"hit": n, "miss": n}
+        self.start_bytes = _traced_bytes()
+        self.peak_bytes = None
+        self.total_ms = None
+        self._depth = 0
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def section(self, name: str):
+        depth = self._depth
+        self._depth += 1
+        idx = len(self.sections)
+        self.sections.append([name, depth, None, None])
+        mem = _traced_bytes()
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.sections[idx][2] = (time.perf_counter() - t) * 1000
+            if mem is not None and tracemalloc.is_tracing():
+                self.sections[idx][3] = _traced_bytes() - mem
+            self._depth = depth
+
+    def record_cache(self, name: str, hit: bool):
+        counts = self.cache.setdefault(name, {"hit": 0, "miss": 0})
+        counts["hit" if hit else "miss"] += 1
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self._t0) * 1000
+        if tracemalloc.is_tracing():
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+
+    def to_dict(self) -> dict:
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "total_ms": self.total_ms,
+            "peak_mb": None if self.peak_bytes is None else self.peak_bytes / 1024 / 1024,
+            "peak_increase_mb": (
+                None if self.peak_bytes is None or self.start_bytes is None
+                else (self.peak_bytes - self.start_bytes) / 1024 / 1024
+            ),
+            "sections": [
+                {"name": n, "depth": d, "ms": ms, "mem_delta_mb": None if mem is None else mem / 1024 / 1024}
+                for n, d, ms, mem in self.sections
+            ],
+            "cache": self.cache,
+        }
+
+
+def current():
+    return getattr(_local, "profiler", None)
+
+
+def start(label: str = "") -> Profiler:
+    """현재 스레드(rerun)의 프로파일링 시작. tracemalloc 최대값을 이 rerun부터 다시 잰다."""
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    _local.profiler = Profiler(label)
+    return _local.profiler
+
+
+def stop() -> Profiler:
+    """현재 rerun 프로파일링 종료. PROFILE_LOG가 있으면 한 줄 추가 기록"""
+    profiler = current()
+    _local.profiler = None
+    if profiler is None:
+        return None
+    profiler.finish()
+    if PROFILE_LOG:
+        with open(Path(PROFILE_LOG), "a", encoding="utf-8") as f:
+            f.write(json.dumps(profiler.to_dict(), ensure_ascii=False) + "\n")
+    return profiler
+
+
+@contextmanager
+def section(name: str):
+    profiler = current()
+    if profiler is None:
+        yield
+        return
+    with profiler.section(name):
+        yield
+
+
+def record_cache(name: str, hit: bool):
+    profiler = current()
+    if profiler is not None:
+        profiler.record_cache(name, hit)
+
+
+# st.cache_* 함수는 캐시 hit 여부를 알려주지 않으므로, 함수 본문(=miss일 때만 실행)에서
+# mark_cache_miss()를 부르고 호출부를 cache_probe()로 감싸 hit/miss를 구분한다.
+@contextmanager
+def cache_probe(name: str):
+    if current() is None:
+        yield
+        return
+    _local.missed = False
+    try:
+        yield
+    finally:
+        record_cache(name, hit=not _local.missed)
+
+
+def mark_cache_miss():
+    _local.missed = True
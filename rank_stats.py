@@ -0,0 +1,276 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+from pathlib import Path
+import argparse
+import os
+import sys
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy.stats import spearmanr
+
+from musinsa_data import MEASURES, load_columns, load_derived
+from pipeline import CROP_THR, MID_BAND, SLEEVE_STD_BAND, TOP_K
+
+# =========================
+# 랭킹 vs 실측 통계 검정 (순위 상관 / 부트스트랩 신뢰구간 / 순열 검정)
+# =========================
+# "상위 랭킹일수록 ○○로 수렴한다"는 해석을 Top k 비중 비교만이 아니라 검정으로 확인한다.
+# 재표본 단위는 상품이다 (같은 상품의 사이즈 행끼리는 독립이 아니므로 행 단위로 섞지 않는다).
+#   상품 × 특징 행렬 V: 항목별 [평균 계산용 개수·합, 중앙값 편차 합, 사이즈 행 수, 구간별 사이즈 행 수]
+#   통계량은 모두 "V 열 합의 비율"이라 재표본 하나 = 가중치 벡터 @ V
+#   - 순열 검정: 무작위 k개 상품을 Top으로 두는 0/1 행렬 @ V -> (Top − 나머지) 귀무분포
+#   - 부트스트랩: Top / 나머지 안에서 각각 복원추출한 횟수 행렬 @ V -> 백분위 신뢰구간
+# 재표본을 (재표본 × 상품) MAX_CELLS칸 이하 블록으로 나눠 행렬곱 한 번씩 처리하고,
+# 청크마다 독립 시드(SeedSequence.spawn)를 쓰므로 프로세스 수와 상관없이 결과가 같다.
+STAT_RESAMPLES = 10_000
+CHUNK_RESAMPLES = 2_000
+MAX_CELLS = 4_000_000
+ALPHA = 0.05
+# 분포 해석(views/musinsa.py)에서 말하는 중심 밀집 구간 (cm, 양끝 포함)
+CORE_BANDS = {"어깨너비": (42, 46), "가슴단면": (50, 56)}
+SIZE_COLUMNS = ["rank", "item_id", *MEASURES]
+
+
+def band_spec(crop_thr: float = CROP_THR, mid_band=MID_BAND, sleeve_band=SLEEVE_STD_BAND) -> dict:
+    """측정 항목 -> [(구간 이름, 하한, 상한)] (양끝 포함)
+
+    미만/초과는 경계 바로 안쪽 부동소수 값(nextafter)으로 바꿔 요약 큐브 구간과 같은 행을 센다.
+    """
+    mid_low, mid_high = mid_band
+    return {
+        "총장": [
+            (f"크롭(<{crop_thr})", -np.inf, np.nextafter(crop_thr, -np.inf)),
+            (f"중간({mid_low}–{mid_high})", mid_low, mid_high),
+            (f"롱(>{mid_high})", np.nextafter(mid_high, np.inf), np.inf),
+        ],
+        **{m: [(f"중심({lo}–{hi})", lo, hi)] for m, (lo, hi) in CORE_BANDS.items()},
+        "소매길이": [(f"표준({sleeve_band[0]}–{sleeve_band[1]})", *sleeve_band)],
+    }
+
+
+def product_features(df_long: pd.DataFrame, bands: dict):
+    """사이즈 행을 상품 단위로 합친다. (상품별 rank, 상품별 평균 (상품, 항목), V, 통계량 정의) 반환
+
+    통계량 정의: [(측정 항목, 통계량 이름, 분자 열, 분모 열, 배율)]
+    """
+    codes, _ = pd.factorize(df_long["item_id"], use_na_sentinel=False)
+    n = int(codes.max()) + 1 if len(codes) else 0
+    rank = np.full(n, np.inf)
+    np.minimum.at(rank, codes, df_long["rank"].to_numpy(dtype=float))
+
+    columns, stats, means = [], [], []
+
+    def add(values):
+        columns.append(values)
+        return len(columns) - 1
+
+    for m in MEASURES:
+        v = df_long[m].to_numpy(dtype=float)
+        ok = ~np.isnan(v)
+        rows = np.bincount(codes, weights=ok, minlength=n)
+        avg = np.bincount(codes, weights=np.where(ok, v, 0.0), minlength=n) / np.where(rows > 0, rows, np.nan)
+        has = ~np.isnan(avg)
+        dev = np.abs(avg - np.median(avg[has])) if has.any() else avg
+        means.append(avg)
+
+        n_col = add(has.astype(float))
+        stats.append((m, "평균(cm)", add(np.where(has, avg, 0.0)), n_col, 1.0))
+        stats.append((m, "중앙값 편차(cm)", add(np.where(has, dev, 0.0)), n_col, 1.0))
+        rows_col = add(rows)
+        for label, lo, hi in bands.get(m, []):
+            inside = np.bincount(codes, weights=ok & (v >= lo) & (v <= hi), minlength=n)
+            stats.append((m, f"{label} 비중(%)", add(inside), rows_col, 100.0))
+
+    V = np.column_stack(columns) if columns else np.zeros((n, 0))
+    return rank, np.column_stack(means), V, stats
+
+
+def _stat_values(sums: np.ndarray, stats) -> np.ndarray:
+    """V 열 합 (..., 열) -> 통계량 (..., 통계량). 분모가 0이면 NaN"""
+    num = sums[..., [s[2] for s in stats]]
+    den = sums[..., [s[3] for s in stats]]
+    scale = np.array([s[4] for s in stats])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(den > 0, num / den, np.nan) * scale
+
+
+def _resample_counts(rng, n_resamples: int, n: int) -> np.ndarray:
+    """(재표본, n) 복원추출 횟수 행렬"""
+    idx = rng.integers(0, n, size=(n_resamples, n), dtype=np.int32)
+    flat = idx + np.arange(n_resamples, dtype=np.int64)[:, None] * n
+    return np.bincount(flat.ravel(), minlength=n_resamples * n).reshape(n_resamples, n).astype(float)
+
+
+def _permutation_chunk(V: np.ndarray, k: int, stats, seed, n_resamples: int) -> np.ndarray:
+    """무작위 k개 상품을 Top으로 둔 (Top − 나머지) 통계량 n_resamples개"""
+    rng = np.random.default_rng(seed)
+    n = len(V)
+    total = V.sum(axis=0)
+    step = max(MAX_CELLS // max(n, 1), 1)
+    out = []
+    for lo in range(0, n_resamples, step):
+        b = min(step, n_resamples - lo)
+        top = np.argpartition(rng.random((b, n), dtype=np.float32), k - 1, axis=1)[:, :k]
+        mask = np.zeros((b, n))
+        np.put_along_axis(mask, top, 1.0, axis=1)
+        top_sums = mask @ V
+        out.append(_stat_values(top_sums, stats) - _stat_values(total - top_sums, stats))
+    return np.concatenate(out)
+
+
+def _bootstrap_chunk(V_top: np.ndarray, V_rest: np.ndarray, stats, seed, n_resamples: int):
+    """Top / 나머지를 각각 복원추출한 통계량 n_resamples개. (Top, 나머지) 반환"""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for V in (V_top, V_rest):
+        n = len(V)
+        step = max(MAX_CELLS // max(n, 1), 1)
+        out = []
+        for lo in range(0, n_resamples, step):
+            b = min(step, n_resamples - lo)
+            out.append(_stat_values(_resample_counts(rng, b, n) @ V, stats))
+        parts.append(np.concatenate(out))
+    return tuple(parts)
+
+
+def _run_chunks(fn, args, seeds, chunks, workers: int):
+    fixed = [repeat(a) for a in args]
+    if workers == 1 or len(chunks) <= 1:
+        return list(map(fn, *fixed, seeds, chunks))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, *fixed, seeds, chunks))
+
+
+@dataclass(frozen=True)
+class RankStats:
+    top_k: int
+    n_resamples: int
+    correlation: pd.DataFrame = field(repr=False)  # 항목별 Spearman (rank vs 평균 / 중앙값 편차)
+    tests: pd.DataFrame = field(repr=False)  # 통계량별 Top k vs 나머지 (신뢰구간 + 순열 p값)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.correlation.memory_usage(deep=True).sum() + self.tests.memory_usage(deep=True).sum())
+
+
+def rank_correlation(rank: np.ndarray, means: np.ndarray) -> pd.DataFrame:
+    """항목별 상품 단위 Spearman 순위 상관 (rank vs 평균, rank vs 중앙값과의 거리)
+
+    중앙값 편차와의 ρ > 0 이면 순위가 낮을수록(숫자가 클수록) 중앙값에서 멀다 = 상위가 수렴.
+    """
+    rows = []
+    for j, m in enumerate(MEASURES):
+        ok = ~np.isnan(means[:, j])
+        x, r = means[ok, j], rank[ok]
+        row = {"측정 항목": m, "상품 수": int(ok.sum())}
+        if ok.sum() > 2:
+            row["ρ(rank, 평균)"], row["p(평균)"] = spearmanr(r, x)
+            row["ρ(rank, 중앙값 편차)"], row["p(중앙값 편차)"] = spearmanr(r, np.abs(x - np.median(x)))
+        rows.append(row)
+    columns = ["측정 항목", "상품 수", "ρ(rank, 평균)", "p(평균)", "ρ(rank, 중앙값 편차)", "p(중앙값 편차)"]
+    return pd.DataFrame(rows, columns=columns)
+
+
+def rank_tests(df_long: pd.DataFrame, top_k: int = TOP_K, bands: dict = None, n_resamples: int = STAT_RESAMPLES,
+               alpha: float = ALPHA, seed: int = 0, workers: int = 1, chunk: int = CHUNK_RESAMPLES) -> RankStats:
+    """사이즈 행(df_long: rank, item_id, 측정 항목)으로 Top k vs 나머지 검정
+
+    - 평균 / 중앙값 편차: 상품 평균 실측 기준 (상품마다 한 표)
+    - 구간 비중: 사이즈 행 기준 (대시보드 비중과 같은 단위), 재표본은 상품 단위
+    - 신뢰구간: Top / 나머지 층화 부트스트랩 백분위 (1 − alpha)
+    - 순열 p값: |차이| 기준 양측, (1 + 극단 횟수) / (1 + 재표본 수)
+    """
+    if n_resamples < 1:
+        raise ValueError("n_resamples는 1 이상이어야 합니다.")
+    bands = band_spec() if bands is None else bands
+    rank, means, V, stats = product_features(df_long, bands)
+    is_top = rank <= top_k
+    k = int(is_top.sum())
+    if k == 0 or k == len(rank):
+        raise ValueError("Top k 안과 밖에 상품이 모두 있어야 합니다.")
+
+    observed_top = _stat_values(V[is_top].sum(axis=0), stats)
+    observed_rest = _stat_values(V[~is_top].sum(axis=0), stats)
+    observed = observed_top - observed_rest
+
+    chunks = [chunk] * (n_resamples // chunk) + ([n_resamples % chunk] if n_resamples % chunk else [])
+    perm_seq, boot_seq = np.random.SeedSequence(seed).spawn(2)
+    null = np.concatenate(_run_chunks(_permutation_chunk, (V, k, stats), perm_seq.spawn(len(chunks)), chunks, workers))
+    boot = _run_chunks(_bootstrap_chunk, (V[is_top], V[~is_top], stats), boot_seq.spawn(len(chunks)), chunks, workers)
+    boot_top = np.concatenate([b[0] for b in boot])
+    boot_rest = np.concatenate([b[1] for b in boot])
+
+    # 부동소수 오차로 관측값과 같은 순열이 빠지지 않도록 작은 허용오차
+    valid = ~np.isnan(null)
+    extreme = (np.abs(null) >= np.abs(observed) - 1e-9) & valid
+    with np.errstate(invalid="ignore"):
+        p_value = np.where(np.isnan(observed), np.nan, (1 + extreme.sum(axis=0)) / (1 + valid.sum(axis=0)))
+
+    q = [alpha / 2 * 100, (1 - alpha / 2) * 100]
+    with warnings.catch_warnings():
+        # 재표본에 해당 항목 값이 하나도 없으면(전부 NaN) 구간도 NaN으로 둔다.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        ci_top = np.nanpercentile(boot_top, q, axis=0)
+        ci_rest = np.nanpercentile(boot_rest, q, axis=0)
+        ci_diff = np.nanpercentile(boot_top - boot_rest, q, axis=0)
+
+    level = f"{(1 - alpha) * 100:g}%"
+    tests = pd.DataFrame({
+        "측정 항목": [s[0] for s in stats],
+        "통계량": [s[1] for s in stats],
+        f"Top {top_k}": observed_top,
+        f"Top {top_k} {level} 하한": ci_top[0],
+        f"Top {top_k} {level} 상한": ci_top[1],
+        "나머지": observed_rest,
+        f"나머지 {level} 하한": ci_rest[0],
+        f"나머지 {level} 상한": ci_rest[1],
+        "차이": observed,
+        f"차이 {level} 하한": ci_diff[0],
+        f"차이 {level} 상한": ci_diff[1],
+        "순열 p값": p_value,
+    })
+    return RankStats(top_k=top_k, n_resamples=n_resamples, correlation=rank_correlation(rank, means), tests=tests)
+
+
+def snapshot_rank_stats(path, top_k: int = TOP_K, crop_thr: float = CROP_THR, mid_band=MID_BAND,
+                        sleeve_band=SLEEVE_STD_BAND, n_resamples: int = STAT_RESAMPLES, seed: int = 0,
+                        workers: int = 1) -> RankStats:
+    """스냅샷별(인자 조합별) 검정 결과. 캐시 miss일 때만 재표본을 돌린다."""
+    def build():
+        df_long = load_columns(path, SIZE_COLUMNS, table="sizes")
+        bands = band_spec(crop_thr, tuple(mid_band), tuple(sleeve_band))
+        return rank_tests(df_long, top_k, bands, n_resamples, seed=seed, workers=workers)
+
+    key = ":".join(map(str, [top_k, crop_thr, *mid_band, *sleeve_band, n_resamples, seed]))
+    return load_derived(path, f"rank_stats:{key}", build)
+
+
+# =========================
+# CLI
+# =========================
+# python rank_stats.py data/musinsa_top100_age20_24.pkl --top-k 20 --resamples 10000 --workers 4
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Top k vs 나머지 상품 실측 통계 검정")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--top-k", type=int, default=TOP_K)
+    parser.add_argument("--crop-thr", type=float, default=CROP_THR)
+    parser.add_argument("--mid-band", type=float, nargs=2, default=MID_BAND, metavar=("LOW", "HIGH"))
+    parser.add_argument("--sleeve-band", type=float, nargs=2, default=SLEEVE_STD_BAND, metavar=("LOW", "HIGH"))
+    parser.add_argument("--resamples", type=int, default=STAT_RESAMPLES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", type=Path, default=None, help="검정 표 csv 저장 경로 (기본: stdout)")
+    args = parser.parse_args()
+
+    result = snapshot_rank_stats(
+        args.path, args.top_k, args.crop_thr, args.mid_band, args.sleeve_band,
+        args.resamples, args.seed, args.workers,
+    )
+    print(result.correlation.round(4).to_string(index=False), file=sys.stderr)
+    if args.out:
+        result.tests.to_csv(args.out, index=False, encoding="utf-8-sig")
+    else:
+        result.tests.to_csv(sys.stdout, index=False)
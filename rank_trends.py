@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+
+from musinsa_data import MEASURES, add_rank_intensity
+from pipeline import CROP_THR, MID_BAND, SLEEVE_STD_BAND, length_shares, sleeve_shares
+from summary_cube import build_cube
+
+# =========================
+# 순위 추이 (수집일 × Top-k 집계를 하루씩 이어붙임)
+# =========================
+# ingest가 하루치 크롤을 반영할 때 그날 순위(ranks)와 현재 상품 상태(derived)로
+# Top-k마다 한 줄씩 집계해 trend.arrow 뒤에 붙인다. 지난 날짜의 순위 파일은 다시 읽지 않는다.
+#   - 진입/이탈, 평균 순위 변동: 직전 수집일 순위 파일 하나와만 비교
+#     (지난 날짜가 늦게 들어오면 바로 다음 수집일의 직전이 바뀌므로 그 날 행만 update_churn으로 다시 계산)
+#   - 크롭/중간/롱, 소매 표준 구간 비중: pipeline.length_shares / sleeve_shares (상품 avg로 만든 큐브)
+#   - 측정 항목 평균: 단순 평균 + rank_intensity 가중 평균 (상위 상품일수록 크게 반영)
+# derived에는 그날의 실측만 남아 있으므로 실측 관련 값은 수집 당일에 집계해 두어야 한다.
+TREND_TOP_KS = (10, 20, 50, 100)
+TREND_COLUMNS = [
+    "crawl_date", "top_k", "items", "entered", "exited", "churn_pct", "rank_change",
+    "crop_pct", "mid_pct", "long_pct", "sleeve_std_pct",
+] + [f"{m}_{s}" for m in MEASURES for s in ("mean", "wmean")]
+CHURN_COLUMNS = ["entered", "exited", "churn_pct", "rank_change"]
+
+
+def _churn(rank: np.ndarray, item_ids: pd.Series, prev: pd.Series, k: int) -> dict:
+    """Top-k 진입/이탈/순위 변동 (rank, item_ids는 같은 순서, prev = 직전 수집일 item_id -> rank)"""
+    if prev is None:
+        return dict.fromkeys(CHURN_COLUMNS, np.nan)
+    in_top = rank <= k
+    top_ids = item_ids[in_top]
+    prev_top = prev[prev <= k]
+    stayed = top_ids.isin(prev_top.index).to_numpy()
+    entered = int((~stayed).sum())
+    moved = np.abs(rank[in_top][stayed] - prev_top.loc[top_ids[stayed]].to_numpy())
+    return {
+        "entered": entered,
+        "exited": int((~prev_top.index.isin(top_ids)).sum()),
+        "churn_pct": entered / in_top.sum() * 100 if in_top.any() else np.nan,
+        "rank_change": float(moved.mean()) if len(moved) else np.nan,
+    }
+
+
+def day_trend(stamp: str, ranks: pd.DataFrame, derived: pd.DataFrame, prev_ranks: pd.DataFrame = None,
+              top_ks=TREND_TOP_KS) -> pd.DataFrame:
+    """하루치 (item_id, rank)와 상품 상태(derived)로 Top-k별 집계 한 줄씩
+
+    prev_ranks(직전 수집일 순위)가 없으면 진입/이탈/순위 변동은 NaN.
+    """
+    avg_columns = [f"{m}_avg" for m in MEASURES]
+    items = ranks[["item_id", "rank"]].merge(derived[["item_id", *avg_columns]], on="item_id", how="left")
+    items = add_rank_intensity(items.sort_values("rank", kind="stable").reset_index(drop=True))
+    cube = build_cube(items.rename(columns=dict(zip(avg_columns, MEASURES))))
+
+    rank = items["rank"].to_numpy()
+    weight = items["rank_intensity"].to_numpy(dtype=float)
+    values = items[avg_columns].to_numpy(dtype=float)
+    prev = None if prev_ranks is None else prev_ranks.set_index("item_id")["rank"]
+
+    rows = []
+    for k in top_ks:
+        in_top = rank <= k
+        row = {"crawl_date": stamp, "top_k": k, "items": int(in_top.sum())}
+        row.update(_churn(rank, items["item_id"], prev, k))
+
+        length = length_shares(cube, CROP_THR, MID_BAND, k)
+        sleeve = sleeve_shares(cube, SLEEVE_STD_BAND, k)
+        row.update(crop_pct=length["crop_pct"], mid_pct=length["mid_pct"], long_pct=length["long_pct"],
+                   sleeve_std_pct=sleeve["std_pct"])
+
+        for j, m in enumerate(MEASURES):
+            v = values[in_top, j]
+            ok = ~np.isnan(v)
+            w = weight[in_top][ok]
+            row[f"{m}_mean"] = float(v[ok].mean()) if ok.any() else np.nan
+            row[f"{m}_wmean"] = float((w * v[ok]).sum() / w.sum()) if w.sum() > 0 else np.nan
+        rows.append(row)
+    return pd.DataFrame(rows, columns=TREND_COLUMNS)
+
+
+def append_trend(trend: pd.DataFrame, day: pd.DataFrame) -> pd.DataFrame:
+    """기존 추이에 하루치를 붙인다. 같은 수집일을 다시 넣으면 그날 행만 교체"""
+    keep = trend[~trend["crawl_date"].isin(day["crawl_date"])]
+    parts = [df for df in (keep, day) if not df.empty]
+    out = pd.concat(parts, ignore_index=True) if parts else day
+    return out.sort_values(["crawl_date", "top_k"]).reset_index(drop=True)
+
+
+def update_churn(trend: pd.DataFrame, stamp: str, ranks: pd.DataFrame, prev_ranks: pd.DataFrame) -> pd.DataFrame:
+    """stamp 행들의 진입/이탈/순위 변동만 prev_ranks(새 직전 수집일) 기준으로 다시 계산
+
+    실측 관련 값은 그날 derived로 집계한 것이라 그대로 둔다. stamp 행이 없으면 trend를 그대로 돌려준다.
+    """
+    rows = np.flatnonzero((trend["crawl_date"].astype(str) == stamp).to_numpy())
+    if not len(rows):
+        return trend
+    ranks = ranks.sort_values("rank", kind="stable").reset_index(drop=True)
+    rank = ranks["rank"].to_numpy()
+    prev = None if prev_ranks is None else prev_ranks.set_index("item_id")["rank"]
+
+    out = trend.copy()
+    for i in rows:
+        churn = _churn(rank, ranks["item_id"], prev, int(out.at[i, "top_k"]))
+        for c in CHURN_COLUMNS:
+            out.at[i, c] = churn[c]
+    return out
+
+
+def rank_trajectories(history: pd.DataFrame, item_ids) -> pd.DataFrame:
+    """순위 시계열에서 상품별 궤적 (행 = 수집일, 열 = item_id, Top 밖이면 NaN)"""
+    item_ids = list(item_ids)
+    dates = history["crawl_date"].astype(str)
+    part = history[history["item_id"].isin(item_ids)]
+    return (
+        pd.DataFrame({"crawl_date": dates[part.index], "item_id": part["item_id"], "rank": part["rank"]})
+        .pivot_table(index="crawl_date", columns="item_id", values="rank", aggfunc="min")
+        .reindex(index=sorted(dates.unique()), columns=item_ids)
+    )
@@ -0,0 +1,167 @@
+from dataclasses import dataclass, field
+import re
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from fit_engine import chest_ease
+from musinsa_data import MEASURES, load_columns, load_derived
+
+# =========================
+# 상품 검색 인덱스 (문자 n-gram 역색인 + 수치 정렬 배열)
+# =========================
+# 한국어는 띄어쓰기·조사 때문에 단어 단위 색인이 잘 맞지 않아 문자 bigram으로 색인한다.
+#   "크롭블레이저" -> 크롭, 롭블, 블레, 레이, 이저
+# 검색어의 bigram 게시 목록(posting list)을 교집합한 뒤, 후보에 대해서만 부분 문자열을 확인한다.
+# 수치 조건(총장<55, ease>16 등)은 컬럼별로 정렬해 둔 배열에서 이진 탐색으로 구간을 잘라
+# 상품 번호 집합을 얻으므로 프레임을 훑지 않는다.
+NGRAM = 2
+TEXT_COLUMNS = ["brand", "title", "item_id"]
+
+# 검색어 안의 조건에 쓸 수 있는 이름 -> 컬럼
+FIELD_ALIASES = {
+    **{m: f"{m}_avg" for m in MEASURES},
+    "ease": "가슴둘레_ease(cm)",
+    "이즈": "가슴둘레_ease(cm)",
+    "가격": "original_price",
+    "price": "original_price",
+    "순위": "rank",
+    "rank": "rank",
+}
+CONDITION_PATTERN = re.compile(r"^(?P<field>[^<>=\s]+)\s*(?P<op><=|>=|<|>|=)\s*(?P<value>-?\d+(?:\.\d+)?)$")
+
+
+def normalize(text) -> str:
+    """NFKC + 소문자 + 공백/기호 제거 (한글·영문·숫자만 남김)"""
+    if text is None or (isinstance(text, float) and np.isnan(text)):
+        return ""
+    text = unicodedata.normalize("NFKC", str(text)).lower()
+    return re.sub(r"[^0-9a-z가-힣]", "", text)
+
+
+def ngrams(text: str, n: int = NGRAM):
+    if len(text) < n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def parse_query(query: str):
+    """'크롭 블레이저 총장<55 ease>16' -> (["크롭", "블레이저"], [("총장_avg", "<", 55.0), ...])"""
+    words, conditions = [], []
+    for token in re.sub(r"\s*(<=|>=|<|>|=)\s*", r"\1", query).split():
+        match = CONDITION_PATTERN.match(token)
+        if match and match["field"].lower() in FIELD_ALIASES:
+            conditions.append((FIELD_ALIASES[match["field"].lower()], match["op"], float(match["value"])))
+        elif normalize(token):
+            words.append(normalize(token))
+    return words, conditions
+
+
+@dataclass(frozen=True)
+class SearchIndex:
+    df: pd.DataFrame = field(repr=False)
+    texts: np.ndarray = field(repr=False)  # 상품별 정규화 문자열 (후보 확인용)
+    postings: dict = field(repr=False)  # n-gram -> 정렬된 상품 번호
+    singles: dict = field(repr=False)  # 글자 1개 -> 정렬된 상품 번호 (한 글자 검색어용)
+    sorted_values: dict = field(repr=False)  # 컬럼 -> (정렬된 값, 같은 순서의 상품 번호)
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.df.memory_usage(index=True, deep=True).sum()
+            + sum(p.nbytes for p in self.postings.values())
+            + sum(p.nbytes for p in self.singles.values())
+            + sum(v.nbytes + i.nbytes for v, i in self.sorted_values.values())
+        )
+
+    def _text_ids(self, word: str):
+        grams = ngrams(word)
+        table = self.postings if len(word) >= NGRAM else self.singles
+        lists = [table.get(g) for g in grams]
+        if any(p is None for p in lists):
+            return np.array([], dtype=np.int32)
+        lists.sort(key=len)
+        ids = lists[0]
+        for p in lists[1:]:
+            ids = np.intersect1d(ids, p, assume_unique=True)
+            if not len(ids):
+                break
+        if len(word) > NGRAM:
+            # bigram이 모두 있어도 순서가 다를 수 있으므로 후보만 부분 문자열 확인
+            ids = ids[[word in self.texts[i] for i in ids]] if len(ids) else ids
+        return ids
+
+    def _condition_ids(self, column: str, op: str, value: float):
+        values, ids = self.sorted_values[column]
+        lo, hi = 0, len(values)
+        if op in ("<", "<="):
+            hi = np.searchsorted(values, value, side="left" if op == "<" else "right")
+        elif op in (">", ">="):
+            lo = np.searchsorted(values, value, side="right" if op == ">" else "left")
+        else:
+            lo = np.searchsorted(values, value, side="left")
+            hi = np.searchsorted(values, value, side="right")
+        return np.sort(ids[lo:hi])
+
+    def search(self, query: str = "", conditions=(), limit: int = None) -> pd.DataFrame:
+        """검색어(띄어쓴 단어는 AND) + 조건 [(컬럼, 연산자, 값)] 을 모두 만족하는 상품 (rank 순)"""
+        words, parsed = parse_query(query)
+        id_sets = [self._text_ids(w) for w in words]
+        id_sets += [self._condition_ids(*c) for c in [*parsed, *conditions]]
+        if not id_sets:
+            ids = np.arange(len(self.df))
+        else:
+            id_sets.sort(key=len)
+            ids = id_sets[0]
+            for other in id_sets[1:]:
+                ids = np.intersect1d(ids, other, assume_unique=True)
+        # 상품 번호는 rank 순으로 매겨져 있으므로 번호 순 = rank 순
+        if limit is not None:
+            ids = ids[:limit]
+        return self.df.iloc[ids]
+
+
+def build_search_index(df: pd.DataFrame, numeric_columns) -> SearchIndex:
+    df = df.sort_values("rank").reset_index(drop=True)
+    # normalize()와 같은 규칙을 컬럼 단위로 한 번에 적용. 컬럼 사이만 공백으로 구분
+    columns = [
+        df[c].astype("string").fillna("").str.normalize("NFKC").str.lower().str.replace(r"[^0-9a-z가-힣]", "", regex=True)
+        for c in TEXT_COLUMNS
+    ]
+    texts = columns[0].str.cat(columns[1:], sep=" ").to_numpy(dtype=object)
+
+    def invert(gram_sets):
+        # (n-gram, 상품 번호) 쌍을 펼친 뒤 n-gram 코드로 stable 정렬 -> 구간별로 자르면 번호가 정렬된 게시 목록
+        gram_sets = [list(g) for g in gram_sets]
+        doc = np.repeat(np.arange(len(gram_sets), dtype=np.int32), [len(g) for g in gram_sets])
+        codes, uniq = pd.factorize(pd.Series([g for gs in gram_sets for g in gs], dtype=object))
+        order = np.argsort(codes, kind="stable")
+        bounds = np.cumsum(np.bincount(codes, minlength=len(uniq)))[:-1]
+        return dict(zip(uniq, np.split(doc[order], bounds)))
+
+    # 컬럼 경계를 넘는 n-gram은 만들지 않는다.
+    postings = invert({w[i:i + NGRAM] for w in t.split() for i in range(max(len(w) - NGRAM + 1, 1))} for t in texts)
+    singles = invert(set(t.replace(" ", "")) for t in texts)
+
+    sorted_values = {}
+    for column in numeric_columns:
+        v = df[column].to_numpy(dtype=float)
+        ok = np.flatnonzero(~np.isnan(v))
+        order = ok[np.argsort(v[ok], kind="stable")]
+        sorted_values[column] = (v[order], order.astype(np.int32))
+
+    return SearchIndex(df=df, texts=texts, postings=postings, singles=singles, sorted_values=sorted_values)
+
+
+SEARCH_COLUMNS = ["rank", "brand", "item_id", "title", "url", "original_price"] + [f"{m}_avg" for m in MEASURES]
+
+
+def snapshot_search_index(path, body_chest_circ_cm: float = None) -> SearchIndex:
+    """스냅샷별로 한 번만 만드는 검색 인덱스 (가슴둘레 ease 포함)"""
+    def build():
+        df = load_columns(path, SEARCH_COLUMNS).copy()
+        df["가슴둘레_ease(cm)"] = chest_ease(df["가슴단면_avg"], body_chest_circ_cm)
+        return build_search_index(df, sorted(set(FIELD_ALIASES.values())))
+
+    return load_derived(path, f"search:{body_chest_circ_cm}", build)
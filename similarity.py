@@ -0,0 +1,184 @@
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from fit_engine import FIT_RULES, garment_target
+from musinsa_data import MEASURES, load_columns, load_derived, source_paths, update_derived
+from size_recommend import target_eases
+
+# =========================
+# 비슷한 핏 검색 (사이즈 행 실측 벡터 KD-tree)
+# =========================
+# 사이즈 행마다 (총장, 어깨너비, 가슴단면, 소매길이)를 측정 항목별 평균/표준편차로 표준화해
+# KD-tree에 넣고, 기준 사이즈(또는 목표 치수)와 가까운 순서로 k개를 찾는다.
+# 거리 = 표준화 좌표의 유클리드 거리 (항목마다 "표준편차 몇 개만큼 다른가")
+# 인체 치수 질의는 fit_engine 규칙으로 목표 의류 실측(인체 치수 + 목표 ease)으로 바꿔 같은 트리로 찾는다.
+# 일부 항목만 주어진 질의는 그 항목들로 만든 트리를 처음 쓸 때 만들어 재사용한다.
+# 캐시에 공유된 인덱스는 트리를 캐시 잠금 안에서 만들고 그 크기를 캐시 용량에 더한다 (update_derived).
+# 표준화 좌표는 스냅샷 옆(<stem>.similar.npz)에 배열로만 저장한다 (pickle 없음).
+# 트리는 읽을 때 다시 만들며, 스냅샷마다 한 번 만들어 load_derived 캐시에 둔다.
+SIMILAR_FORMAT = 2
+SIMILAR_CACHE_NAME = "similarity"
+ROW_COLUMNS = ["rank", "brand", "item_id", "row_key"]
+ALL_DIMS = tuple(range(len(MEASURES)))
+
+_TREE_LOCK = threading.Lock()  # 캐시 밖(source 없음) 인덱스용
+
+
+def similar_path(path: Path) -> Path:
+    """스냅샷 옆에 저장하는 유사도 인덱스 파일 경로 (<stem>.similar.npz)"""
+    path = Path(path)
+    return path.with_name(f"{path.name.split('.')[0]}.similar.npz")
+
+
+def _tree(x: np.ndarray, dims: tuple):
+    """dims 항목이 모두 있는 행으로 KD-tree. (트리, 원래 행 위치) 반환"""
+    pos = np.flatnonzero(~np.isnan(x[:, dims]).any(axis=1))
+    return cKDTree(x[np.ix_(pos, dims)], balanced_tree=False), pos
+
+
+@dataclass(frozen=True)
+class SimilarityIndex:
+    rows: pd.DataFrame = field(repr=False)  # df_long 순서의 rank/brand/item_id/row_key + 실측값
+    center: np.ndarray = field(repr=False)  # 측정 항목별 평균
+    scale: np.ndarray = field(repr=False)  # 측정 항목별 표준편차
+    x: np.ndarray = field(repr=False)  # (행 수, 항목 수) 표준화 좌표, 결측은 NaN
+    trees: dict = field(default_factory=dict, repr=False, compare=False)  # dims -> (트리, 행 위치)
+    source: Path = field(default=None, repr=False, compare=False)  # load_similarity 캐시의 스냅샷 경로
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.rows.memory_usage(index=True, deep=True).sum()
+            + self.x.nbytes
+            + sum(t.data.nbytes + t.indices.nbytes + pos.nbytes for t, pos in self.trees.values())
+        )
+
+    def tree(self, dims: tuple):
+        found = self.trees.get(dims)
+        if found is not None:
+            return found
+
+        def add(index):
+            if dims not in index.trees:  # 잠금을 기다리는 동안 다른 세션이 만들었을 수 있음
+                index.trees[dims] = _tree(index.x, dims)
+
+        if self.source is None:
+            with _TREE_LOCK:
+                add(self)
+        else:
+            update_derived(self.source, SIMILAR_CACHE_NAME, self, add)
+        return self.trees[dims]
+
+    def row_target(self, item_id: str, row_key: str) -> dict:
+        """상품의 한 사이즈 행 실측값을 질의용 dict로"""
+        row = self.rows[(self.rows["item_id"] == item_id) & (self.rows["row_key"] == row_key)]
+        return {m: float(row[m].iloc[0]) for m in MEASURES} if len(row) else {}
+
+    def nearest(self, target: dict, k: int = 10, per_product: bool = True, exclude_items=()) -> pd.DataFrame:
+        """target {측정 항목: cm} 와 가까운 사이즈 행 k개 (per_product면 상품당 가장 가까운 사이즈 하나)
+
+        target에 없는(또는 NaN인) 항목은 거리에서 빠진다.
+        """
+        dims = tuple(i for i, m in enumerate(MEASURES) if target.get(m) is not None and not np.isnan(target[m]))
+        if not dims:
+            raise ValueError("target에 측정 항목이 하나 이상 있어야 합니다.")
+        q = (np.array([target[MEASURES[i]] for i in dims]) - self.center[list(dims)]) / self.scale[list(dims)]
+        tree, pos = self.tree(dims)
+        exclude = set(exclude_items)
+
+        # 같은 상품의 다른 사이즈·제외 상품을 걸러내면 k개가 모자랄 수 있어 후보를 늘려 가며 조회
+        n_query = k
+        while True:
+            n_query = min(n_query * 4, len(pos))
+            if n_query == 0:
+                return self.rows.iloc[:0].assign(거리=[])
+            dist, idx = tree.query(q, k=n_query)
+            dist, idx = np.atleast_1d(dist), np.atleast_1d(idx)
+            found = self.rows.iloc[pos[idx]].assign(거리=dist)
+            if exclude:
+                found = found[~found["item_id"].isin(exclude)]
+            if per_product:
+                found = found.drop_duplicates("item_id")  # 거리 순이므로 첫 행이 가장 가까운 사이즈
+            if len(found) >= k or n_query == len(pos):
+                return found.head(k).reset_index(drop=True)
+
+    def nearest_to_body(self, body: dict, preferred: str = None, rules=FIT_RULES, k: int = 10,
+                        per_product: bool = True, exclude_items=()):
+        """인체 치수 {사이즈코리아 항목: cm} 기준 비슷한 핏 사이즈 행. (결과, 목표 의류 실측) 반환
+
+        fit_engine 규칙(factor, offset)으로 인체 치수 + 목표 ease(가슴은 선호 핏)를 의류 실측으로 바꿔
+        nearest()로 찾는다. 인체 대응이 없는 총장은 거리에서 빠진다.
+        """
+        target = garment_target(body, target_eases(preferred, rules), rules)
+        return self.nearest(target, k=k, per_product=per_product, exclude_items=exclude_items), target
+
+    def save(self, path: Path):
+        """표준화 좌표 / 평균 / 표준편차 / 행별 item_id를 npz로 저장 (트리는 저장하지 않음)
+
+        임시 파일에 쓴 뒤 교체하므로 다른 프로세스가 쓰다 만 파일을 읽지 않는다.
+        """
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                format=np.array(SIMILAR_FORMAT),
+                center=self.center,
+                scale=self.scale,
+                x=self.x,
+                item_id=self.rows["item_id"].astype(str).to_numpy(dtype=str),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path, rows: pd.DataFrame):
+        """저장된 좌표를 읽는다. 형식이나 행 순서가 다르면 None"""
+        with np.load(path, allow_pickle=False) as npz:
+            if "format" not in npz.files or int(npz["format"]) != SIMILAR_FORMAT:
+                return None
+            if len(npz["x"]) != len(rows) or not np.array_equal(npz["item_id"], rows["item_id"].astype(str).to_numpy(dtype=str)):
+                return None
+            return cls(rows=rows, center=npz["center"], scale=npz["scale"], x=npz["x"])
+
+
+def build_similarity(df_long: pd.DataFrame) -> SimilarityIndex:
+    """df_long에서 측정 항목별 표준화 좌표를 만든다. 트리는 질의할 때 만든다."""
+    rows = df_long[ROW_COLUMNS + MEASURES].reset_index(drop=True)
+    values = rows[MEASURES].astype(float)
+    center = values.mean().fillna(0.0).to_numpy()
+    scale = values.std(ddof=0).to_numpy()
+    scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+    return SimilarityIndex(rows=rows, center=center, scale=scale, x=(values.to_numpy() - center) / scale)
+
+
+def load_similarity(path: Path) -> SimilarityIndex:
+    """스냅샷의 유사도 인덱스. 저장된 파일이 없거나 스냅샷보다 오래됐으면 새로 만들어 저장해 둔다.
+
+    저장할 수 없는 위치(읽기 전용)면 저장은 건너뛰고 만든 인덱스만 쓴다.
+    """
+    path = Path(path)
+
+    def build():
+        rows = load_columns(path, ROW_COLUMNS + MEASURES, table="sizes")
+        saved = similar_path(path)
+        sources = source_paths(path)
+        index = None
+        if saved.exists() and all(saved.stat().st_mtime_ns >= p.stat().st_mtime_ns for p in sources):
+            index = SimilarityIndex.load(saved, rows.reset_index(drop=True))
+        if index is None:
+            index = build_similarity(rows)
+            try:
+                index.save(saved)  # 다음 프로세스는 다시 만들지 않고 읽는다
+            except OSError:
+                pass
+        # 네 항목 전체 트리는 로드 때 만들어 첫 캐시 용량에 포함 (부분 항목 트리는 tree()에서 추가)
+        index.trees[ALL_DIMS] = _tree(index.x, ALL_DIMS)
+        return replace(index, source=path)
+
+    return load_derived(path, SIMILAR_CACHE_NAME, build)
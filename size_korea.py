@@ -0,0 +1,189 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# =========================
+# 사이즈코리아 인체치수 요약 통계 (원자료 단위: mm)
+# =========================
+# data/size_korea.csv 한 행 = (측정항목, 측정방식, 성별, 연령대) 하나
+# 새 항목·연령대는 csv에 행을 추가하면 코드 수정 없이 반영된다.
+SIZE_KOREA_FILE = Path(__file__).resolve().parent / "data" / "size_korea.csv"
+
+PERCENTILES = [1, 5, 10, 25, 50, 75, 90, 95, 99]
+PCT_COLUMNS = [f"p{p}" for p in PERCENTILES]
+KEY_COLUMNS = ["measurement", "method", "sex", "age_group"]
+
+DEFAULT_METHOD = "3차원 자동측정"
+DEFAULT_SEX = "여성"
+DEFAULT_AGE_GROUP = "20–24세"
+
+
+def to_cm(mm):
+    return round(mm / 10.0, 1)
+
+
+# =========================
+# 백분위 표 -> 보간 CDF (균일 격자 lookup)
+# =========================
+CDF_STEP_CM = 0.05
+
+
+@dataclass(frozen=True)
+class PercentileCDF:
+    """(Min, 1th..99th, Max) 백분위 표를 선형보간한 CDF.
+
+    격자 간격(0.05cm)이 원자료 해상도(1mm)를 나누므로 모든 백분위 값이 격자점에 놓이고,
+    격자 사이 선형보간 결과는 np.interp(백분위 표)와 같다. 조회 시 이진 탐색 없이
+    인덱스 계산만 하므로 배열 전체를 한 번에 처리한다.
+    """
+    values: np.ndarray = field(repr=False)
+    probs: np.ndarray = field(repr=False)
+    x0: float
+    step: float
+    grid: np.ndarray = field(repr=False)
+
+    @classmethod
+    def from_points(cls, values, probs, step: float = CDF_STEP_CM):
+        values = np.asarray(values, dtype=float)
+        probs = np.asarray(probs, dtype=float)
+        x0 = np.floor(values[0] / step) * step
+        n = int(np.ceil((values[-1] - x0) / step)) + 1
+        grid = np.interp(x0 + step * np.arange(n), values, probs)
+        return cls(values=values, probs=probs, x0=x0, step=step, grid=grid)
+
+    def cdf(self, x) -> np.ndarray:
+        """x(cm) 이하인 인구 비율 (0–1). 결측은 NaN"""
+        pos = (np.asarray(x, dtype=float) - self.x0) / self.step
+        missing = np.isnan(pos)
+        pos = np.clip(np.where(missing, 0, pos), 0, len(self.grid) - 1)
+        idx = np.minimum(pos.astype(np.intp), len(self.grid) - 2)
+        frac = pos - idx
+        out = self.grid[idx] * (1 - frac) + self.grid[idx + 1] * frac
+        return np.where(missing, np.nan, out)
+
+    def ppf(self, q) -> np.ndarray:
+        """누적확률 q(0–1)에 해당하는 치수(cm)"""
+        return np.interp(q, self.probs, self.values)
+
+
+@dataclass(frozen=True)
+class SizeKoreaData:
+    """(measurement, method, sex, age_group) 인덱스로 조회하는 요약 통계.
+
+    표시용 cm 표와 백분위 CDF 배열은 로딩 시 한 번만 만든다.
+    """
+    table: pd.DataFrame = field(repr=False)
+    frames: dict = field(repr=False)
+    cdfs: dict = field(repr=False)
+    indexes: dict = field(repr=False)
+
+    def measurements(self, sex: str = DEFAULT_SEX, age_group: str = DEFAULT_AGE_GROUP):
+        rows = self.table.xs((sex, age_group), level=["sex", "age_group"])
+        return list(dict.fromkeys(rows.index.get_level_values("measurement")))
+
+    def age_groups(self, sex: str = DEFAULT_SEX):
+        rows = self.table.xs(sex, level="sex")
+        return list(dict.fromkeys(rows.index.get_level_values("age_group")))
+
+    def has(self, measurement: str, method: str = DEFAULT_METHOD, sex: str = DEFAULT_SEX,
+            age_group: str = DEFAULT_AGE_GROUP) -> bool:
+        return (measurement, method, sex, age_group) in self.table.index
+
+    def label_en(self, measurement: str) -> str:
+        return self.table.xs(measurement, level="measurement")["measurement_en"].iloc[0]
+
+    def stats_frame(self, measurement: str, sex: str = DEFAULT_SEX, age_group: str = DEFAULT_AGE_GROUP) -> pd.DataFrame:
+        """페이지에 표시하는 형태(cm)의 요약 통계표 (측정방식별 1행)"""
+        return self.frames[(measurement, sex, age_group)]
+
+    def stat(self, measurement: str, stat: str = "mean", method: str = DEFAULT_METHOD,
+             sex: str = DEFAULT_SEX, age_group: str = DEFAULT_AGE_GROUP) -> float:
+        """통계값(cm). stat: mean / sd / min / max / p1 … p99"""
+        column = stat if stat in PCT_COLUMNS else f"{stat}_mm"
+        return float(self.table.loc[(measurement, method, sex, age_group), column]) / 10.0
+
+    def cdf_points(self, measurement: str, method: str = DEFAULT_METHOD, sex: str = DEFAULT_SEX,
+                   age_group: str = DEFAULT_AGE_GROUP):
+        """(Min, 1th..99th, Max) -> 누적확률 (0, .01..99, 1) 의 (값(cm), 확률) 배열"""
+        return self.cdfs[(measurement, method, sex, age_group)]
+
+    def percentile_index(self, measurement: str, method: str = DEFAULT_METHOD, sex: str = DEFAULT_SEX,
+                         age_group: str = DEFAULT_AGE_GROUP) -> PercentileCDF:
+        return self.indexes[(measurement, method, sex, age_group)]
+
+    def fit_percentile(self, measurement: str, garment, factor: float = 1.0, ease: float = 0.0,
+                       method: str = DEFAULT_METHOD, sex: str = DEFAULT_SEX,
+                       age_group: str = DEFAULT_AGE_GROUP) -> np.ndarray:
+        """의류 치수 배열 -> 그 옷이 ease 이상 여유를 두고 맞는 인구 백분위(0–100)
+
+        인체 치수 ≤ factor × garment − ease 인 인구 비율. (가슴단면은 factor=2)
+        """
+        body_limit = factor * np.asarray(garment, dtype=float) - ease
+        return self.percentile_index(measurement, method, sex, age_group).cdf(body_limit) * 100
+
+
+def _stats_frame(rows: pd.DataFrame) -> pd.DataFrame:
+    out = pd.DataFrame({
+        "측정방식": rows["method"].to_numpy(),
+        "N": rows["N"].to_numpy(),
+        "Mean(cm)": [to_cm(v) for v in rows["mean_mm"]],
+        "SD(cm)": [round(v / 10.0, 2) for v in rows["sd_mm"]],
+        "Min(cm)": [to_cm(v) for v in rows["min_mm"]],
+        "Max(cm)": [to_cm(v) for v in rows["max_mm"]],
+    })
+    for p, col in zip(PERCENTILES, PCT_COLUMNS):
+        out[f"{p}th"] = [to_cm(v) for v in rows[col]]
+    return out
+
+
+@lru_cache(maxsize=4)
+def _load(path: str, mtime_ns: int) -> SizeKoreaData:
+    raw = pd.read_csv(path)
+    table = raw.set_index(KEY_COLUMNS)
+
+    frames = {
+        key: _stats_frame(rows)
+        for key, rows in raw.groupby(["measurement", "sex", "age_group"], sort=False)
+    }
+
+    probs = np.array([0, *PERCENTILES, 100], dtype=float) / 100.0
+    values = raw[["min_mm", *PCT_COLUMNS, "max_mm"]].to_numpy(dtype=float) / 10.0
+    cdfs = {
+        tuple(key): (values[i], probs)
+        for i, key in enumerate(raw[KEY_COLUMNS].itertuples(index=False, name=None))
+    }
+    indexes = {key: PercentileCDF.from_points(*points) for key, points in cdfs.items()}
+    return SizeKoreaData(table=table, frames=frames, cdfs=cdfs, indexes=indexes)
+
+
+def load_size_korea(path: Path = SIZE_KOREA_FILE) -> SizeKoreaData:
+    """csv를 읽어 SizeKoreaData 반환 (파일 수정시각이 같으면 캐시 재사용)"""
+    path = Path(path).resolve()
+    return _load(str(path), path.stat().st_mtime_ns)
+
+
+# =========================
+# 기본 데이터셋(20–24세 여성) 단축 함수
+# =========================
+def stats_frame(measurement: str, sex: str = DEFAULT_SEX, age_group: str = DEFAULT_AGE_GROUP) -> pd.DataFrame:
+    return load_size_korea().stats_frame(measurement, sex, age_group)
+
+
+def cdf_points(measurement: str, method: str = DEFAULT_METHOD, sex: str = DEFAULT_SEX,
+               age_group: str = DEFAULT_AGE_GROUP):
+    return load_size_korea().cdf_points(measurement, method, sex, age_group)
+
+
+def body_reference(measurement: str, stat: str = "mean", method: str = DEFAULT_METHOD,
+                   sex: str = DEFAULT_SEX, age_group: str = DEFAULT_AGE_GROUP) -> float:
+    """ease 계산용 인체 기준값(cm)"""
+    return load_size_korea().stat(measurement, stat, method, sex, age_group)
+
+
+def fit_percentile(measurement: str, garment, factor: float = 1.0, ease: float = 0.0,
+                   method: str = DEFAULT_METHOD, sex: str = DEFAULT_SEX,
+                   age_group: str = DEFAULT_AGE_GROUP) -> np.ndarray:
+    return load_size_korea().fit_percentile(measurement, garment, factor, ease, method, sex, age_group)
@@ -0,0 +1,155 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from fit_engine import FIT_RULES, fit_codes, with_offsets
+from musinsa_data import load_columns, load_derived
+
+# =========================
+# 체형 입력 -> 상품별 추천 사이즈
+# =========================
+# 스냅샷마다 한 번, 사이즈 행을 상품별로 연속 배치한 배열(SizeIndex)을 만들어 둔다.
+#   garment[:, j] = factor × 의류 실측 + offset  (인체 대응 항목: 어깨/가슴/소매)
+# 질의(방문자 한 명)는 DataFrame 연산 없이 배열 몇 번 + 상품 단위 최소값만 계산한다.
+#   1) ease = garment − 인체 치수, 모든 항목 ease ≥ 0 인 사이즈만 후보 (어깨/소매 결측은 판정 제외)
+#   2) 점수 = |가슴둘레 ease − 선호 핏 목표 ease| (cm)
+#   3) 상품별 점수 최소 사이즈 = 추천 사이즈, 점수 순(같으면 rank 순)으로 정렬
+PRIMARY = "가슴단면"
+DEFAULT_PREFERRED = "레귤러/베이직핏"
+PRODUCT_COLUMNS = ["rank", "brand", "item_id", "title", "url", "original_price"]
+
+
+def preferred_ease(rule=None) -> dict:
+    """핏 분류 -> 목표 가슴둘레 ease(cm). 구간 중앙값, 마지막(열린) 구간은 경계 + 직전 구간 폭의 절반"""
+    rule = rule or next(r for r in FIT_RULES if r.garment == PRIMARY)
+    edges = list(rule.edges)
+    targets = {label: (lo + hi) / 2 for label, lo, hi in zip(rule.labels[1:], edges, edges[1:])}
+    targets[rule.labels[-1]] = edges[-1] + (edges[-1] - edges[-2]) / 2
+    return targets
+
+
+def target_eases(preferred: str = None, rules=FIT_RULES, primary: str = PRIMARY) -> dict:
+    """인체 대응 항목별 목표 ease(cm). 가슴(primary)은 선호 핏, 나머지는 0 이상 첫 구간(정어깨·손목 길이) 중앙값"""
+    targets = {}
+    for r in rules:
+        if r.body is None:
+            continue
+        label = (preferred or DEFAULT_PREFERRED) if r.garment == primary else r.labels[1]
+        targets[r.garment] = preferred_ease(r)[label]
+    return targets
+
+
+@dataclass(frozen=True)
+class SizeIndex:
+    rules: tuple = field(repr=False)  # 인체 대응이 있는 FitRule (offset 반영)
+    garment: np.ndarray = field(repr=False)  # (사이즈 행, 규칙) factor × 실측 + offset, 상품별 연속
+    row_keys: np.ndarray = field(repr=False)  # 사이즈 행 이름
+    product: np.ndarray = field(repr=False)  # 사이즈 행 -> 상품 번호
+    starts: np.ndarray = field(repr=False)  # 상품별 첫 사이즈 행 위치
+    products: pd.DataFrame = field(repr=False)  # 상품 번호 순 메타 (rank/brand/title/...)
+    primary: int
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.garment.nbytes + self.row_keys.nbytes + self.product.nbytes + self.starts.nbytes
+            + self.products.memory_usage(index=True, deep=True).sum()
+        )
+
+    def recommend(self, body: dict, preferred: str = None, target_ease: float = None,
+                  limit: int = None, include_unfit: bool = False) -> pd.DataFrame:
+        """body {인체 항목: cm} -> 상품별 추천 사이즈와 예상 핏 (목표 ease에 가까운 순)
+
+        target_ease를 주지 않으면 preferred(핏 분류 이름, 기본 DEFAULT_PREFERRED)의 목표 ease를 쓴다.
+        include_unfit이면 맞는 사이즈가 없는 상품도 맨 뒤에 row_key 없이 붙인다.
+        """
+        if target_ease is None:
+            target_ease = preferred_ease(self.rules[self.primary])[preferred or DEFAULT_PREFERRED]
+        body_vec = np.array([body[r.body] for r in self.rules], dtype=float)
+        ease = self.garment - body_vec
+
+        p = self.primary
+        fits = ease[:, p] >= 0  # 결측(NaN)은 False
+        others = np.delete(ease, p, axis=1)
+        fits &= ~(others < 0).any(axis=1)
+        score = np.where(fits, np.abs(ease[:, p] - target_ease), np.inf)
+
+        # 상품별 최소 점수 -> 그 점수를 가진 첫 사이즈 행
+        best_score = np.minimum.reduceat(score, self.starts) if len(score) else score
+        is_best = score == best_score[self.product]
+        rows = np.flatnonzero(is_best & np.isfinite(score))
+        _, first = np.unique(self.product[rows], return_index=True)
+        rows = rows[first]
+
+        found = np.isfinite(best_score)
+        order = np.flatnonzero(found)
+        order = order[np.lexsort((self.products["rank"].to_numpy()[order], best_score[order]))]
+        if include_unfit:
+            order = np.concatenate([order, np.flatnonzero(~found)])
+        if limit is not None:
+            order = order[:limit]
+
+        # 상품 번호 -> 추천 사이즈 행 (없으면 -1)
+        best_row = np.full(len(self.starts), -1)
+        best_row[self.product[rows]] = rows
+        picked = best_row[order]
+        has = picked >= 0
+        out = self.products.iloc[order].reset_index(drop=True)
+        out["추천 사이즈"] = np.where(has, self.row_keys[np.maximum(picked, 0)], None)
+        out["목표 차이(cm)"] = best_score[order]
+        for j, r in enumerate(self.rules):
+            e = np.where(has, ease[np.maximum(picked, 0), j], np.nan)
+            out[f"{r.garment}_ease(cm)"] = e
+            codes = np.where(has, fit_codes(e, r.edges, r.closed_right), -1)
+            out[f"{r.garment}_핏"] = pd.Categorical.from_codes(codes, categories=list(r.labels), ordered=True)
+        return out
+
+
+def build_size_index(df_long: pd.DataFrame, products: pd.DataFrame = None, rules=FIT_RULES,
+                     primary: str = PRIMARY) -> SizeIndex:
+    """사이즈 행(df_long)을 상품별로 모아 추천용 배열을 만든다. products는 item_id별 표시용 메타"""
+    rules = tuple(r for r in rules if r.body is not None)
+    # 첫 등장(rank) 순서로 상품 번호 -> stable 정렬로 같은 상품의 사이즈 행을 연속 배치
+    codes, _ = pd.factorize(df_long["item_id"], use_na_sentinel=False)
+    order = np.argsort(codes, kind="stable")
+    rows = df_long.iloc[order].reset_index(drop=True)
+    product = codes[order]
+    starts = np.flatnonzero(np.diff(product, prepend=-1)) if len(rows) else np.array([], dtype=np.intp)
+
+    if products is not None:
+        meta = rows.iloc[starts][["item_id"]].merge(products.drop_duplicates("item_id"), on="item_id", how="left")
+    else:
+        meta = rows.iloc[starts][[c for c in ["rank", "brand", "item_id"] if c in rows.columns]]
+    meta = meta.reset_index(drop=True)
+
+    garment = np.column_stack([r.factor * rows[r.garment].to_numpy(dtype=float) + r.offset for r in rules])
+    return SizeIndex(
+        rules=rules,
+        garment=garment,
+        row_keys=rows["row_key"].to_numpy(dtype=object),
+        product=product,
+        starts=starts,
+        products=meta,
+        primary=[r.garment for r in rules].index(primary),
+    )
+
+
+def snapshot_size_index(path, offsets: dict = None) -> SizeIndex:
+    """스냅샷별(보정값별) 추천 인덱스. 캐시 miss일 때만 만든다."""
+    offsets = dict(offsets or {})
+    rules = with_offsets(FIT_RULES, **offsets)
+
+    def build():
+        columns = ["rank", "item_id", "row_key", *[r.garment for r in rules if r.body is not None]]
+        df_long = load_columns(path, columns, table="sizes")
+        return build_size_index(df_long, load_columns(path, PRODUCT_COLUMNS), rules)
+
+    key = ":".join(f"{k}={v}" for k, v in sorted(offsets.items()))
+    return load_derived(path, f"size_index:{key}", build)
+
+
+def recommend_sizes(path, body: dict, preferred: str = None, offsets: dict = None, limit: int = None,
+                    include_unfit: bool = False) -> pd.DataFrame:
+    """스냅샷 상품별 추천 사이즈 (import용 단축 함수)"""
+    return snapshot_size_index(path, offsets).recommend(body, preferred, limit=limit, include_unfit=include_unfit)
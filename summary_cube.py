@@ -0,0 +1,180 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from musinsa_data import MEASURES, load_columns, load_derived, source_paths
+
+# =========================
+# 요약 집계 큐브 (rank 정렬 배열 + 블록 단위 2차원 prefix sum)
+# =========================
+# 측정 항목마다 결측이 아닌 사이즈 행을 rank 순으로 정렬해 (ranks, vals)로 두고,
+# BLOCK행마다 한 줄씩 값 키(key)별 누적 히스토그램을 저장한다.
+#   cum[b, j] = (앞에서 b×BLOCK개 행 중 key ≤ keys[j] 인 행 수)
+# key는 0.1cm 고정 격자(GRID_PER_CM) 기준이라 열 수가 행 수가 아니라 값 범위에 비례한다.
+#   격자점 g/10과 정확히 같은 값 -> 2g,  (g/10, (g+1)/10) 사이 값 -> 2g + 1
+# (top_k, x) 질의: ranks에서 이진 탐색으로 prefix 길이 p -> cum[p // BLOCK] 한 칸
+#                 + 마지막 블록 나머지(BLOCK개 미만)만 직접 비교.
+#   x가 격자점이면(슬라이더 값) 표만으로 정확하고, 격자 사이 x는 그 칸의 격자 밖 행(off_*)만
+#   위치 순으로 잘라 비교한다. 실측표 값은 대부분 0.5cm 단위라 격자 밖 행은 드물다.
+# 크롭/중간/롱, 소매 표준 구간 같은 비중을 df_long을 다시 훑지 않고 계산한다.
+# 메모리는 행 수에 비례 (행당 12B + 격자 밖 행당 12B + 블록당 key 수 × 4B, key 수 ≤ 값 범위 × 20)
+BLOCK = 256
+GRID_PER_CM = 10
+CUBE_FORMAT = 3
+ARRAYS = ("ranks", "vals", "keys", "cum", "off_keys", "off_pos")
+
+
+def cube_path(path: Path) -> Path:
+    """스냅샷 옆에 저장하는 큐브 파일 경로 (<stem>.cube.npz)"""
+    path = Path(path)
+    return path.with_name(f"{path.name.split('.')[0]}.cube.npz")
+
+
+def _grid_index(v: np.ndarray) -> np.ndarray:
+    """g/10 ≤ v < (g+1)/10 인 정수 g (v×10의 부동소수 오차 보정)"""
+    g = np.floor(v * GRID_PER_CM)
+    g -= g / GRID_PER_CM > v
+    g += (g + 1) / GRID_PER_CM <= v
+    return g.astype(np.int64)
+
+
+def value_keys(v: np.ndarray) -> np.ndarray:
+    """값 -> key (격자점이면 2g, 격자 사이면 2g + 1). key 순서 = 값 순서"""
+    g = _grid_index(v)
+    return 2 * g + (g / GRID_PER_CM != v)
+
+
+@dataclass(frozen=True)
+class SummaryCube:
+    max_rank: int
+    ranks: dict = field(repr=False)  # m -> rank 오름차순 (결측 행 제외)
+    vals: dict = field(repr=False)  # m -> ranks와 같은 순서의 값 (원래 값 그대로)
+    keys: dict = field(repr=False)  # m -> 등장한 key (오름차순)
+    cum: dict = field(repr=False)  # m -> (블록 수 + 1, len(keys)) 누적 개수
+    off_keys: dict = field(repr=False)  # m -> 격자 밖 행의 key ((key, 위치) 순 정렬)
+    off_pos: dict = field(repr=False)  # m -> 같은 순서의 rank 정렬 위치
+
+    @property
+    def nbytes(self) -> int:
+        return int(sum(a.nbytes for name in ARRAYS for a in getattr(self, name).values()))
+
+    def value_range(self, m: str):
+        """값을 모두 포함하는 격자 범위 (슬라이더 경계용)"""
+        keys = self.keys[m]
+        if not len(keys):
+            return (np.nan, np.nan)
+        return (float(keys[0] // 2) / GRID_PER_CM, float((keys[-1] + 1) // 2) / GRID_PER_CM)
+
+    def total(self, m: str, top_k=None) -> int:
+        """rank ≤ top_k 이고 결측이 아닌 사이즈 행 수 (= 정렬 배열의 prefix 길이)"""
+        if top_k is None:
+            return len(self.ranks[m])
+        ranks = self.ranks[m]
+        # 키를 배열 dtype(int32)으로 맞춰야 searchsorted가 배열 전체를 변환·복사하지 않는다.
+        return int(np.searchsorted(ranks, ranks.dtype.type(min(top_k, np.iinfo(ranks.dtype).max)), side="right"))
+
+    def count_below(self, m: str, x: float, top_k=None, inclusive: bool = False) -> int:
+        """값 < x (inclusive=True면 ≤ x) 인 사이즈 행 수"""
+        p = self.total(m, top_k)
+        b = p // BLOCK
+        g = int(_grid_index(np.array([x], dtype=float))[0])
+        keys = self.keys[m]
+
+        if g / GRID_PER_CM == x:
+            # 격자점: key 2g(= x)를 포함할지만 정하면 표만으로 정확
+            j = int(np.searchsorted(keys, 2 * g, side="right" if inclusive else "left"))
+            partial = 0
+        else:
+            # 격자 사이: key ≤ 2g 는 모두 x 미만, key 2g + 1 칸은 블록 구간의 격자 밖 행만 직접 비교
+            j = int(np.searchsorted(keys, 2 * g, side="right"))
+            off_keys, off_pos = self.off_keys[m], self.off_pos[m]
+            lo, hi = np.searchsorted(off_keys, [2 * g + 1, 2 * g + 2])
+            cut = lo + int(np.searchsorted(off_pos[lo:hi], b * BLOCK))
+            cell = self.vals[m][off_pos[lo:cut]]
+            partial = int(np.count_nonzero(cell <= x if inclusive else cell < x))
+
+        base = int(self.cum[m][b, j - 1]) if j else 0
+        tail = self.vals[m][b * BLOCK:p]
+        return base + partial + int(np.count_nonzero(tail <= x if inclusive else tail < x))
+
+    def band_counts(self, m: str, low: float, high: float, top_k=None):
+        """(low 미만, low–high 포함, high 초과, 전체) 개수"""
+        below = self.count_below(m, low, top_k)
+        upto_high = self.count_below(m, high, top_k, inclusive=True)
+        total = self.total(m, top_k)
+        return below, upto_high - below, total - upto_high, total
+
+    def save(self, path: Path):
+        arrays = {
+            "format": np.array(CUBE_FORMAT),
+            "max_rank": np.array(self.max_rank),
+            "measures": np.array(list(self.keys)),
+        }
+        for i, m in enumerate(self.keys):
+            for name in ARRAYS:
+                arrays[f"{name}_{i}"] = getattr(self, name)[m]
+        np.savez(path, **arrays)
+
+    @classmethod
+    def load(cls, path: Path):
+        """저장된 큐브를 읽는다. 형식이 다르면(이전 버전 파일) None"""
+        with np.load(path, allow_pickle=False) as npz:
+            if "format" not in npz.files or int(npz["format"]) != CUBE_FORMAT:
+                return None
+            measures = [str(m) for m in npz["measures"]]
+            return cls(
+                max_rank=int(npz["max_rank"]),
+                **{name: {m: npz[f"{name}_{i}"] for i, m in enumerate(measures)} for name in ARRAYS},
+            )
+
+
+def build_cube(df_long: pd.DataFrame, measures=MEASURES) -> SummaryCube:
+    """df_long(rank + 측정 항목 컬럼)에서 큐브를 만든다. rank 정렬 한 번 + 측정 항목마다 bincount"""
+    order = np.argsort(df_long["rank"].to_numpy(), kind="stable")
+    rank = df_long["rank"].to_numpy()[order].astype(np.int32)
+
+    arrays = {name: {} for name in ARRAYS}
+    for m in measures:
+        v = df_long[m].to_numpy(dtype=float)[order]
+        ok = ~np.isnan(v)
+        v = v[ok]
+        key = value_keys(v)
+        uniq, inverse = np.unique(key, return_inverse=True)
+
+        # 완전한 블록만 (블록, key) 히스토그램 -> 두 축으로 누적. 0번 행은 빈 prefix
+        n_blocks = len(v) // BLOCK
+        head = n_blocks * BLOCK
+        hist = np.bincount(
+            np.arange(head) // BLOCK * len(uniq) + inverse[:head],
+            minlength=n_blocks * len(uniq),
+        ).reshape(n_blocks, len(uniq))
+        table = np.zeros((n_blocks + 1, len(uniq)), dtype=np.int32)
+        table[1:] = hist.cumsum(axis=0, dtype=np.int32).cumsum(axis=1, dtype=np.int32)
+
+        # 격자 사이 값(홀수 key) 행의 위치를 key별로 위치 순 정렬 (stable -> 같은 key 안에서 위치 순)
+        off = np.flatnonzero(key % 2 == 1)
+        off = off[np.argsort(key[off], kind="stable")]
+
+        for name, value in zip(ARRAYS, (rank[ok], v, uniq.astype(np.int32), table,
+                                        key[off].astype(np.int32), off.astype(np.int32))):
+            arrays[name][m] = value
+    max_rank = int(rank.max()) if len(rank) else 0
+    return SummaryCube(max_rank=max_rank, **arrays)
+
+
+def load_cube(path: Path) -> SummaryCube:
+    """스냅샷의 큐브를 읽는다. 저장된 큐브가 없거나 스냅샷보다 오래됐으면 새로 만든다."""
+    path = Path(path)
+
+    def build():
+        saved = cube_path(path)
+        sources = source_paths(path)
+        if saved.exists() and all(saved.stat().st_mtime_ns >= p.stat().st_mtime_ns for p in sources):
+            cube = SummaryCube.load(saved)
+            if cube is not None:
+                return cube
+        return build_cube(load_columns(path, ["rank", *MEASURES], table="sizes"))
+
+    return load_derived(path, "summary_cube", build)
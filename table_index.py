@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from musinsa_data import load_derived
+
+# =========================
+# 서버 측 페이지네이션용 인덱스 (정렬 순서 / 범주 코드 미리 계산)
+# =========================
+# 정렬 가능한 컬럼마다 argsort 결과를 한 번만 만들어 두고, 질의 때는
+# 필터 마스크(O(n) 벡터 연산)를 그 순서에 적용해 보이는 페이지만 잘라낸다.
+# 질의마다 DataFrame을 정렬·복사하지 않으므로 화면으로는 한 페이지 행만 전송된다.
+
+
+@dataclass(frozen=True)
+class TableIndex:
+    df: pd.DataFrame = field(repr=False)
+    orders: dict = field(repr=False)  # 컬럼 -> 오름차순 위치 (결측은 맨 뒤)
+    codes: dict = field(repr=False)  # 범주 컬럼 -> (코드 배열, 범주 목록)
+
+    @property
+    def nbytes(self) -> int:
+        return int(
+            self.df.memory_usage(index=True, deep=True).sum()
+            + sum(o.nbytes for o in self.orders.values())
+            + sum(c.nbytes for c, _ in self.codes.values())
+        )
+
+    def __len__(self):
+        return len(self.df)
+
+    def categories(self, column: str):
+        return self.codes[column][1]
+
+    def value_range(self, column: str):
+        v = self.df[column].to_numpy(dtype=float)
+        v = v[~np.isnan(v)]
+        return (float(v.min()), float(v.max())) if len(v) else (np.nan, np.nan)
+
+    def query(self, ranges: dict = None, categories: dict = None, sort_by: str = None,
+              ascending: bool = True) -> np.ndarray:
+        """필터(범위: 양끝 포함, 범주: 포함 목록)를 만족하는 행 위치를 sort_by 순서로 반환"""
+        mask = np.ones(len(self.df), dtype=bool)
+        for column, (lo, hi) in (ranges or {}).items():
+            v = self.df[column].to_numpy(dtype=float)
+            mask &= (v >= lo) & (v <= hi)
+        for column, selected in (categories or {}).items():
+            if not selected:
+                continue
+            codes, cats = self.codes[column]
+            wanted = np.zeros(len(cats) + 1, dtype=bool)  # 마지막 칸 = 결측(-1)
+            lookup = {c: i for i, c in enumerate(cats)}
+            wanted[[lookup[c] for c in selected if c in lookup]] = True
+            mask &= wanted[codes]
+
+        if sort_by is None:
+            return np.flatnonzero(mask)
+        order = self.orders[sort_by]
+        if not ascending:
+            # 결측은 내림차순에서도 맨 뒤
+            n_valid = int(self.df[sort_by].notna().sum())
+            order = np.concatenate([order[:n_valid][::-1], order[n_valid:]])
+        return order[mask[order]]
+
+    def page(self, positions: np.ndarray, page: int, page_size: int, columns=None) -> pd.DataFrame:
+        """positions 중 page번째(1부터) 페이지 행만 꺼낸다."""
+        start = (page - 1) * page_size
+        rows = self.df.iloc[positions[start:start + page_size]]
+        return rows if columns is None else rows[columns]
+
+
+def build_table_index(df: pd.DataFrame, sort_columns=None, category_columns=()) -> TableIndex:
+    df = df.reset_index(drop=True)
+    sort_columns = list(df.columns) if sort_columns is None else list(sort_columns)
+
+    orders = {}
+    for column in sort_columns:
+        s = df[column]
+        if isinstance(s.dtype, pd.CategoricalDtype) and s.cat.ordered:
+            key = s.cat.codes.to_numpy().astype(float)
+            key[key < 0] = np.nan
+        elif pd.api.types.is_numeric_dtype(s):
+            key = s.to_numpy(dtype=float)
+        else:
+            key = pd.Categorical(s.astype(object)).codes.astype(float)  # 사전순 코드
+            key[key < 0] = np.nan
+        # NaN은 stable argsort에서 맨 뒤로 간다
+        orders[column] = np.argsort(key, kind="stable")
+
+    codes = {}
+    for column in category_columns:
+        s = df[column]
+        cat = pd.Categorical(s if isinstance(s.dtype, pd.CategoricalDtype) else s.astype(object))
+        codes[column] = (np.asarray(cat.codes, dtype=np.int64), list(cat.categories))
+
+    return TableIndex(df=df, orders=orders, codes=codes)
+
+
+def snapshot_table_index(path, name: str, build_frame, sort_columns=None, category_columns=()) -> TableIndex:
+    """스냅샷별로 캐시되는 TableIndex. build_frame()은 캐시 miss일 때만 호출"""
+    return load_derived(
+        path,
+        f"table:{name}",
+        lambda: build_table_index(build_frame(), sort_columns, category_columns),
+    )
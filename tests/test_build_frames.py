@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from musinsa_data import AVG_COLUMNS, LONG_COLUMNS, MEASURES, MUSINSA_FILE, add_rank_intensity, build_frames, read_pickle
+
+
+# =========================
+# 기준 구현 (벡터화 이전 루프, 사이즈 행마다 dict 하나)
+# =========================
+def reference_build_frames(data: dict):
+    items = data.get("items", {})
+    rows_avg, rows_long = [], []
+
+    for rank, obj in items.items():
+        meta = obj.get("rank_meta", {})
+        avg = obj.get("avg", {})
+        per_row = obj.get("per_row", {})
+
+        rows_avg.append({
+            "rank": int(rank),
+            "brand": meta.get("brand"),
+            "item_id": meta.get("item_id"),
+            "title": meta.get("title", ""),
+            "url": meta.get("url"),
+            "original_price": meta.get("original_price"),
+            "row_count": len(per_row),
+            "총장_avg": avg.get("총장"),
+            "어깨너비_avg": avg.get("어깨너비"),
+            "가슴단면_avg": avg.get("가슴단면"),
+            "소매길이_avg": avg.get("소매길이"),
+        })
+
+        for row_k, vals in per_row.items():
+            rows_long.append({
+                "rank": int(rank),
+                "brand": meta.get("brand"),
+                "item_id": meta.get("item_id"),
+                "row_key": row_k,
+                "original_price": meta.get("original_price"),
+                "총장": vals.get("총장"),
+                "어깨너비": vals.get("어깨너비"),
+                "가슴단면": vals.get("가슴단면"),
+                "소매길이": vals.get("소매길이"),
+            })
+
+    df_avg = pd.DataFrame(rows_avg, columns=AVG_COLUMNS).sort_values("rank")
+    df_long = pd.DataFrame(rows_long, columns=LONG_COLUMNS).sort_values("rank")
+
+    df_avg["original_price"] = pd.to_numeric(df_avg["original_price"], errors="coerce")
+    df_long["original_price"] = pd.to_numeric(df_long["original_price"], errors="coerce")
+    for m in MEASURES:
+        df_avg[f"{m}_avg"] = pd.to_numeric(df_avg[f"{m}_avg"], errors="coerce")
+
+    add_rank_intensity(df_avg)
+    add_rank_intensity(df_long)
+    return df_avg, df_long
+
+
+def coerce_measures(df_long: pd.DataFrame) -> pd.DataFrame:
+    """기준 결과에 의도한 변경(사이즈 행 실측을 float으로 변환)만 적용"""
+    return df_long.assign(**{m: pd.to_numeric(df_long[m], errors="coerce").astype(float) for m in MEASURES})
+
+
+def assert_same_frames(data: dict, check_dtype: bool = True):
+    got_avg, got_long = build_frames(data)
+    ref_avg, ref_long = reference_build_frames(data)
+    pd.testing.assert_frame_equal(got_avg, ref_avg, check_dtype=check_dtype)
+    pd.testing.assert_frame_equal(got_long, coerce_measures(ref_long), check_dtype=check_dtype)
+
+
+def item(brand="b", item_id="1", price=10000, per_row=None, avg=None, **meta):
+    per_row = {"row_1": {m: 50.0 + i for i, m in enumerate(MEASURES)}} if per_row is None else per_row
+    avg = {m: 50.0 + i for i, m in enumerate(MEASURES)} if avg is None else avg
+    return {
+        "rank_meta": {"brand": brand, "item_id": item_id, "url": f"https://example.com/{item_id}",
+                      "title": "", "original_price": price, **meta},
+        "per_row": per_row,
+        "avg": avg,
+    }
+
+
+# =========================
+# 기준 구현과 같은 결과
+# =========================
+@pytest.mark.skipif(not MUSINSA_FILE.exists(), reason="번들 스냅샷 없음")
+def test_bundled_snapshot():
+    assert_same_frames(read_pickle(MUSINSA_FILE))
+
+
+def test_synthetic_snapshot():
+    rng = np.random.default_rng(0)
+    items = {}
+    for rank in rng.permutation(np.arange(1, 201)):
+        per_row = {
+            f"row_{j}": {m: float(np.round(rng.normal(55, 8) * 2) / 2) for m in MEASURES}
+            for j in range(int(rng.integers(0, 6)))
+        }
+        items[int(rank)] = item(brand=f"brand{rank % 17}", item_id=str(1000 + rank),
+                                price=int(rng.integers(1, 30)) * 10000, per_row=per_row)
+    assert_same_frames({"items": items})
+
+
+def test_empty_snapshot():
+    # 행이 없으면 이전 루프는 모든 컬럼이 object dtype이었다. dtype은 빼고 컬럼/행만 비교
+    assert_same_frames({"items": {}}, check_dtype=False)
+    assert_same_frames({}, check_dtype=False)
+
+
+def test_missing_keys_and_none():
+    items = {
+        # rank_meta / avg / per_row 전체 누락
+        "3": {},
+        # 메타 일부 누락, None 값, 실측 항목 일부 누락 (어깨너비/가슴단면은 사이즈 행 전체에 없음:
+        # 이전 루프는 None만 든 object 컬럼, 지금은 NaN float 컬럼)
+        "1": {"rank_meta": {"brand": None, "item_id": "7"},
+              "per_row": {"S": {"총장": 60.0}, "M": {"총장": None, "소매길이": 58.5}},
+              "avg": {"총장": 60.0, "어깨너비": None}},
+        "2": item(item_id="8", per_row={}),
+    }
+    assert_same_frames({"items": items})
+
+
+def test_string_rank_and_price():
+    # 문자열 rank는 int로, 문자열 가격은 숫자로 (숫자가 아니면 NaN) 바뀌는 것까지 이전 루프와 같다.
+    items = {
+        "10": item(item_id="1", price="55000"),
+        "2": item(item_id="2", price="가격 문의"),
+        "7": item(item_id="3", price=None),
+        "1": item(item_id="4", price=39000.0),
+    }
+    assert_same_frames({"items": items})
+    df_avg, df_long = build_frames({"items": items})
+    assert df_avg["rank"].tolist() == [1, 2, 7, 10]
+    assert df_avg["original_price"].iloc[[0, 3]].tolist() == [39000.0, 55000.0]
+    assert df_long["original_price"].iloc[[1, 2]].isna().all()
+
+
+# =========================
+# 의도한 동작 변경: 사이즈 행 실측 문자열은 숫자로 변환
+# =========================
+def test_string_measures_are_coerced():
+    strings = {"총장": "55", "어깨너비": "-", "가슴단면": 48.0, "소매길이": "60.5"}
+    items = {"1": item(per_row={"S": strings}, avg=strings)}
+    got_avg, got_long = build_frames({"items": items})
+    ref_avg, ref_long = reference_build_frames({"items": items})
+
+    # 상품 평균(*_avg)은 이전 루프도 숫자로 변환했다. 다만 정수 문자열뿐이면 int64였고 지금은 항상 float64
+    assert ref_avg["총장_avg"].dtype == np.int64
+    pd.testing.assert_frame_equal(got_avg, ref_avg.astype({f"{m}_avg": float for m in MEASURES}))
+
+    # 이전 루프는 문자열을 그대로 두어 숫자가 아닌 컬럼이 됐다.
+    assert not pd.api.types.is_numeric_dtype(ref_long["총장"])
+    assert ref_long["총장"].iloc[0] == "55"
+
+    # 지금은 float으로 변환 ("55" -> 55.0, 숫자가 아니면 NaN). 나머지 컬럼은 그대로 같다.
+    assert got_long[MEASURES].dtypes.eq(float).all()
+    assert got_long["총장"].iloc[0] == 55.0
+    assert np.isnan(got_long["어깨너비"].iloc[0])
+    assert got_long["소매길이"].iloc[0] == 60.5
+    pd.testing.assert_frame_equal(got_long, coerce_measures(ref_long))
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fit_engine import FIT_RULES, body_references, fit_codes, fit_vector_frame
+from musinsa_data import MEASURES, MUSINSA_FILE, load_columns
+from pipeline import CROP_THR, MID_BAND, length_shares
+from summary_cube import build_cube
+
+LENGTH_RULE = next(r for r in FIT_RULES if r.garment == "총장")
+
+
+def fit_engine_counts(df_long: pd.DataFrame) -> list:
+    """fit_engine 기장 분류(크롭/중간/롱)별 사이즈 행 수"""
+    fit = fit_vector_frame(df_long, body_references())
+    return fit["총장_핏"].value_counts(sort=False).tolist()
+
+
+def cube_counts(df_long: pd.DataFrame) -> list:
+    shares = length_shares(build_cube(df_long), CROP_THR, MID_BAND)
+    return [shares["crop_n"], shares["mid_n"], shares["long_n"]]
+
+
+def test_boundaries_match_pipeline_bands():
+    # 경계값 자체: 60은 중간, 70도 중간 (양끝 포함), 70 초과부터 롱
+    values = np.array([59.5, 60.0, 65.0, 70.0, 70.5, np.nan])
+    assert fit_codes(values, LENGTH_RULE.edges, LENGTH_RULE.closed_right).tolist() == [0, 1, 1, 1, 2, -1]
+
+    df_long = pd.DataFrame({"rank": np.arange(1, len(values) + 1), **{m: values for m in MEASURES}})
+    assert fit_engine_counts(df_long) == cube_counts(df_long) == [1, 3, 1]
+
+
+@pytest.mark.skipif(not MUSINSA_FILE.exists(), reason="번들 스냅샷 없음")
+def test_bundled_snapshot_counts_match():
+    df_long = load_columns(MUSINSA_FILE, ["rank", *MEASURES], table="sizes")
+    assert fit_engine_counts(df_long) == cube_counts(df_long)
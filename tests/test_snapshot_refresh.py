@@ -0,0 +1,56 @@
+import os
+import pickle
+import shutil
+
+import pytest
+
+import musinsa_data
+from musinsa_data import MUSINSA_FILE, columnar_is_stale, columnar_paths, load_columns, load_snapshot, read_pickle
+from summary_cube import cube_path, load_cube
+
+pytestmark = pytest.mark.skipif(not MUSINSA_FILE.exists(), reason="번들 스냅샷 없음")
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    """번들 스냅샷(pkl + columnar + 큐브)을 임시 디렉터리에 복사"""
+    for src in MUSINSA_FILE.parent.glob(f"{MUSINSA_FILE.name.split('.')[0]}.*"):
+        shutil.copy2(src, tmp_path / src.name)
+    return tmp_path / MUSINSA_FILE.name
+
+
+def overwrite_pickle(path, drop: int = 1):
+    """새 크롤처럼 pkl만 덮어쓴다 (상품 drop개 제거, columnar 파일보다 새 수정시각)"""
+    data = read_pickle(path)
+    for rank in list(data["items"])[:drop]:
+        del data["items"][rank]
+    with open(path, "wb") as f:
+        pickle.dump(data, f)
+    newest = max(p.stat().st_mtime_ns for p in columnar_paths(path))
+    os.utime(path, ns=(newest + 1_000_000, newest + 1_000_000))
+    return len(data["items"])
+
+
+def test_newer_pickle_rebuilds_columnar(snapshot):
+    before = len(load_snapshot(snapshot).df_avg)
+    n_items = overwrite_pickle(snapshot)
+    assert columnar_is_stale(snapshot)
+
+    assert len(load_snapshot(snapshot).df_avg) == n_items == before - 1
+    assert not columnar_is_stale(snapshot)
+    assert len(load_columns(snapshot, ["rank"])) == n_items
+    assert cube_path(snapshot).stat().st_mtime_ns >= snapshot.stat().st_mtime_ns
+    assert load_cube(snapshot).total("총장") == load_snapshot(snapshot).df_long["총장"].notna().sum()
+
+
+def test_falls_back_to_pickle_when_conversion_fails(snapshot, monkeypatch):
+    n_items = overwrite_pickle(snapshot)
+
+    def read_only(path):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(musinsa_data, "convert_pickle", read_only)
+    with pytest.warns(UserWarning):
+        assert len(load_snapshot(snapshot).df_avg) == n_items
+    assert columnar_is_stale(snapshot)
+    assert len(load_columns(snapshot, ["rank"])) == n_items
@@ -0,0 +1,41 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ingest import ingest_snapshot, load_trend
+from musinsa_data import MUSINSA_FILE, read_pickle
+
+pytestmark = pytest.mark.skipif(not MUSINSA_FILE.exists(), reason="번들 스냅샷 없음")
+
+DATES = [date(2026, 10, 1), date(2026, 10, 2), date(2026, 10, 3)]
+
+
+def reranked(data: dict, seed: int) -> dict:
+    """상품 내용은 그대로 두고 순위만 섞은 하루치 크롤"""
+    objs = list(data["items"].values())
+    order = np.random.default_rng(seed).permutation(len(objs))
+    return {**data, "items": {rank: objs[i] for rank, i in enumerate(order, start=1)}}
+
+
+@pytest.fixture(scope="module")
+def days():
+    data = read_pickle(MUSINSA_FILE)
+    return [reranked(data, seed) for seed in range(len(DATES))]
+
+
+def ingest_in(order, days, store_dir):
+    for i in order:
+        ingest_snapshot(days[i], DATES[i], store_dir)
+    return load_trend(store_dir)
+
+
+def test_out_of_order_ingest_matches_in_order(days, tmp_path):
+    in_order = ingest_in([0, 1, 2], days, tmp_path / "in_order")
+    # 10/2를 마지막에 넣으면 10/3의 직전 수집일이 10/1 -> 10/2로 바뀐다
+    late = ingest_in([0, 2, 1], days, tmp_path / "late")
+
+    pd.testing.assert_frame_equal(late, in_order)
+    third = in_order[in_order["crawl_date"] == "20261003"]
+    assert third["entered"].notna().all()
@@ -0,0 +1,12 @@
+# =========================
+# 페이지 모듈 (메뉴에서 선택될 때 import)
+# =========================
+# 메뉴 이름 -> 모듈 경로. 각 모듈은 render()를 제공한다.
+PAGES = {
+    "Home": "views.home",
+    "무신사 사이즈 데이터": "views.musinsa",
+    "사이즈 코리아 데이터": "views.sizekorea",
+    "의류 실측과 인체 치수 간 대응 관계 분석": "views.ease",
+    "내 치수로 사이즈 추천": "views.recommend",
+    "랭킹 순위 추이": "views.trends",
+}
@@ -0,0 +1,38 @@
+import streamlit as st
+
+from dataset_registry import CATEGORY_LABELS, DatasetRegistry
+from musinsa_data import DATA_DIR
+from profiling import cache_probe, mark_cache_miss
+
+
+# =========================
+# Helpers (무신사 데이터를 쓰는 페이지 공용)
+# =========================
+@st.cache_resource(ttl=60)
+def get_registry():
+    # 파일 목록만 스캔 (실제 데이터는 선택될 때 lazy 로딩)
+    mark_cache_miss()
+    return DatasetRegistry()
+
+
+def select_snapshot():
+    """사이드바에서 연령대 / 카테고리 / 수집일을 골라 SnapshotInfo 반환"""
+    with cache_probe("registry"):
+        registry = get_registry()
+    age_groups = registry.age_groups()
+    if not age_groups:
+        st.error(f"데이터 파일이 없습니다:\n{DATA_DIR}")
+        st.stop()
+
+    st.sidebar.divider()
+    age_group = st.sidebar.selectbox("연령대", age_groups)
+    category = st.sidebar.selectbox(
+        "카테고리",
+        registry.categories(age_group),
+        format_func=lambda c: CATEGORY_LABELS.get(c, c),
+    )
+    return st.sidebar.selectbox(
+        "수집일",
+        registry.versions(age_group, category),
+        format_func=lambda s: s.date_label,
+    )
@@ -0,0 +1,350 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from musinsa_data import load_columns, snapshot_exists
+from fit_engine import FIT_RULES
+from fit_simulation import UNFIT_LABEL, snapshot_coverage
+from pipeline import body_chest_reference, ease_frame, fit_share_table, size_fit_vectors, size_row_fit
+from profiling import section
+from table_index import snapshot_table_index
+from views.common import select_snapshot
+from views.paged_table import paged_table
+
+
+# 보정값(offset)은 위젯 키가 아닌 이 키에 둔다. ⑤를 꺼서 위젯 키가 사라져도 ⑥이 같은 값을 쓴다.
+OFFSETS_KEY = "fit_offsets"
+OFFSET_GARMENTS = ["어깨너비", "소매길이"]
+
+
+def offset_inputs(key_prefix: str) -> dict:
+    """보정값 입력 {의류 항목: cm}. 기본값은 FIT_RULES offset, 입력값은 OFFSETS_KEY에 저장해 ⑤·⑥이 공유"""
+    saved = st.session_state.setdefault(
+        OFFSETS_KEY, {r.garment: r.offset for r in FIT_RULES if r.garment in OFFSET_GARMENTS}
+    )
+    for col, garment in zip(st.columns(len(OFFSET_GARMENTS)), OFFSET_GARMENTS):
+        saved[garment] = col.number_input(
+            f"{garment} 보정값(cm)", -10.0, 10.0, float(saved[garment]), step=0.5, key=f"{key_prefix}_{garment}"
+        )
+    return dict(saved)
+
+
+# =========================
+# Page: 의류 실측과 인체 치수 간 대응 관계 분석
+# =========================
+def render():
+    st.title("🔍 의류 실측과 인체 치수 간 대응 관계 분석")
+    info = select_snapshot()
+    st.caption(f"분석 대상: {info.age_group} 여성 / 무신사 Top {info.top_n} {info.category_label} (상품 단위 분석: 가슴단면_avg)")
+
+    # =========================================================
+    # 0) 분석 범위 명시
+    # =========================================================
+    st.info(
+        """
+        **본 페이지는 ‘가슴단면’ 항목만을 사용하여 인체 치수와의 대응 관계(ease)를 분석합니다.**  
+        무신사 실측값 중 가슴단면은 사이즈코리아의 **가슴둘레**와 직접적으로 대응시켜 해석 가능하며,  
+        어깨/팔 항목은 측정 정의 차이(의류 기준 vs 인체 기준)가 커서 ①–④에서는 제외하고,  
+        ⑤에서 보정값(offset)을 둔 대응 규칙(어깨너비→어깨사이길이, 소매길이→팔길이)으로 따로 살펴봅니다.
+
+        또한 **상품에 사이즈가 여러 개 존재하는 경우**, 분석 대표값은 **가슴단면의 평균값(가슴단면_avg)** 으로 정의합니다.
+        """
+    )
+
+    # =========================================================
+    # A) 무신사 데이터 로드 + df_avg(상품 단위) 생성
+    # =========================================================
+    if not snapshot_exists(info.path):
+        st.error(f"무신사 데이터 파일이 없습니다:\n{info.path}")
+        st.stop()
+
+    # 상품 단위 df_avg: ease 계산에 필요한 컬럼만 읽음 (숫자형 변환, rank_intensity는 데이터 레이어에서 완료)
+    with section("데이터 로드"):
+        df_avg = load_columns(
+            info.path,
+            ["rank", "brand", "item_id", "title", "original_price", "row_count", "가슴단면_avg", "rank_intensity"],
+        )
+    if df_avg.empty:
+        st.error("data['items']가 비어 있습니다. pkl 구조를 확인하세요.")
+        st.stop()
+
+    # 결측 제거
+    missing = int(df_avg["가슴단면_avg"].isna().sum())
+    if missing > 0:
+        st.warning(f"가슴단면_avg 결측치가 {missing}개 있어 ease 계산에서 제외됩니다.")
+
+    st.divider()
+
+    # =========================================================
+    # 1) 여유량(Ease) 기준 정의 (가슴둘레 기준)
+    # =========================================================
+    st.subheader("① 여유량(Ease) 기준 정의")
+    st.caption("패턴메이킹 교재·봉제 가이드에서 제시하는 여유량 범위를 참고해 핏 유형을 정의합니다.")
+
+    rule_df = pd.DataFrame([
+        {"항목": "가슴둘레", "슬림핏": "0–6 cm", "레귤러/베이직핏": "6-10 cm", "컴포트핏": "10–16 cm", "오버사이즈핏": "16 cm 이상"}
+    ])
+    st.table(rule_df)
+
+    # 인체 기준값: 선택한 스냅샷과 같은 연령대의 사이즈코리아 데이터 (없으면 기본 연령대)
+    body_age_group, BODY_CHEST_CIRC_CM = body_chest_reference(info.age_group)
+    if body_age_group != info.age_group:
+        st.warning(f"사이즈코리아 {info.age_group} 데이터가 없어 {body_age_group} 기준값을 사용합니다.")
+
+    st.info(
+        f"""
+        - 인체 기준값은 **사이즈코리아 {body_age_group} 여성, 3차원 자동측정(mean) = {BODY_CHEST_CIRC_CM:.1f}cm** 를 대표값으로 사용합니다.  
+        - 무신사 실측은 **가슴단면(cm)** 이므로, 인체의 **가슴둘레를 /2 하여 단면 기준으로 맞춘 뒤** 비교합니다.  
+        - 단면 차이를 다시 둘레 차이로 환산해 핏 기준(가슴둘레 ease)에 적용합니다.
+
+        **가슴둘레 Ease(cm) = 2 × (의류 가슴단면_avg − 인체 가슴둘레/2)**
+        """
+    )
+
+    st.divider()
+
+    # =========================================================
+    # 2) Ease 계산 (상품 단위: 가슴단면_avg 기반)
+    # =========================================================
+    st.subheader("② Ease 계산")
+
+    with section("② Ease 계산"):
+        df_ease = ease_frame(df_avg, BODY_CHEST_CIRC_CM)
+
+        table_columns = ["rank", "brand", "row_count", "가슴단면_avg", "가슴둘레_ease(cm)", "핏_분류(가슴둘레)"]
+        table = snapshot_table_index(
+            info.path,
+            f"ease:{BODY_CHEST_CIRC_CM}",
+            lambda: df_ease,
+            sort_columns=table_columns,
+            category_columns=["brand", "핏_분류(가슴둘레)"],
+        )
+        paged_table(
+            table,
+            "ease_table",
+            columns=table_columns,
+            range_columns=["rank", "original_price"],
+            category_columns=["brand", "핏_분류(가슴둘레)"],
+            sort_by="rank",
+        )
+
+    st.divider()
+
+    # =========================================================
+    # 4) Ease 분포 + Fit 비중 (Top100 전체 상품 기준)
+    # =========================================================
+    st.subheader("③ 가슴둘레 Ease 분포 및 핏 비중")
+
+    with section("③ Ease 분포 및 핏 비중"):
+        fig = px.violin(
+            df_ease.dropna(subset=["가슴둘레_ease(cm)"]),
+            y="가슴둘레_ease(cm)",
+            box=True,
+            points="all",
+            title="가슴둘레 Ease 분포 (상품 단위, 가슴단면_avg 기반)",
+        )
+        fig.update_layout(yaxis_title="Ease (cm)")
+        st.plotly_chart(fig, use_container_width=True)
+
+        fit_share = fit_share_table(df_ease["핏_분류(가슴둘레)"])
+
+        c1, c2 = st.columns([1, 1])
+        with c1:
+            st.dataframe(fit_share, hide_index=True, use_container_width=True)
+        with c2:
+            fig_bar = px.bar(fit_share, x="핏", y="pct(%)", title="핏 유형 비중(%)")
+            st.plotly_chart(fig_bar, use_container_width=True)
+
+    def get_pct(name: str) -> float:
+        r = fit_share.loc[fit_share["핏"] == name, "pct(%)"]
+        return float(r.iloc[0]) if len(r) else 0.0
+
+    pct_over = get_pct("오버사이즈핏")
+    pct_comfort = get_pct("컴포트핏")
+    pct_regular = get_pct("레귤러/베이직핏")
+    pct_slim = get_pct("슬림핏")
+    pct_neg = 0.0
+
+    # 음수 라벨이 다를 수 있어서 포함 검색
+    neg_rows = fit_share[fit_share["핏"].astype(str).str.contains("0 미만", na=False)]
+    if len(neg_rows):
+        pct_neg = float(neg_rows["pct(%)"].sum())
+
+    pct_loose = pct_over + pct_comfort  # 컴포트 이상
+    pct_standard = pct_regular + pct_slim
+
+    ease_series = df_ease["가슴둘레_ease(cm)"].dropna()
+    q1 = ease_series.quantile(0.25)
+    med = ease_series.quantile(0.50)
+    q3 = ease_series.quantile(0.75)
+    min_e = ease_series.min()
+    max_e = ease_series.max()
+
+
+    st.markdown("#####  ‘① 가슴 여유량(Ease)’이 실루엣 전략의 핵심 변수로 작동")
+    st.markdown(
+        f"""
+        바이올린 그래프(분포)에서 **중앙값이 이미 오버사이즈 영역에 위치**하고,  
+        핏 비중에서도 **오버사이즈+컴포트가 {pct_loose:.1f}%로 과반을 크게 상회**한다는 점을 함께 고려하면,  
+        20–24세 여성 슈트·블레이저 시장에서 가슴둘레 Ease는 단순한 착용 편의의 문제가 아니라  
+        **브랜드/상품이 설정한 ‘기본 실루엣’을 규정하는 설계 변수**로 해석할 수 있습니다.
+
+        ➡️ 이 연령대에서 상위 랭킹 상품은 ‘정장다운 정핏’보다 **여유를 전제로 한 볼륨감(실루엣) 전략**을 표준처럼 채택하고 있습니다.
+        """
+    )
+    st.divider()
+
+    st.markdown("##### ② 분포 폭은 넓지만, 하한선은 명확")
+
+    st.markdown(
+        f"""
+        가슴둘레 Ease 분포는 상단 방향으로는 폭넓게 확장되어 있으나,  
+        **하한선은 매우 명확하게 제한**되어 있습니다.
+
+        - Ease 하한은 **거의 0cm 근처에서 컷(cut)**  
+        - **인체 평균보다 작은 음수 Ease 상품은 1개({pct_neg:.1f}%)에 불과**  
+        - 즉, 인체 평균보다 타이트한 설계는 Top100 시장에서 **사실상 선택되지 않음**
+
+        ➡️ **‘몸에 딱 맞게 만든 재킷’이 이 연령대·카테고리에서는 비주류 설계**임을 시사합니다.
+        """
+    )
+
+    st.divider()
+
+    # =========================================================
+    # 5) 사이즈 행 단위 Ease (인체 분포 기반)
+    # =========================================================
+    st.subheader("④ 사이즈 행 단위 Ease와 인구 대비 핏 비중")
+    size_mode = st.toggle("사이즈 행 전체 + 인체 분포(백분위) 기준으로 분석", value=False)
+
+    if size_mode:
+        st.caption(
+            "상품 평균 대신 per_row의 모든 사이즈 행에 대해 ease를 계산하고, "
+            f"평균 인체({BODY_CHEST_CIRC_CM:.1f}cm) 한 명이 아니라 사이즈코리아 가슴둘레 백분위 분포 전체와 비교합니다. "
+            "(백분위 사이 값은 선형보간, 착용 가능 인구 = ease 0cm 이상으로 입을 수 있는 인구 비율)"
+        )
+
+        with section("④ 사이즈 행 단위 Ease"):
+            df_size = load_columns(
+                info.path,
+                ["rank", "brand", "item_id", "row_key", "가슴단면"],
+                table="sizes",
+            ).dropna(subset=["가슴단면"])
+
+            df_size, pop_share = size_row_fit(df_size, body_age_group, BODY_CHEST_CIRC_CM)
+
+            st.dataframe(df_size, use_container_width=True, hide_index=True)
+
+        fig_pop = px.bar(
+            pop_share,
+            x="핏",
+            y="평균 인구 비중(%)",
+            title="사이즈 행 평균: 인구 중 각 핏으로 착용되는 비중(%)",
+        )
+        st.plotly_chart(fig_pop, use_container_width=True)
+
+    st.divider()
+
+    # =========================================================
+    # 6) 다항목 핏 벡터 (총장 구간 + 어깨/가슴/소매 ease)
+    # =========================================================
+    st.subheader("⑤ 사이즈 행 단위 다항목 핏 (어깨·소매·총장 포함)")
+    multi_mode = st.toggle("어깨너비·소매길이·총장까지 포함해 분석", value=False)
+
+    if multi_mode:
+        st.caption(
+            "ease = 의류 실측 + 보정값 − 인체 치수(사이즈코리아 mean). "
+            "의류 어깨너비는 어깨솔기 사이, 인체 어깨사이길이는 어깨점 사이 직선거리이고 "
+            "소매길이는 어깨솔기부터, 팔길이는 어깨점부터 잰 값이므로 정의 차이를 보정값으로 맞출 수 있습니다. "
+            "총장은 인체 대응 없이 기장 구간으로 분류합니다."
+        )
+        offsets = offset_inputs("size_fit_offset")
+
+        with section("⑤ 다항목 핏"):
+            df_long = load_columns(
+                info.path,
+                ["rank", "brand", "item_id", "row_key", *[r.garment for r in FIT_RULES]],
+                table="sizes",
+            )
+            df_fit, multi_share, body_refs = size_fit_vectors(df_long, body_age_group, offsets)
+
+            st.caption("인체 기준값: " + ", ".join(f"{k} {v:.1f}cm" for k, v in body_refs.items()))
+            fig_multi = px.bar(
+                multi_share,
+                x="핏",
+                y="pct(%)",
+                facet_col="측정 항목",
+                facet_col_wrap=2,
+                title="측정 항목별 핏 비중(%) (사이즈 행 기준)",
+            )
+            fig_multi.update_xaxes(matches=None, showticklabels=True)
+            st.plotly_chart(fig_multi, use_container_width=True)
+
+            fit_columns = [f"{r.garment}_핏" for r in FIT_RULES]
+            table = snapshot_table_index(
+                info.path,
+                f"size_fit:{body_age_group}:{offsets['어깨너비']}:{offsets['소매길이']}",
+                lambda: df_fit,
+                sort_columns=["rank", *[c for c in df_fit.columns if c.endswith("_ease(cm)")]],
+                category_columns=["brand", *fit_columns],
+            )
+            paged_table(
+                table,
+                "size_fit_table",
+                range_columns=["rank"],
+                category_columns=fit_columns,
+                sort_by="rank",
+            )
+
+    st.divider()
+
+    # =========================================================
+    # 7) 인구 커버리지 시뮬레이션 (사이즈코리아 분포에서 가상 인체 샘플링)
+    # =========================================================
+    st.subheader("⑥ 인구 커버리지 시뮬레이션")
+    sim_mode = st.toggle("가상 인체 샘플로 상품 사이즈 범위의 커버리지 계산", value=False)
+
+    if sim_mode:
+        st.caption(
+            "사이즈코리아 가슴둘레·어깨사이길이·팔길이 분포(백분위)와 항목 간 상관을 따르는 가상 인체를 뽑아 "
+            "모든 사이즈 행과 비교합니다. 착용 가능 = 세 항목 ease가 모두 0 이상, 핏 = 가슴둘레 ease 구간. "
+            "상품 커버리지는 상품의 사이즈 중 하나라도 그 핏으로 맞는 인구 비율입니다. (보정값은 ⑤와 공유)"
+        )
+        n_bodies = st.select_slider("가상 인체 수", [10_000, 50_000, 100_000, 200_000], value=50_000)
+        offsets = offset_inputs("coverage_offset")
+
+        with section("⑥ 커버리지 시뮬레이션"):
+            coverage = snapshot_coverage(info.path, body_age_group, n_bodies, offsets)
+            products = coverage.products
+
+            fig_cov = px.histogram(
+                products,
+                x="착용 가능(%)",
+                nbins=20,
+                title=f"상품별 착용 가능 인구 비율 분포 (가상 인체 {n_bodies:,}명)",
+            )
+            st.plotly_chart(fig_cov, use_container_width=True)
+
+            table = snapshot_table_index(
+                info.path,
+                f"coverage:{body_age_group}:{n_bodies}:{offsets['어깨너비']}:{offsets['소매길이']}",
+                lambda: products,
+                sort_columns=list(products.columns),
+                category_columns=["brand"],
+            )
+            paged_table(
+                table,
+                "coverage_table",
+                range_columns=["rank", "착용 가능(%)"],
+                category_columns=["brand"],
+                sort_by="rank",
+            )
+
+        unfit = coverage.sizes[f"{UNFIT_LABEL}(%)"]
+        st.markdown(
+            f"""
+            - 사이즈 행 하나가 평균적으로 맞는 인구: **{100 - unfit.mean():.1f}%**
+            - 상품(사이즈 범위 전체)이 맞는 인구: 중앙값 **{products['착용 가능(%)'].median():.1f}%**,
+              50% 미만인 상품 **{int((products['착용 가능(%)'] < 50).sum())}개** / {len(products)}개
+            """
+        )
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import streamlit as st
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+# =========================
+# Page: Research Overview (Home)
+# =========================
+# 텍스트/이미지만 그리므로 pandas·plotly를 import하지 않는다.
+def render():
+    st.title("🏠 Home")
+
+    st.markdown(
+        """
+        본 대시보드는 **무신사(Musinsa) 연령대별 랭킹 데이터**와 **사이즈코리아(Size Korea) 인체치수 데이터**를 결합하여,  
+        20-24세 연령층의 여성 슈트·블레이저 자켓의 ‘치수 구조’와 ‘인체 대비 격차'를 정량적으로 분석한다.
+
+        ### **☑️ 데이터 구성**
+        **1) 무신사 랭킹 데이터**
+        - 20-24세 연령층의 여성 상위 **200위** 슈트·블레이저 자켓  
+        - 비교적 소재의 다양성이 적고 핏이 정형화되어있는 항목(슈트·블레이저 자켓)을 선정함
+        - 사이즈표 실측 항목(무신사 웹 크롤링 통해서 얻을 수 있었음):
+          - **총장**, **어깨너비**, **가슴단면**, **소매길이**
+        - 제품별 여러 사이즈가 존재할 경우, 분석용 대표값은 **사이즈표 실측의 평균값**으로 정의함""")
+
+    img_path = BASE_DIR / "assets" / "OG.png"
+    st.image(img_path, width=400)
+
+    st.markdown(" ")
+    st.markdown("""
+        **2) 사이즈코리아 인체치수 데이터**
+        - 동일한 연령대 구간(20-24세)을 사용
+        - 의복 설계와 대응 가능한 치수(가슴둘레-가슴단면, 어깨사이길이-어깨너비, 팔길이-소매길이)를 선별하여 사용 
+        - 조금 더 정확한 3D 측정 데이터를 추후 분석할 때 사용 
+        - 사이즈코리아 웹사이트 자료실에 공개된 자료를 활용했으며, Raw 데이터 없이 최종 통계량만 제공되었음""")
+
+    img_path = BASE_DIR / "assets" / "logo.png"
+    st.image(img_path, width=400)
+
+    st.divider()
+    st.markdown("""
+        ### **☑️ 분석 내용**
+        - 무신사 사이즈 데이터 통해 20-24세 연령층의 슈트·블레이저 자켓 사이즈 선호도 분석  
+        - 사이즈 코리아 데이터 내에 직접 측정과 3D 측정 데이터 비교  
+        - 두 데이터를 결합하여 여성 평균 인체 치수와 의복 치수의 여유분을 계산 후 선호하는 핏의 형태를 분석
+        """
+    )
@@ -0,0 +1,432 @@
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from brand_stats import fit_distribution, snapshot_brand_stats
+from charts import AUTO_ALL_MAX_ROWS, RENDER_MODE_LABELS, RENDER_MODES, distribution_figure, rank_scatter
+from fit_engine import chest_ease, classify_fit
+from musinsa_data import MEASURES, load_snapshot, snapshot_exists
+from pipeline import CROP_THR, MID_BAND, SLEEVE_STD_BAND, TOP_K, body_chest_reference, length_shares, sleeve_shares
+from profiling import cache_probe, mark_cache_miss, section
+from summary_cube import load_cube
+from views.common import select_snapshot
+from views.paged_table import paged_table
+
+
+# =========================
+# Figure cache (스냅샷 버전 + 측정 항목 + 렌더링 모드 기준)
+# =========================
+@st.cache_resource(max_entries=64, show_spinner=False)
+def measure_figures(version: str, m: str, mode: str, _df_long):
+    mark_cache_miss()
+    violin_fig = distribution_figure(_df_long, m, f"{m} 분포 (사이즈 행 전체)", mode)
+    violin_fig.update_layout(yaxis_title=m)
+    scatter_fig = rank_scatter(_df_long, m, f"{m}: rank에 따른 분포 (점=사이즈 행)", mode)
+    return violin_fig, scatter_fig
+
+
+# =========================
+# 구간 기준 (사이드바)
+# =========================
+def band_controls(cube):
+    """상위 랭킹 범위와 총장/소매길이 구간 경계 슬라이더. (top_k, crop_thr, mid, std) 반환"""
+    def bounds(m):
+        lo, hi = cube.value_range(m)
+        return int(np.floor(lo)), int(np.ceil(hi))
+
+    st.sidebar.markdown("**구간 기준**")
+    max_rank = max(cube.max_rank, 1)
+    top_k = st.sidebar.slider("상위 랭킹 범위 (Top k)", 1, max_rank, min(TOP_K, max_rank))
+
+    len_lo, len_hi = bounds("총장")
+    crop_thr = st.sidebar.slider("크롭 기준 총장(cm 미만)", len_lo, len_hi, int(np.clip(CROP_THR, len_lo, len_hi)))
+    mid_band = st.sidebar.slider(
+        "중간 기장 구간(cm)", len_lo, len_hi,
+        tuple(int(np.clip(v, len_lo, len_hi)) for v in MID_BAND),
+    )
+
+    sleeve_lo, sleeve_hi = bounds("소매길이")
+    std_band = st.sidebar.slider(
+        "소매길이 표준 구간(cm)", sleeve_lo, sleeve_hi,
+        tuple(int(np.clip(v, sleeve_lo, sleeve_hi)) for v in SLEEVE_STD_BAND),
+    )
+    return top_k, crop_thr, mid_band, std_band
+
+
+# =========================
+# Page: 무신사 사이즈 데이터
+# =========================
+def render():
+    st.title("🛍️ 무신사 사이즈 데이터")
+    info = select_snapshot()
+    st.caption(f"분석 대상: {info.age_group} 여성 / 무신사 랭킹 Top {info.top_n}")
+
+    if not snapshot_exists(info.path):
+        st.error(f"데이터 파일이 없습니다:\n{info.path}")
+        st.stop()
+
+    with section("스냅샷 로드"):
+        snap = load_snapshot(info.path)
+    if snap.df_avg.empty:
+        st.error("data['items']가 비어 있습니다.")
+        st.stop()
+
+    df_avg, df_long = snap.df_avg, snap.df_long
+
+    # -----------------------------
+    # KPI
+    # -----------------------------
+    target_rank = info.top_n
+    valid_n = len(df_avg)
+    unique_brands = df_avg["brand"].nunique(dropna=True)
+    skipped = int(snap.meta.get("size_skipped_count", 0))
+    failed = int(snap.meta.get("size_fail_count", 0))
+    nonconform = skipped + failed
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric("수집 대상", f"Top {target_rank}")
+    c2.metric("유효 상품(사이즈표 존재)", f"{valid_n}")
+    c3.metric("스킵 상품(사이즈표 존재X)", f"{nonconform}")
+    c4.metric("독립적인 브랜드 개수", f"{unique_brands}")
+
+    # -----------------------------
+    # Plotly 시각화
+    # -----------------------------
+    # 1) 전체 테이블(=CSV 형태로 화면에 보여주기)
+    st.subheader("1) 전체 데이터 테이블 (CSV 형태로 확인)")
+    st.info("df_avg 테이블은 각 상품의 실측 평균값입니다. 사이즈의 개수가 상품별로 다른 것을 고려하여 다음과 같이 대푯값을 설정했습니다. row_count는 사이즈의 개수를 의미합니다.")
+
+    body_age_group, body_chest_circ = body_chest_reference(info.age_group)
+
+    with section("1) 전체 데이터 테이블"):
+        from table_index import snapshot_table_index
+
+        # 화면 표시용 DataFrame (rank_intensity 제거 + 가슴둘레 핏 분류).
+        # 정렬·필터 인덱스는 스냅샷당 한 번 만들고, 화면에는 현재 페이지 행만 보낸다.
+        def display_frame():
+            display_df = df_avg.drop(columns=["rank_intensity"], errors="ignore")
+            display_df["핏_분류(가슴둘레)"] = classify_fit(chest_ease(display_df["가슴단면_avg"], body_chest_circ))
+            return display_df
+
+        table = snapshot_table_index(
+            info.path,
+            f"products:{body_chest_circ}",
+            display_frame,
+            sort_columns=["rank", "brand", "original_price", "row_count", *[f"{m}_avg" for m in MEASURES]],
+            category_columns=["brand", "핏_분류(가슴둘레)"],
+        )
+        paged_table(
+            table,
+            "products_table",
+            range_columns=["rank", "original_price"],
+            category_columns=["brand", "핏_분류(가슴둘레)"],
+            sort_by="rank",
+        )
+
+    st.markdown("#### ▪ 상품 검색")
+    from search_index import FIELD_ALIASES, snapshot_search_index
+
+    query = st.text_input(
+        "브랜드·상품명 검색 (띄어 쓴 단어는 모두 포함, 조건은 `항목<값` 형태)",
+        placeholder="예) 크롭 블레이저 총장<55 ease>16",
+        key="product_search",
+        help="조건에 쓸 수 있는 항목: " + ", ".join(FIELD_ALIASES),
+    )
+    if query.strip():
+        with section("상품 검색"):
+            results = snapshot_search_index(info.path, body_chest_circ).search(query)
+        st.caption(f"검색 결과 {len(results)}건" + (" (rank 순 상위 200건 표시)" if len(results) > 200 else ""))
+        st.dataframe(results.head(200), use_container_width=True, hide_index=True)
+
+    # 비슷한 핏 (사이즈 행 실측 KD-tree)
+    st.markdown("#### ▪ 비슷한 핏 상품")
+    with section("비슷한 핏 상품"):
+        from similarity import load_similarity  # scipy(cKDTree)는 이 구간에서만 import
+
+        sim = load_similarity(info.path)
+        mode = st.radio("기준", ["상품 사이즈", "치수 직접 입력", "내 체형"], horizontal=True, key="similar_mode")
+        if mode == "상품 사이즈":
+            c1, c2, c3 = st.columns([3, 1, 1])
+            labels = {
+                f"{r}위 {b} ({i})": i
+                for r, b, i in df_avg[["rank", "brand", "item_id"]].drop_duplicates("item_id").itertuples(index=False)
+            }
+            item_id = labels[c1.selectbox("기준 상품", list(labels), key="similar_item")]
+            row_key = c2.selectbox("사이즈 행", sim.rows.loc[sim.rows["item_id"] == item_id, "row_key"].tolist(), key="similar_row")
+            target = sim.row_target(item_id, row_key)
+            exclude = [item_id]
+        elif mode == "치수 직접 입력":
+            c1, c2, c3 = st.columns([3, 1, 1])
+            used = c1.multiselect("사용할 항목", MEASURES, default=MEASURES, key="similar_measures")
+            target = {m: st.number_input(f"{m}(cm)", value=round(float(sim.center[i]), 1), step=0.5, key=f"similar_{m}")
+                      for i, m in enumerate(MEASURES) if m in used}
+            exclude = []
+        else:
+            # 인체 치수 -> fit_engine 규칙(+ 목표 ease)으로 목표 의류 실측을 만들어 찾는다
+            from fit_engine import FIT_RULES, body_references, garment_target
+            from size_recommend import DEFAULT_PREFERRED, preferred_ease, target_eases
+
+            c1, c2, c3 = st.columns([3, 1, 1])
+            body_rules = [r for r in FIT_RULES if r.body is not None]
+            defaults = body_references(info.age_group)
+            body = {
+                r.body: col.number_input(f"{r.body}(cm)", 20.0, 200.0, round(defaults[r.body], 1), step=0.5,
+                                         key=f"similar_body_{r.body}")
+                for col, r in zip(c1.columns(len(body_rules)), body_rules)
+            }
+            fits = list(preferred_ease())
+            preferred = c2.selectbox("선호 핏", fits, index=fits.index(DEFAULT_PREFERRED), key="similar_preferred")
+            eases = target_eases(preferred)
+            target = garment_target(body, eases)
+            st.caption(
+                "목표 실측 = (인체 치수 + 목표 ease) / factor: "
+                + ", ".join(f"{m} {v:.1f}cm (ease {eases[m]:g})" for m, v in target.items())
+                + " / 총장은 인체 대응이 없어 거리에서 제외"
+            )
+            exclude = []
+        k = c3.number_input("개수", 1, 50, 10, key="similar_k")
+
+        if target:
+            similar = sim.nearest(target, k=int(k), exclude_items=exclude)
+            st.caption("거리 = 측정 항목별 표준편차 단위로 맞춘 실측 차이 (작을수록 비슷한 핏, 상품당 가장 가까운 사이즈 1개)")
+            st.dataframe(similar.round({"거리": 3}), use_container_width=True, hide_index=True)
+        else:
+            st.info("측정 항목을 하나 이상 선택하세요.")
+    st.divider()
+
+
+    # 2) 브랜드 빈도 + 브랜드 랭킹(등장횟수 기준)
+    st.subheader("2) 브랜드별 등장 빈도 및 순위 정리")
+    with section("2) 브랜드별 등장 빈도"):
+        # 브랜드 집계는 스냅샷당 한 번만 계산해 캐시 (brand_stats)
+        brand_agg, profiles = snapshot_brand_stats(info.path, body_chest_circ)
+
+        brand_count = profiles[["brand", "count"]].copy()
+        brand_count["brand_rank_by_count"] = np.arange(1, len(brand_count) + 1)
+
+        left, right = st.columns(2)
+
+        with left:
+            fig = px.bar(
+                brand_count.head(20),
+                x="brand",
+                y="count",
+                title="브랜드별 등장 횟수 (Top 20)",
+            )
+            fig.update_layout(xaxis_title="brand", yaxis_title="count")
+            st.plotly_chart(fig, use_container_width=True)
+
+        with right:
+            st.dataframe(
+                brand_count.rename(columns={
+                    "brand": "브랜드",
+                    "count": "등장횟수",
+                    "brand_rank_by_count": "브랜드순위(등장횟수기준)"
+                }).head(30),
+                use_container_width=True,
+                hide_index=True
+            )
+
+    # 브랜드 프로필 (선택한 브랜드의 집계값만 조회)
+    st.markdown("#### ▪ 브랜드 프로필")
+    with section("브랜드 프로필"):
+        brand = st.selectbox("브랜드 선택", profiles["brand"].tolist(), key="brand_profile")
+        profile = profiles.loc[profiles["brand"] == brand].iloc[0]
+
+        b1, b2, b3 = st.columns(3)
+        b1.metric("등장 횟수", f"{profile['count']}")
+        b2.metric("최고 순위", f"{profile['best_rank']:.0f}위", help=f"평균 순위 {profile['mean_rank']:.1f}위")
+        b3.metric("가격 범위", f"{profile['price_min']:,.0f}–{profile['price_max']:,.0f}원")
+
+        left, right = st.columns(2)
+        with left:
+            st.dataframe(
+                pd.DataFrame({
+                    "측정 항목": MEASURES,
+                    "평균(cm)": [profile[f"{m}_mean"] for m in MEASURES],
+                    "표준편차(cm)": [profile[f"{m}_std"] for m in MEASURES],
+                }).round(2),
+                use_container_width=True,
+                hide_index=True
+            )
+        with right:
+            fit_df = fit_distribution(brand_agg.loc[brand])
+            fig = px.bar(fit_df, x="핏_분류(가슴둘레)", y="count", title=f"{brand} 핏 분포 (가슴둘레 ease, {body_age_group})")
+            st.plotly_chart(fig, use_container_width=True)
+
+    st.divider()
+
+    # 3) 사이즈 항목별 시각화 (분포 + 랭킹 경향)
+    st.subheader("3) 실측 사이즈 4개 항목 분포 및 랭킹 경향")
+    st.info(
+        """
+        ※ 색: rank가 높을수록(=1등에 가까울수록) 더 진하게 표시
+        """
+    )
+
+    render_mode = st.sidebar.selectbox(
+        "그래프 렌더링",
+        RENDER_MODES,
+        format_func=RENDER_MODE_LABELS.get,
+        help=f"자동: 사이즈 행이 {AUTO_ALL_MAX_ROWS:,}개 이하면 전체 점, 넘으면 밀도 기반 다운샘플",
+    )
+
+    # 구간 비중은 df_long을 다시 훑지 않고 요약 큐브(rank × 값 prefix sum)에서 읽는다.
+    # 슬라이더를 움직일 때마다 rerun 되지만 질의는 이진 탐색 몇 번이다.
+    with section("요약 큐브 로드"):
+        cube = load_cube(info.path)
+    top_k, crop_thr, (mid_low, mid_high), (std_low, std_high) = band_controls(cube)
+
+    for m in MEASURES:
+        st.markdown(f"#### ▪ {m}")
+
+        with section(f"3) {m} 그래프"):
+            with cache_probe("measure_figures"):
+                violin_fig, scatter_fig = measure_figures(snap.version, m, render_mode, df_long)
+            c1, c2 = st.columns([1, 1])
+
+            with c1:
+                st.plotly_chart(violin_fig, use_container_width=True)
+
+            with c2:
+                st.plotly_chart(scatter_fig, use_container_width=True)
+
+                # ✅ 총장 전용: 해석 강화 블록
+        if m == "총장":
+            st.markdown("##### ① 총장 분포 자체에서 보이는 명확한 특징 (왼쪽 그래프)")
+            st.markdown(
+                """
+                총장 분포가 단일 피크가 아니라 **두 개의 뚜렷한 밀집 구간**을 가집니다. 대략적으로:  
+                  - **약 48–55cm 구간**  
+                  - **약 70–75cm 구간**
+
+                ➡️ 20대 초반 재킷/블레이저 시장에서는 '숏 기장(크롭/세미크롭)'과 '정석 롱 기장(힙 덮는 길이)이  
+                **명확히 분화된 두 가지 주류 실루엣**으로 공존하는 것으로 해석할 수 있습니다.  
+                이는 우연이라기보다 **디자인/스타일 전략의 분화**로 볼 수 있습니다.
+                """
+            )
+
+            # --- 20-24세에서 사용자가 관찰한 "중간(60~70) 공백 + 크롭 쏠림"을 수치로 보강 ---
+            length = length_shares(cube, crop_thr, (mid_low, mid_high))
+            crop_n, mid_n, long_n, total_n = (length[k] for k in ("crop_n", "mid_n", "long_n", "total_n"))
+            crop_pct, mid_pct, long_pct = (length[k] for k in ("crop_pct", "mid_pct", "long_pct"))
+
+            # 상위 랭킹에서 허용구간이 더 좁아지는지(극단값 감소) 간단 체크
+            top = length_shares(cube, crop_thr, (mid_low, mid_high), top_k)
+            top_crop_pct, top_mid_pct, top_long_pct = (top[k] for k in ("crop_pct", "mid_pct", "long_pct"))
+
+            st.markdown("##### ② 20–24세에서 관찰되는 ‘중간 기장 공백’과 ‘크롭 쏠림’(수치 확인)")
+            st.markdown(
+                f"""
+                **[전체 사이즈 행 기준 비중]**  
+                - 크롭(<{crop_thr}cm): **{crop_pct:.1f}%** ({crop_n}/{total_n})  
+                - 중간({mid_low}–{mid_high}cm): **{mid_pct:.1f}%** ({mid_n}/{total_n})  
+                - 롱(>{mid_high}cm): **{long_pct:.1f}%** ({long_n}/{total_n})
+
+                **[상위 랭킹 Top {top_k} 기준 비중]**  
+                - 크롭(<{crop_thr}cm): **{top_crop_pct:.1f}%**  
+                - 중간({mid_low}–{mid_high}cm): **{top_mid_pct:.1f}%**  
+                - 롱(>{mid_high}cm): **{top_long_pct:.1f}%**
+
+                ➡️ 20대 초반에서는 특히 **크롭 쪽 선호가 더 강한 경향성**이 있습니다.  
+                    상위 랭킹 구간에서 특정 범위로 수렴한다면, 이는 **상위권 상품의 기장 ‘표준화’** 가능성을 시사합니다.
+                """
+            )
+        if m=="어깨너비":
+            st.markdown(
+            """
+            ##### ① 분포 특징  
+            ➡️ 어깨너비는 약 **42–46cm 구간에 강한 중심 밀집**을 가지며, 상단(48cm 이상)으로만 확장되는 **비대칭 분포**를 보입니다.  
+
+            ##### ② 랭킹과의 관계
+            ➡️ 상위 랭킹 상품일수록 어깨너비가 **중앙값 근처로 수렴**하며, 과도하게 넓은 어깨는 하위 랭킹에서 더 자주 나타납니다.  
+           """)
+
+        if m=="가슴단면":
+            st.markdown(
+            """
+            ##### ① 분포 특징  
+            가슴단면은 약 **50–56cm 구간에 가장 강한 중심 밀집**을 보이며,  
+            45cm대부터 60cm 이상까지 비교적 **넓은 분산**을 가집니다.  
+
+            ➡️ 가슴단면이 단일 표준값으로 수렴하기보다는,실루엣 전략에 따라 **여유 폭이 조절되는 핵심 치수**임을 의미합니다.
+
+            ##### ② 랭킹과의 관계  
+            상위 랭킹 상품일수록 45cm 이하의 과도하게 타이트한 값이나  
+            62cm 이상의 과도한 박시 핏은 드물게 나타납니다.  
+            대신 **중간 이상의 안정적인 여유 폭**으로 수렴하는 경향이 확인됩니다.  
+
+            ➡️ 20–24세 연령층에서 ‘편안하지만 과하지 않은 핏’이 선호됨을 시사합니다.
+            """
+            )
+
+        if m == "소매길이":
+            st.markdown(
+                """
+                ##### ① 분포 특징  
+                소매길이는 약 **59–62cm 구간에 매우 강한 중심 밀집**을 보입니다.  
+                총장이나 가슴단면에 비해 분산 폭이 작으며, 극단적으로 짧거나 긴 값은 상대적으로 드뭅니다.  
+
+                ➡️ 소매길이가 트렌드 실험의 대상이기보다는, **착용 안정성을 유지해야 하는 보수적 치수**임을 시사합니다.
+                """
+            )
+
+            sleeve = sleeve_shares(cube, (std_low, std_high))
+            std_n, out_n, total_n = sleeve["std_n"], sleeve["out_n"], sleeve["total_n"]
+            std_pct, out_pct = sleeve["std_pct"], sleeve["out_pct"]
+
+            top = sleeve_shares(cube, (std_low, std_high), top_k)
+            top_std_pct, top_out_pct = top["std_pct"], top["out_pct"]
+
+            st.markdown("##### ② 소매길이의 ‘표준 수렴’ 경향 (수치 확인)")
+            st.markdown(
+                f"""
+                **[전체 사이즈 행 기준]**  
+                - 표준 구간({std_low}–{std_high}cm): **{std_pct:.1f}%** ({std_n}/{total_n})  
+                - 비표준 구간: **{out_pct:.1f}%** ({out_n}/{total_n})
+
+                **[상위 랭킹 Top {top_k} 기준]**  
+                - 표준 구간({std_low}–{std_high}cm): **{top_std_pct:.1f}%**  
+                - 비표준 구간: **{top_out_pct:.1f}%**
+
+                ➡️ 상위 랭킹 상품일수록 소매길이가 **60–62cm 표준 범위로 더 강하게 수렴**하며,  
+                짧거나 긴 소매는 **랭킹 상승에 직접적인 이점으로 작용하지 않는 치수**임을 수치적으로 확인할 수 있습니다.
+                """
+            )
+        st.divider()
+
+    # 4) 랭킹–실측 통계 검정 (위 해석을 Top k 비중 비교가 아니라 검정으로 확인)
+    st.subheader("4) 랭킹과 실측의 관계 통계 검정")
+    stats_mode = st.toggle("통계 검정 실행 (순위 상관 · 부트스트랩 신뢰구간 · 순열 검정)", value=False)
+    if stats_mode:
+        st.caption(
+            f"Top {top_k} 상품 vs 나머지 상품. 재표본 단위는 상품이며, 구간 비중은 사이드바 구간 기준(사이즈 행 단위)을 따릅니다. "
+            "중앙값 편차 = 상품 평균 실측이 전체 중앙값에서 떨어진 거리(작을수록 중앙값 근처로 수렴)."
+        )
+        n_resamples = st.select_slider("재표본 수", [1_000, 5_000, 10_000], value=10_000, key="stats_resamples")
+        from rank_stats import snapshot_rank_stats  # 검정을 켰을 때만 import (scipy.stats)
+
+        try:
+            with section("4) 통계 검정"):
+                result = snapshot_rank_stats(
+                    info.path, top_k, crop_thr, (mid_low, mid_high), (std_low, std_high), n_resamples
+                )
+        except ValueError as e:
+            st.warning(f"검정할 수 없습니다: {e}")
+        else:
+            st.markdown("##### ① Spearman 순위 상관 (상품 단위)")
+            st.caption("ρ(rank, 중앙값 편차) > 0: 순위가 낮을수록 중앙값에서 멀어짐 = 상위 랭킹이 중앙값 근처로 수렴")
+            st.dataframe(result.correlation.round(4), use_container_width=True, hide_index=True)
+
+            st.markdown(f"##### ② Top {top_k} vs 나머지 (부트스트랩 95% 신뢰구간 · 순열 검정 p값)")
+            tests = result.tests.round({c: 2 for c in result.tests.columns if c != "순열 p값"} | {"순열 p값": 4})
+            st.dataframe(tests, use_container_width=True, hide_index=True)
+            significant = result.tests[result.tests["순열 p값"] < 0.05]
+            if significant.empty:
+                st.info("순열 검정 p < 0.05 인 차이가 없습니다. 위 해석은 이 스냅샷에서 통계적으로 뒷받침되지 않습니다.")
+            else:
+                st.markdown(
+                    "➡️ p < 0.05 인 차이: "
+                    + ", ".join(f"**{r['측정 항목']} {r['통계량']}** ({r['차이']:+.2f})" for _, r in significant.iterrows())
+                )
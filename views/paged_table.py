@@ -0,0 +1,64 @@
+import math
+
+import numpy as np
+import streamlit as st
+
+PAGE_SIZES = [25, 50, 100, 200]
+
+
+# =========================
+# 서버 측 페이지네이션 표 (table_index.TableIndex 기반)
+# =========================
+def _range_filter(container, index, column: str, key: str, on_change):
+    """범위 슬라이더. 전체 범위를 그대로 두면 필터를 적용하지 않는다(결측 행 유지)."""
+    lo, hi = index.value_range(column)
+    if np.isnan(lo) or lo == hi:
+        return None
+
+    values = index.df[column].dropna()
+    if np.all(np.mod(values, 1) == 0):
+        lo, hi = int(lo), int(hi)
+    selected = container.slider(column, lo, hi, (lo, hi), key=key, on_change=on_change)
+    return None if tuple(selected) == (lo, hi) else selected
+
+
+def paged_table(index, key: str, columns=None, range_columns=(), category_columns=(), sort_by: str = None):
+    """필터·정렬은 서버에서 미리 만든 인덱스로 처리하고, 현재 페이지 행만 st.dataframe으로 보낸다."""
+    page_key = f"{key}_page"
+
+    def reset_page():
+        st.session_state[page_key] = 1
+
+    ranges, categories = {}, {}
+    filter_cols = st.columns(max(len(category_columns) + len(range_columns), 1))
+    for col, column in zip(filter_cols, category_columns):
+        categories[column] = col.multiselect(
+            column, index.categories(column), key=f"{key}_{column}", on_change=reset_page, placeholder="전체"
+        )
+    for col, column in zip(filter_cols[len(category_columns):], range_columns):
+        selected = _range_filter(col, index, column, f"{key}_{column}", reset_page)
+        if selected is not None:
+            ranges[column] = selected
+
+    sortable = list(index.orders)
+    c1, c2, c3, c4 = st.columns([2, 1, 1, 1])
+    sort_by = c1.selectbox(
+        "정렬 기준", sortable, index=sortable.index(sort_by) if sort_by in sortable else 0,
+        key=f"{key}_sort", on_change=reset_page,
+    )
+    ascending = c2.toggle("오름차순", value=True, key=f"{key}_asc", on_change=reset_page)
+    page_size = c3.selectbox("페이지 크기", PAGE_SIZES, index=1, key=f"{key}_size", on_change=reset_page)
+
+    positions = index.query(ranges, categories, sort_by, ascending)
+    n_pages = max(math.ceil(len(positions) / page_size), 1)
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    page = c4.number_input(f"페이지 (/{n_pages})", min_value=1, max_value=n_pages, step=1, key=page_key)
+
+    rows = index.page(positions, page, page_size, columns)
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    start = (page - 1) * page_size
+    shown = f"{start + 1:,}–{start + len(rows):,}" if len(rows) else "0"
+    st.caption(f"필터 결과 {len(positions):,}건 중 {shown} 표시 (전체 {len(index):,}건)")
+    return positions
@@ -0,0 +1,50 @@
+import json
+
+import pandas as pd
+import streamlit as st
+
+LOG_KEY = "profile_log"
+MAX_LOG_RUNS = 50
+
+
+# =========================
+# 사이드바 프로파일링 패널 (프로파일링을 켰을 때만 import)
+# =========================
+def render_panel(profiler):
+    """이번 rerun의 구간별 시간·메모리 증감 / 캐시 hit·miss + 최근 rerun JSON 로그 내려받기"""
+    record = profiler.to_dict()
+    log = st.session_state.setdefault(LOG_KEY, [])
+    log.append(record)
+    del log[:-MAX_LOG_RUNS]
+
+    with st.sidebar.expander("⏱ 프로파일링", expanded=True):
+        c1, c2 = st.columns(2)
+        c1.metric("rerun", f"{record['total_ms']:,.0f} ms")
+        peak = record["peak_mb"]
+        c2.metric(
+            "rerun 최대 메모리", "-" if peak is None else f"{peak:,.1f} MB",
+            None if record["peak_increase_mb"] is None else f"시작 대비 +{record['peak_increase_mb']:,.1f} MB",
+            delta_color="off",
+            help="이번 rerun 동안 traced 메모리 최대값. tracemalloc은 프로세스 전역이라 같은 시간에 실행 중인 "
+                 "다른 세션의 할당도 포함됩니다.",
+        )
+
+        sections = pd.DataFrame({
+            "구간": ["　" * s["depth"] + s["name"] for s in record["sections"]],
+            "ms": [s["ms"] for s in record["sections"]],
+            "메모리 증감(MB)": [s["mem_delta_mb"] for s in record["sections"]],
+        })
+        st.dataframe(sections.round(1), hide_index=True, use_container_width=True)
+        if peak is None:
+            st.caption("메모리는 DASHBOARD_PROFILE=1 로 시작한 프로세스에서만 잽니다.")
+
+        if record["cache"]:
+            cache = pd.DataFrame([{"캐시": k, **v} for k, v in record["cache"].items()])
+            st.dataframe(cache, hide_index=True, use_container_width=True)
+
+        st.download_button(
+            f"JSON 로그 내려받기 (최근 {len(log)}회)",
+            json.dumps(log, ensure_ascii=False, indent=2),
+            file_name="profile_log.json",
+            mime="application/json",
+        )
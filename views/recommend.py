@@ -0,0 +1,90 @@
+import streamlit as st
+
+from fit_engine import FIT_RULES, body_references
+from musinsa_data import snapshot_exists
+from profiling import section
+from size_recommend import DEFAULT_PREFERRED, preferred_ease, snapshot_size_index
+from views.common import select_snapshot
+
+
+# =========================
+# Page: 내 치수로 사이즈 추천
+# =========================
+def render():
+    st.title("📐 내 치수로 사이즈 추천")
+    info = select_snapshot()
+    st.caption(f"분석 대상: {info.age_group} 여성 / 무신사 랭킹 Top {info.top_n}")
+
+    if not snapshot_exists(info.path):
+        st.error(f"데이터 파일이 없습니다:\n{info.path}")
+        st.stop()
+
+    st.info(
+        """
+        가슴둘레·어깨사이길이·팔길이를 입력하면 상품마다 **세 항목 ease가 모두 0 이상인 사이즈 중
+        가슴둘레 ease가 선호 핏의 목표값에 가장 가까운 사이즈**를 추천합니다.
+        목표값과의 차이가 작은 상품부터 보여주며, 기본값은 사이즈코리아 평균(3차원 자동측정 mean)입니다.
+        """
+    )
+
+    # 입력 (기본값 = 스냅샷 연령대의 사이즈코리아 평균)
+    defaults = body_references(info.age_group)
+    body_rules = [r for r in FIT_RULES if r.body is not None]
+    cols = st.columns(len(body_rules))
+    body = {
+        r.body: col.number_input(f"{r.body}(cm)", 20.0, 200.0, round(defaults[r.body], 1), step=0.5, key=f"body_{r.body}")
+        for col, r in zip(cols, body_rules)
+    }
+
+    targets = preferred_ease()
+    c1, c2 = st.columns([2, 1])
+    preferred = c1.radio(
+        "선호 핏 (가슴둘레 ease 목표값)",
+        list(targets),
+        index=list(targets).index(DEFAULT_PREFERRED),
+        format_func=lambda label: f"{label} ({targets[label]:g}cm)",
+        horizontal=True,
+        key="preferred_fit",
+    )
+    limit = c2.number_input("표시 상품 수", 10, 500, 50, step=10, key="recommend_limit")
+
+    # 측정 정의 차이 보정 (⑤ 다항목 핏과 같은 FitRule.offset)
+    with st.expander("측정 정의 보정값 (의류 실측 + 보정값 − 인체 치수)"):
+        st.caption(
+            "의류 어깨너비는 어깨솔기 사이, 인체 어깨사이길이는 어깨점 사이 직선거리이고 "
+            "소매길이는 어깨솔기부터, 팔길이는 어깨점부터 잰 값이므로 정의 차이를 보정값으로 맞출 수 있습니다."
+        )
+        c1, c2 = st.columns(2)
+        offsets = {
+            "어깨너비": c1.number_input("어깨너비 보정값(cm)", -10.0, 10.0, 0.0, step=0.5, key="recommend_shoulder_offset"),
+            "소매길이": c2.number_input("소매길이 보정값(cm)", -10.0, 10.0, 0.0, step=0.5, key="recommend_sleeve_offset"),
+        }
+    show_unfit = st.toggle("맞는 사이즈가 없는 상품도 표시 (목록 맨 뒤)", value=False, key="recommend_show_unfit")
+
+    with section("사이즈 추천"):
+        index = snapshot_size_index(info.path, {k: v for k, v in offsets.items() if v})
+        result = index.recommend(body, preferred, include_unfit=True)
+
+    fitted = result["추천 사이즈"].notna()
+    st.caption(
+        f"맞는 사이즈가 있는 상품 {int(fitted.sum())}개 / 맞는 사이즈가 없는 상품 {int((~fitted).sum())}개 "
+        f"/ 전체 {len(index.products)}개"
+    )
+    if not fitted.any():
+        st.warning("입력한 치수로 ease가 모두 0 이상인 사이즈가 있는 상품이 없습니다.")
+        if not show_unfit:
+            return
+    if not show_unfit:
+        result = result[fitted]
+
+    columns = [
+        "rank", "brand", "title", "추천 사이즈", "목표 차이(cm)",
+        *[f"{r.garment}_ease(cm)" for r in body_rules], *[f"{r.garment}_핏" for r in body_rules],
+        "original_price", "url",
+    ]
+    st.dataframe(
+        result.head(int(limit))[[c for c in columns if c in result.columns]].round(2),
+        use_container_width=True,
+        hide_index=True,
+        column_config={"url": st.column_config.LinkColumn("url")},
+    )
@@ -0,0 +1,56 @@
+import pandas as pd
+import streamlit as st
+
+from size_korea import load_size_korea
+
+
+# =========================
+# Page: 사이즈 코리아 데이터
+# =========================
+def render():
+    st.title("📏 사이즈 코리아 데이터")
+
+    size_korea = load_size_korea()
+    sk_age_groups = size_korea.age_groups()
+    sk_age_group = st.selectbox("연령대", sk_age_groups) if len(sk_age_groups) > 1 else sk_age_groups[0]
+
+    st.subheader(f"사이즈코리아 인체치수 요약 통계 ({sk_age_group} 여성, 단위: cm)")
+    st.caption("※ 원자료는 mm이며, 본 표에서는 cm로 변환(÷10)하여 제시합니다.")
+
+    st.info(
+        """사이즈코리아 인체치수 데이터에서 제시되는 통계 지표들은 특정 연령·성별 집단의 체형 분포를 요약하기 위한 값들이다. 
+        먼저 N은 해당 항목의 측정에 실제로 포함된 표본 수를 의미하며, 데이터의 신뢰도와 대표성을 판단하는 기준이 된다. 
+        표본 수가 충분히 클수록 해당 통계값은 집단의 일반적인 특성을 안정적으로 반영한다고 볼 수 있다. 
+        1th, 5th, 10th 등은 하위 백분위 수를 의미한다.""")
+
+    # =========================
+    # 항목별 요약 통계표 (data/size_korea.csv에 있는 항목 순서대로)
+    # =========================
+    summary_rows = []
+    for i, m in enumerate(size_korea.measurements(age_group=sk_age_group), start=1):
+        df_m = size_korea.stats_frame(m, age_group=sk_age_group)
+
+        st.markdown(f"### {i}) {m} ({size_korea.label_en(m)})")
+        st.dataframe(df_m, hide_index=True, use_container_width=True)
+        st.divider()
+
+        direct = df_m[df_m["측정방식"] == "직접측정"]
+        scan = df_m[df_m["측정방식"] == "3차원 자동측정"]
+        if len(direct) and len(scan):
+            summary_rows.append({
+                "항목": m,
+                "직접 Mean": direct["Mean(cm)"].iloc[0],
+                "3D Mean": scan["Mean(cm)"].iloc[0],
+                "차이(3D-직접)": round(scan["Mean(cm)"].iloc[0] - direct["Mean(cm)"].iloc[0], 1),
+                "직접 SD": direct["SD(cm)"].iloc[0],
+                "3D SD": scan["SD(cm)"].iloc[0],
+            })
+
+    # =========================
+    # (선택) 항목별로 한 번에 비교 요약표 (Mean/SD 중심)
+    # =========================
+    st.subheader("요약 비교 (Mean/SD 중심, 단위: cm)")
+
+    summary = pd.DataFrame(summary_rows)
+
+    st.dataframe(summary, hide_index=True, use_container_width=True)
@@ -0,0 +1,140 @@
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from ingest import INGEST_DIR, load_derived, load_rank_history, load_trend, rank_dates
+from musinsa_data import MEASURES
+from pipeline import CROP_THR, MID_BAND, SLEEVE_STD_BAND
+from profiling import section
+from rank_trends import TREND_TOP_KS, rank_trajectories
+
+
+def ingest_series():
+    """trend.arrow가 있는 ingest 시계열 이름 목록"""
+    if not INGEST_DIR.exists():
+        return []
+    return sorted(p.name for p in INGEST_DIR.iterdir() if (p / "trend.arrow").exists())
+
+
+# =========================
+# Page: 랭킹 순위 추이
+# =========================
+def render():
+    st.title("📈 랭킹 순위 추이")
+
+    series = ingest_series()
+    if not series:
+        st.info(
+            f"""
+            아직 수집 시계열이 없습니다 ({INGEST_DIR}).
+            `python ingest.py <스냅샷.pkl> --date YYYY-MM-DD` 로 수집일마다 크롤 결과를 반영하면
+            그날의 Top-k 집계가 추이에 한 줄씩 추가됩니다.
+            """
+        )
+        return
+
+    c1, c2 = st.columns([2, 3])
+    name = c1.selectbox("시계열", series, key="trend_series")
+    top_k = c2.radio("순위 범위", list(TREND_TOP_KS), index=1, format_func=lambda k: f"Top {k}",
+                     horizontal=True, key="trend_top_k")
+    store = INGEST_DIR / name
+
+    with section("추이 로드"):
+        trend = load_trend(store)
+    df = trend[trend["top_k"] == top_k].copy()
+    df["수집일"] = pd.to_datetime(df["crawl_date"], format="%Y%m%d")
+    if df.empty:
+        st.warning("선택한 범위의 집계가 없습니다.")
+        return
+
+    st.caption(
+        f"수집일 {len(df)}일 ({df['수집일'].min():%Y-%m-%d} ~ {df['수집일'].max():%Y-%m-%d}) / "
+        "집계 단위: 상품(사이즈 행 평균 실측), 집계는 ingest 때 수집일마다 한 번 계산해 저장한 값입니다."
+    )
+
+    # -----------------------------
+    # KPI (최근 수집일, 직전 수집일 대비)
+    # -----------------------------
+    last = df.iloc[-1]
+    prev = df.iloc[-2] if len(df) > 1 else None
+
+    def delta(column):
+        return f"{last[column] - prev[column]:+.1f}%p" if prev is not None else None
+
+    c1, c2, c3, c4 = st.columns(4)
+    c1.metric(f"크롭 비중 (총장<{CROP_THR})", f"{last['crop_pct']:.1f}%", delta(column="crop_pct"))
+    c2.metric(f"소매 표준 구간 {SLEEVE_STD_BAND[0]}–{SLEEVE_STD_BAND[1]}", f"{last['sleeve_std_pct']:.1f}%",
+              delta(column="sleeve_std_pct"))
+    c3.metric("신규 진입", "-" if pd.isna(last["entered"]) else f"{int(last['entered'])}개",
+              None if pd.isna(last["churn_pct"]) else f"교체율 {last['churn_pct']:.1f}%", delta_color="off")
+    c4.metric("평균 순위 변동", "-" if pd.isna(last["rank_change"]) else f"{last['rank_change']:.1f}위")
+
+    st.divider()
+
+    # 1) 총장 구간 / 소매 표준 구간 비중 추이
+    st.subheader(f"1) Top {top_k} 총장·소매 구간 비중 추이")
+    shares = df.melt(
+        id_vars="수집일",
+        value_vars=["crop_pct", "mid_pct", "long_pct", "sleeve_std_pct"],
+        var_name="구간",
+        value_name="pct(%)",
+    )
+    shares["구간"] = shares["구간"].map({
+        "crop_pct": f"크롭(<{CROP_THR})",
+        "mid_pct": f"중간({MID_BAND[0]}–{MID_BAND[1]})",
+        "long_pct": f"롱(>{MID_BAND[1]})",
+        "sleeve_std_pct": f"소매 표준({SLEEVE_STD_BAND[0]}–{SLEEVE_STD_BAND[1]})",
+    })
+    fig = px.line(shares, x="수집일", y="pct(%)", color="구간", markers=True)
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 2) 진입 / 이탈
+    st.subheader(f"2) Top {top_k} 진입·이탈 상품 수")
+    churn = df.dropna(subset=["entered"]).melt(
+        id_vars="수집일", value_vars=["entered", "exited"], var_name="구분", value_name="상품 수"
+    )
+    if churn.empty:
+        st.info("직전 수집일이 있어야 진입·이탈을 계산할 수 있습니다.")
+    else:
+        churn["구분"] = churn["구분"].map({"entered": "진입", "exited": "이탈"})
+        fig = px.bar(churn, x="수집일", y="상품 수", color="구분", barmode="group")
+        st.plotly_chart(fig, use_container_width=True)
+
+    # 3) 측정 항목 평균 추이
+    st.subheader(f"3) Top {top_k} 측정 항목 평균 추이")
+    weighted = st.toggle("순위 가중 평균 (rank_intensity: 1위일수록 크게 반영)", value=True, key="trend_weighted")
+    suffix = "wmean" if weighted else "mean"
+    means = df.melt(
+        id_vars="수집일", value_vars=[f"{m}_{suffix}" for m in MEASURES], var_name="측정 항목", value_name="cm"
+    )
+    means["측정 항목"] = means["측정 항목"].str.rsplit("_", n=1).str[0]
+    fig = px.line(means, x="수집일", y="cm", facet_row="측정 항목", markers=True, height=160 * len(MEASURES))
+    fig.update_yaxes(matches=None)
+    fig.for_each_annotation(lambda a: a.update(text=a.text.split("=")[-1]))
+    st.plotly_chart(fig, use_container_width=True)
+
+    # 4) 상품별 순위 궤적 (선택한 기간의 순위 파일만 읽음)
+    st.subheader("4) 상품별 순위 궤적")
+    dates = rank_dates(store)
+    c1, c2 = st.columns([1, 3])
+    days = c1.number_input("최근 수집일 수", 2, max(len(dates), 2), min(max(len(dates), 2), 30), key="trend_days")
+    with section("순위 궤적"):
+        history = load_rank_history(store, since=dates[-int(days):][0] if dates else None)
+        latest = history[history["crawl_date"] == history["crawl_date"].max()].sort_values("rank")
+        brands = load_derived(store).set_index("item_id")["brand"]
+        labels = {f"{r}위 {brands.get(i, '')} ({i})": i for i, r in latest[["item_id", "rank"]].itertuples(index=False)}
+        picked = c2.multiselect("상품 (최근 수집일 순위)", list(labels), default=list(labels)[:5], key="trend_items")
+        paths = rank_trajectories(history, [labels[p] for p in picked])
+
+    if paths.empty or not picked:
+        st.info("상품을 하나 이상 선택하세요.")
+    else:
+        paths.index = pd.to_datetime(paths.index, format="%Y%m%d")
+        long = paths.rename_axis("수집일").reset_index().melt(id_vars="수집일", var_name="item_id", value_name="rank")
+        fig = px.line(long, x="수집일", y="rank", color="item_id", markers=True)
+        fig.update_yaxes(autorange="reversed", title="rank (위로 갈수록 상위)")
+        st.plotly_chart(fig, use_container_width=True)
+
+    # 5) 집계 표
+    st.subheader("5) 수집일별 집계 표")
+    st.dataframe(df.drop(columns=["수집일"]).round(2), use_container_width=True, hide_index=True)